@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Compare the Python and Node Excel seed parsers on generated workbooks.
+
+Workbooks are written with the stdlib zipfile in the data-entry layout the
+seed expects (brand/model/variant header rows, a field block, helper rows
+below it). Each case varies field rows, product columns, the share of cells
+stored as shared strings and the share stored as inline strings.
+
+Every parser runs in its own process so wall time and peak RSS (from
+os.wait4) cover the whole extraction, including interpreter start-up. The
+Node parser is extractExcelPayloadWithNode from src/ingest/excelSeed.js.
+
+With --baseline, per-case timings are compared against a stored run and
+anything slower than --tolerance is listed as a regression (exit code 1);
+--write-baseline stores the current run instead. A requested parser that is
+unavailable or fails (for example Node without fast-xml-parser installed)
+exits with code 2 and writes no baseline, and a baseline is only written
+when both parsers produced identical payloads for every case.
+--allow-partial-baseline writes one anyway, marked "partial" with the
+parsers that could not run; re-record it once they can.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from extract_excel_seed import index_to_col
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NODE_MODULE = os.path.join(REPO_ROOT, "src", "ingest", "excelSeed.js")
+NODE_RUNNER = """
+import { pathToFileURL } from 'node:url';
+const [modulePath, optionsJson] = process.argv.slice(1);
+const { extractExcelPayloadWithNode } = await import(pathToFileURL(modulePath).href);
+process.stdout.write(JSON.stringify(extractExcelPayloadWithNode(JSON.parse(optionsJson))));
+"""
+FIELD_ROW_START = 9
+HELPER_COLUMNS = 30
+PARSERS = ("python", "node")
+
+
+def cell_xml(ref: str, value: str, kind: str, shared: Dict[str, int]) -> str:
+    if kind == "shared":
+        index = shared.setdefault(value, len(shared))
+        return f'<c r="{ref}" t="s"><v>{index}</v></c>'
+    if kind == "inline":
+        return f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+    if kind == "number":
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    return f'<c r="{ref}" t="str"><v>{escape(value)}</v></c>'
+
+
+def write_workbook(
+    path: str, fields: int, products: int, helper_rows: int, shared_ratio: float, inline_ratio: float, seed: int = 7
+) -> None:
+    """Data-entry workbook: labels in B, one product per column from C, helper rows under the field block."""
+    rng = random.Random(seed)
+    shared: Dict[str, int] = {}
+
+    def kind_for(value: str) -> str:
+        roll = rng.random()
+        if roll < shared_ratio:
+            return "shared"
+        if roll < shared_ratio + inline_ratio:
+            return "inline"
+        return "number" if value.isdigit() else "formula_string"
+
+    rows: List[str] = []
+
+    def add_row(row: int, cells: List[Tuple[int, str]]) -> None:
+        parts = [cell_xml(f"{index_to_col(col)}{row}", value, kind_for(value), shared) for col, value in cells if value]
+        rows.append(f'<row r="{row}">{"".join(parts)}</row>')
+
+    add_row(3, [(3 + p, f"Brand {p % 23}") for p in range(products)])
+    add_row(4, [(3 + p, f"Model {p}") for p in range(products)])
+    add_row(5, [(3 + p, f"Variant {p % 4}" if p % 3 == 0 else "") for p in range(products)])
+    for offset in range(fields):
+        row = FIELD_ROW_START + offset
+        cells = [(2, f"Field {offset + 1}")]
+        for p in range(products):
+            if (p + offset) % 6 == 0:
+                continue
+            value = str(p * 13 + offset) if offset % 3 == 0 else f"value {offset % 17} {p % 29}"
+            cells.append((3 + p, value))
+        add_row(row, cells)
+    helper_start = FIELD_ROW_START + fields + 5
+    for h in range(helper_rows):
+        add_row(helper_start + h, [(col, f"helper {h % 400} {col}") for col in range(1, HELPER_COLUMNS + 1)])
+
+    main_ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    ordered = sorted(shared, key=shared.get)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(
+            "xl/workbook.xml",
+            f'<?xml version="1.0" encoding="UTF-8"?><workbook xmlns="{main_ns}" xmlns:r="{rel_ns}">'
+            '<sheets><sheet name="dataEntry" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rel_ns}/worksheet" Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        zf.writestr(
+            "xl/worksheets/sheet1.xml",
+            f'<?xml version="1.0" encoding="UTF-8"?><worksheet xmlns="{main_ns}"><sheetData>{"".join(rows)}</sheetData></worksheet>',
+        )
+        zf.writestr(
+            "xl/sharedStrings.xml",
+            f'<?xml version="1.0" encoding="UTF-8"?><sst xmlns="{main_ns}" count="{len(ordered)}" uniqueCount="{len(ordered)}">'
+            + "".join(f"<si><t>{escape(text)}</t></si>" for text in ordered)
+            + "</sst>",
+        )
+
+
+def layout_options(workbook_path: str, fields: int) -> Dict[str, Any]:
+    return {
+        "workbookPath": workbook_path,
+        "sheet": "dataEntry",
+        "fieldLabelColumn": "B",
+        "fieldRowStart": FIELD_ROW_START,
+        "fieldRowEnd": FIELD_ROW_START + fields - 1,
+        "brandRow": 3,
+        "modelRow": 4,
+        "variantRow": 5,
+        "dataColumnStart": "C",
+        "dataColumnEnd": "",
+    }
+
+
+def parser_command(parser: str, options: Dict[str, Any], node_command: str) -> List[str]:
+    if parser == "node":
+        return [node_command, "--input-type=module", "-e", NODE_RUNNER, NODE_MODULE, json.dumps(options)]
+    return [
+        sys.executable,
+        os.path.join(REPO_ROOT, "scripts", "extract_excel_seed.py"),
+        "--workbook",
+        options["workbookPath"],
+        "--sheet",
+        options["sheet"],
+        "--field-label-column",
+        options["fieldLabelColumn"],
+        "--field-row-start",
+        str(options["fieldRowStart"]),
+        "--field-row-end",
+        str(options["fieldRowEnd"]),
+        "--brand-row",
+        str(options["brandRow"]),
+        "--model-row",
+        str(options["modelRow"]),
+        "--variant-row",
+        str(options["variantRow"]),
+        "--data-column-start",
+        options["dataColumnStart"],
+    ]
+
+
+def run_once(command: List[str]) -> Tuple[float, int, int, str, str]:
+    """Wall ms, peak RSS in KiB, exit status, stdout and stderr of one child process."""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        started = time.perf_counter()
+        proc = subprocess.Popen(command, stdout=out, stderr=err, cwd=REPO_ROOT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        out.seek(0)
+        err.seek(0)
+        return elapsed_ms, int(usage.ru_maxrss), proc.returncode, out.read().decode("utf-8"), err.read().decode("utf-8")
+
+
+def run_parser(parser: str, options: Dict[str, Any], repeat: int, node_command: str) -> Dict[str, Any]:
+    command = parser_command(parser, options, node_command)
+    timings: List[float] = []
+    peak_kb = 0
+    payload: Optional[Dict[str, Any]] = None
+    for _ in range(repeat):
+        try:
+            elapsed_ms, rss_kb, status, stdout, stderr = run_once(command)
+        except OSError as exc:
+            return {"ok": False, "error": str(exc)}
+        if status != 0:
+            lines = [line for line in (stderr or stdout).strip().splitlines() if line.strip()]
+            # Node prints its version after the stack; the Error line is the useful one.
+            error = next((line for line in lines if "Error" in line), lines[-1] if lines else f"exit_status_{status}")
+            return {"ok": False, "error": error.strip().replace(REPO_ROOT + os.sep, "")}
+        timings.append(elapsed_ms)
+        peak_kb = max(peak_kb, rss_kb)
+        payload = json.loads(stdout)
+    return {
+        "ok": True,
+        "best_ms": round(min(timings), 2),
+        "peak_rss_kb": peak_kb,
+        "products": len((payload or {}).get("products") or []),
+        "payload": {"field_rows": (payload or {}).get("field_rows"), "products": (payload or {}).get("products")},
+    }
+
+
+def first_difference(left: Dict[str, Any], right: Dict[str, Any]) -> str:
+    if left["field_rows"] != right["field_rows"]:
+        return "field_rows"
+    left_products = left["products"] or []
+    right_products = right["products"] or []
+    for a, b in zip(left_products, right_products):
+        if a != b:
+            return f"column {a.get('column')}"
+    return f"product count {len(left_products)} != {len(right_products)}"
+
+
+def case_id(case: Dict[str, Any]) -> str:
+    return "f{fields}_p{products}_h{helper_rows}_s{shared_ratio}_i{inline_ratio}".format(**case)
+
+
+def compare_baseline(rows: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    stored = {row["case"]: row for row in baseline.get("cases") or []}
+    regressions = []
+    for row in rows:
+        previous = stored.get(row["case"])
+        if not previous:
+            continue
+        for parser in PARSERS:
+            now = row["parsers"].get(parser) or {}
+            before = (previous.get("parsers") or {}).get(parser) or {}
+            if not now.get("ok") or not before.get("best_ms"):
+                continue
+            ratio = now["best_ms"] / before["best_ms"]
+            if ratio > 1.0 + tolerance:
+                regressions.append(
+                    {"case": row["case"], "parser": parser, "best_ms": now["best_ms"], "baseline_ms": before["best_ms"], "ratio": round(ratio, 2)}
+                )
+    return regressions
+
+
+def float_list(value: str) -> List[float]:
+    return [float(token) for token in str(value).split(",") if token.strip()]
+
+
+def int_list(value: str) -> List[int]:
+    return [int(token) for token in str(value).split(",") if token.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Python and Node Excel seed parsers on generated XLSX files.")
+    parser.add_argument("--fields", default="75", help="comma list of field rows")
+    parser.add_argument("--products", default="50,500,2000", help="comma list of product columns")
+    parser.add_argument("--helper-rows", default="2000", help="comma list of helper rows below the field block")
+    parser.add_argument("--shared-ratios", default="0.9,0.3", help="comma list of shared-string cell shares")
+    parser.add_argument("--inline-ratios", default="0.0,0.3", help="comma list of inline-string cell shares")
+    parser.add_argument("--parsers", default=",".join(PARSERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--node", default="node")
+    parser.add_argument("--baseline", default="", help="stored run to compare against (e.g. fixtures/benchmarks/excel_seed_parsers.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a case counts as a regression")
+    parser.add_argument("--write-baseline", default="", help="store this run's timings at this path")
+    parser.add_argument(
+        "--allow-partial-baseline",
+        action="store_true",
+        help="write the baseline even if a parser is unavailable, marked partial",
+    )
+    parser.add_argument("--keep-dir", default="", help="write the generated workbooks here instead of a temp dir")
+    args = parser.parse_args()
+
+    requested = [token.strip() for token in str(args.parsers).split(",") if token.strip() in PARSERS]
+    cases = [
+        {"fields": fields, "products": products, "helper_rows": helper_rows, "shared_ratio": shared, "inline_ratio": inline}
+        for fields, products, helper_rows, shared, inline in itertools.product(
+            int_list(args.fields),
+            int_list(args.products),
+            int_list(args.helper_rows),
+            float_list(args.shared_ratios),
+            float_list(args.inline_ratios),
+        )
+        if shared + inline <= 1.0
+    ]
+
+    work_dir = args.keep_dir or tempfile.mkdtemp(prefix="excel_seed_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+    rows: List[Dict[str, Any]] = []
+    try:
+        for case in cases:
+            workbook_path = os.path.join(work_dir, f"{case_id(case)}.xlsx")
+            write_workbook(
+                workbook_path, case["fields"], case["products"], case["helper_rows"], case["shared_ratio"], case["inline_ratio"]
+            )
+            options = layout_options(workbook_path, case["fields"])
+            results = {name: run_parser(name, options, max(1, args.repeat), args.node) for name in requested}
+            row: Dict[str, Any] = {
+                "case": case_id(case),
+                **case,
+                "workbook_bytes": os.path.getsize(workbook_path),
+                "parsers": {name: {key: value for key, value in result.items() if key != "payload"} for name, result in results.items()},
+            }
+            python_result = results.get("python") or {}
+            node_result = results.get("node") or {}
+            if python_result.get("ok") and node_result.get("ok"):
+                row["outputs_match"] = python_result["payload"] == node_result["payload"]
+                if not row["outputs_match"]:
+                    row["first_difference"] = first_difference(python_result["payload"], node_result["payload"])
+                row["node_vs_python_ms"] = round(node_result["best_ms"] / python_result["best_ms"], 2) if python_result["best_ms"] else 0.0
+            rows.append(row)
+    finally:
+        if not args.keep_dir:
+            for name in os.listdir(work_dir):
+                os.remove(os.path.join(work_dir, name))
+            os.rmdir(work_dir)
+
+    report: Dict[str, Any] = {"repeat": max(1, args.repeat), "cases": rows}
+    regressions: List[Dict[str, Any]] = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            regressions = compare_baseline(rows, json.load(fh), max(0.0, args.tolerance))
+        report["baseline"] = args.baseline
+        report["regressions"] = regressions
+    unavailable = sorted({name for row in rows for name, result in row["parsers"].items() if not result.get("ok")})
+    mismatched = [row["case"] for row in rows if row.get("outputs_match") is False]
+    report["unavailable_parsers"] = unavailable
+    report["mismatched_cases"] = mismatched
+    sys.stdout.write(json.dumps(report, indent=2))
+    sys.stdout.write("\n")
+    partial = bool(unavailable) or set(requested) != set(PARSERS)
+    if unavailable and not (args.write_baseline and args.allow_partial_baseline):
+        sys.stderr.write(f"parsers unavailable or failed: {', '.join(unavailable)}; no baseline written\n")
+        return 2
+    if args.write_baseline:
+        if mismatched or (partial and not args.allow_partial_baseline):
+            sys.stderr.write("a baseline needs every parser and matching outputs on every case; none written\n")
+            return 1
+        stored: Dict[str, Any] = {"repeat": report["repeat"], "cases": rows}
+        if partial:
+            missing = sorted(set(unavailable) | (set(PARSERS) - set(requested)))
+            stored = {"partial": True, "unavailable_parsers": missing, **stored}
+            sys.stderr.write(f"partial baseline written without: {', '.join(missing)}\n")
+        with open(args.write_baseline, "w", encoding="utf-8") as fh:
+            json.dump(stored, fh, indent=2)
+            fh.write("\n")
+    return 1 if regressions or mismatched else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
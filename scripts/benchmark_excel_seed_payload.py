@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare the columnar SheetGrid payload builder against the previous ref-keyed dict.
+
+Both paths start from the same synthetic sheet (brand/model/variant header rows
+plus a field block, one product per column) and build the same payload. The
+dict baseline is the ``{"B12": "..."}`` store build_payload used before the
+grid: every lookup formats a cell ref and every column scan re-parses refs.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from extract_excel_seed import SheetGrid, build_payload, col_to_index, index_to_col, split_cell_ref
+
+
+def dict_build_payload(cells: Dict[str, str], field_row_start: int, field_row_end: int) -> Dict[str, object]:
+    """The ref-keyed build_payload kept here as the baseline (label column B, data from C, brand 3, model 4, variant 5)."""
+    field_rows = []
+    for row_idx in range(field_row_start, field_row_end + 1):
+        label = str(cells.get(f"B{row_idx}", "")).strip()
+        if label:
+            field_rows.append({"row": row_idx, "label": label})
+    max_col_seen = col_to_index("C")
+    for ref in cells.keys():
+        try:
+            col, _ = split_cell_ref(ref)
+        except ValueError:
+            continue
+        max_col_seen = max(max_col_seen, col_to_index(col))
+    products = []
+    for col_idx in range(col_to_index("C"), max_col_seen + 1):
+        col = index_to_col(col_idx)
+        brand = str(cells.get(f"{col}3", "")).strip()
+        model = str(cells.get(f"{col}4", "")).strip()
+        if not brand and not model:
+            continue
+        values_by_label = {}
+        for row in field_rows:
+            values_by_label[str(row["label"])] = str(cells.get(f"{col}{row['row']}", "")).strip()
+        products.append(
+            {
+                "column": col,
+                "brand": brand,
+                "model": model,
+                "variant": str(cells.get(f"{col}5", "")).strip(),
+                "values_by_label": values_by_label,
+            }
+        )
+    return {"field_rows": field_rows, "products": products}
+
+
+def synthetic_cells(products: int, fields: int, fill: float) -> List[tuple]:
+    cells = []
+    field_row_start = 9
+    for offset in range(fields):
+        cells.append((field_row_start + offset, 2, f"Field {offset + 1}"))
+    for product in range(products):
+        col = 3 + product
+        cells.append((3, col, f"Brand {product % 17}"))
+        cells.append((4, col, f"Model {product}"))
+        if product % 5 == 0:
+            cells.append((5, col, f"Variant {product % 3}"))
+        for offset in range(fields):
+            if (product * 31 + offset * 7) % 100 < fill * 100:
+                cells.append((field_row_start + offset, col, f"{product}.{offset}"))
+    return cells
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return {"best_ms": round(best, 2), "result": result}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the columnar Excel seed payload builder.")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--fields", type=int, default=75)
+    parser.add_argument("--fill", type=float, default=0.8, help="fraction of field cells that carry a value")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fields = max(1, args.fields)
+    cells = synthetic_cells(max(1, args.products), fields, max(0.0, min(1.0, args.fill)))
+    field_row_end = 9 + fields - 1
+
+    def run_dict() -> Dict[str, object]:
+        store = {f"{index_to_col(col)}{row}": value for row, col, value in cells}
+        return dict_build_payload(store, 9, field_row_end)
+
+    def run_grid() -> Dict[str, object]:
+        grid = SheetGrid([3, 4, 5, *range(9, field_row_end + 1)])
+        for row, col, value in cells:
+            grid.set(row, col, value)
+        return build_payload(
+            grid=grid,
+            field_label_col="B",
+            field_row_start=9,
+            field_row_end=field_row_end,
+            brand_row=3,
+            model_row=4,
+            variant_row=5,
+            data_col_start="C",
+            data_col_end=None,
+        )
+
+    baseline = timed(run_dict, max(1, args.repeat))
+    columnar = timed(run_grid, max(1, args.repeat))
+    report = {
+        "products": args.products,
+        "fields": fields,
+        "cells": len(cells),
+        "dict_ms": baseline["best_ms"],
+        "grid_ms": columnar["best_ms"],
+        "speedup": round(baseline["best_ms"] / columnar["best_ms"], 2) if columnar["best_ms"] else 0.0,
+        "results_match": json.dumps(baseline["result"]) == json.dumps(columnar["result"]),
+    }
+    sys.stdout.write(json.dumps(report, indent=2))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
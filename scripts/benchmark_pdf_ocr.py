@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare tesseract engines on the same rendered pages of a PDF.
+
+Every engine sees identical 2x pixmaps. ``calls`` is the number of tesseract
+process spawns (pytesseract, tesseract_batch) or API calls on one loaded
+handle (tesserocr), which is the cost the batched engines remove.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+from extract_pdf_kv import (
+    OCR_ENGINES,
+    ExtractionWatchdog,
+    TesseractOcrSession,
+    detect_ocr_engines,
+    ocr_lines_from_data,
+    write_json,
+)
+
+
+def run_engine(engine: str, pdf_path: str, pages: int, zoom: float) -> Dict[str, Any]:
+    import fitz  # type: ignore
+
+    watchdog = ExtractionWatchdog()
+    started = time.perf_counter()
+    session = TesseractOcrSession(engine, watchdog=watchdog, stage="ocr")
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = min(pages, len(doc))
+        for idx in range(page_count):
+            session.add(idx + 1, doc[idx].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False), idx + 1)
+        results = session.results()
+    finally:
+        doc.close()
+        session.close()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    texts: List[str] = []
+    words = 0
+    for page_number in range(1, page_count + 1):
+        lines, confidences = ocr_lines_from_data(results.get(page_number) or {})
+        texts.append("\n".join(lines))
+        words += len(confidences)
+    meta = session.meta()
+    return {
+        "engine": engine,
+        "pages": page_count,
+        "calls": meta["ocr_engine_calls"],
+        "elapsed_ms": round(elapsed_ms, 2),
+        "ms_per_page": round(elapsed_ms / page_count, 2) if page_count else 0.0,
+        "ocr_ms": meta["ocr_engine_ms"],
+        "words": words,
+        "bytes_copied_per_page": meta["ocr_bytes_copied_per_page"],
+        "error": meta["ocr_engine_error"],
+        "texts": texts,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark spawn-per-page OCR against batched tesseract engines.")
+    parser.add_argument("--pdf", required=True)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--zoom", type=float, default=2.0)
+    parser.add_argument("--engines", default=",".join(OCR_ENGINES))
+    parser.add_argument("--out", default="")
+    args = parser.parse_args()
+
+    available = detect_ocr_engines()
+    requested = [token.strip() for token in str(args.engines).split(",") if token.strip()]
+    rows = [run_engine(engine, args.pdf, max(1, args.pages), args.zoom) for engine in requested if available.get(engine)]
+    baseline = next((row for row in rows if row["engine"] == "pytesseract"), None)
+    for row in rows:
+        if baseline and row is not baseline:
+            row["speedup_vs_pytesseract"] = round(baseline["elapsed_ms"] / row["elapsed_ms"], 2) if row["elapsed_ms"] else 0.0
+            row["text_matches_pytesseract"] = row["texts"] == baseline["texts"]
+    report = {
+        "pdf": args.pdf,
+        "available": available,
+        "skipped": [engine for engine in requested if not available.get(engine)],
+        "engines": rows,
+    }
+    if args.out:
+        write_json(args.out, report)
+    summary = {**report, "engines": [{key: value for key, value in row.items() if key != "texts"} for row in rows]}
+    sys.stdout.write(json.dumps(summary, indent=2))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
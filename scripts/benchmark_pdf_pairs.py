@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Compare the compact PairRecord path against the previous dict-per-pair path.
+
+Both paths parse the same synthetic spec pages, dedupe, split by surface and
+serialize the survivors. Peak memory is measured with tracemalloc in a
+separate pass so it does not distort the timings.
+
+With --lexicon, also times compiling that lexicon's Aho-Corasick index from
+scratch against loading the persisted index the extractor keeps in its
+cache directory.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from extract_pdf_kv import (
+    dedupe_pairs,
+    extract_pairs_from_text,
+    infer_unit_hint,
+    load_lexicon_index,
+    normalize,
+    normalize_backend,
+    pair_is_valid,
+    parse_line_pair,
+    serialize_pairs,
+)
+
+
+def dict_pair_record(
+    *, key: str, value: str, page_number: int, surface: str, backend: str, row_index: int
+) -> Dict[str, Any]:
+    """The dict layout build_pair_record produced before PairRecord, kept here as the baseline."""
+    normalized_key = normalize(key)
+    normalized_value = normalize(value)
+    requested_surface = normalize(surface).lower()
+    surface_token = requested_surface if requested_surface in {"pdf_kv", "scanned_pdf_ocr_kv"} else "pdf_kv"
+    page = max(1, int(page_number or 1))
+    row = max(1, int(row_index or 1))
+    return {
+        "key": normalized_key,
+        "value": normalized_value,
+        "raw_key": key,
+        "raw_value": value,
+        "normalized_key": normalized_key,
+        "normalized_value": normalized_value,
+        "table_id": None,
+        "row_id": f"pdf_{page:02d}.kv_{row:04d}",
+        "section_header": None,
+        "column_header": None,
+        "unit_hint": infer_unit_hint(normalized_key, normalized_value) or None,
+        "surface": surface_token,
+        "path": f"pdf.page[{page}].kv[{row}]",
+        "page": page,
+        "bbox": None,
+        "backend": normalize_backend(backend) if normalize_backend(backend) != "auto" else normalize(str(backend or "")).lower(),
+        "ocr_confidence": None,
+        "ocr_low_confidence": False,
+    }
+
+
+def dict_pipeline(pages: List[str], limit: int) -> Tuple[int, int]:
+    raw: List[Dict[str, Any]] = []
+    cursor = 0
+    for page_number, text in enumerate(pages, start=1):
+        for line in text.splitlines():
+            key, value = parse_line_pair(line)
+            if pair_is_valid(key, value):
+                cursor += 1
+                raw.append(
+                    dict_pair_record(
+                        key=key, value=value, page_number=page_number, surface="pdf_kv", backend="pymupdf", row_index=cursor
+                    )
+                )
+    seen = set()
+    deduped: List[Dict[str, Any]] = []
+    for pair in raw:
+        key = normalize(str(pair.get("normalized_key") or pair.get("key") or ""))
+        value = normalize(str(pair.get("normalized_value") or pair.get("value") or ""))
+        signature = (key.lower(), value.lower())
+        if not key or not value or signature in seen:
+            continue
+        seen.add(signature)
+        deduped.append(pair)
+        if len(deduped) >= limit:
+            break
+    kv_rows = [pair for pair in deduped if normalize(str(pair.get("surface") or "")).lower() not in {"pdf_table"}]
+    return len(raw), len(json.dumps({"pairs": deduped, "kv_pairs": kv_rows}))
+
+
+def record_pipeline(pages: List[str], limit: int) -> Tuple[int, int]:
+    raw = []
+    cursor = 0
+    for page_number, text in enumerate(pages, start=1):
+        rows, cursor = extract_pairs_from_text(
+            text=text, limit=limit * 3, page_number=page_number, backend="pymupdf", start_index=cursor
+        )
+        raw.extend(rows)
+    pair_rows, kv_rows, _ = serialize_pairs(dedupe_pairs(raw, limit))
+    return len(raw), len(json.dumps({"pairs": pair_rows, "kv_pairs": kv_rows}))
+
+
+def synthetic_pages(pair_count: int, pages: int, duplicate_ratio: float) -> List[str]:
+    fields = ["Weight", "Sensor", "Max DPI", "Polling rate", "Battery life", "Length", "Width", "Height", "Switches"]
+    units = ["g", "", "DPI", "Hz", "hours", "mm", "mm", "mm", ""]
+    unique = max(1, int(pair_count * (1.0 - duplicate_ratio)))
+    lines = [
+        f"{fields[idx % len(fields)]} {idx // len(fields)}: {idx % 997} {units[idx % len(units)]}".strip()
+        for idx in range(pair_count)
+    ]
+    lines = [lines[idx % unique] for idx in range(pair_count)]
+    per_page = max(1, pair_count // max(1, pages))
+    return ["\n".join(lines[start : start + per_page]) for start in range(0, pair_count, per_page)]
+
+
+def measure(pipeline: Callable[[List[str], int], Tuple[int, int]], pages: List[str], limit: int, repeat: int) -> Dict[str, Any]:
+    timings = []
+    raw_count = 0
+    json_bytes = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        raw_count, json_bytes = pipeline(pages, limit)
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    pipeline(pages, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best_ms = min(timings)
+    return {
+        "raw_pairs": raw_count,
+        "json_bytes": json_bytes,
+        "best_ms": round(best_ms, 2),
+        "pairs_per_second": round(raw_count / (best_ms / 1000.0), 1) if best_ms > 0 else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def measure_lexicon_index(lexicon_path: str, repeat: int) -> Dict[str, Any]:
+    """Best-of-``repeat`` ms to rebuild the index versus reading the persisted copy."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        index_path = os.path.join(work_dir, "lexicon.acindex.json")
+        load_lexicon_index(lexicon_path, index_path=index_path)
+        rebuild_timings = []
+        load_timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            load_lexicon_index(lexicon_path)
+            rebuild_timings.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            loaded = load_lexicon_index(lexicon_path, index_path=index_path)
+            load_timings.append((time.perf_counter() - started) * 1000)
+        index_bytes = os.path.getsize(index_path)
+    rebuild_ms = min(rebuild_timings)
+    load_ms = min(load_timings)
+    return {
+        "lexicon": lexicon_path,
+        "lexicon_bytes": os.path.getsize(lexicon_path),
+        "index_bytes": index_bytes,
+        "states": len(loaded["goto"]),
+        "synonyms": loaded["synonyms"],
+        "rebuild_ms": round(rebuild_ms, 3),
+        "load_ms": round(load_ms, 3),
+        "speedup": round(rebuild_ms / load_ms, 2) if load_ms > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compact pair records against dict pairs.")
+    parser.add_argument("--pairs", type=int, default=15000)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.5)
+    parser.add_argument("--max-pairs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lexicon", default="", help="also time rebuilding vs loading this lexicon's persisted index")
+    args = parser.parse_args()
+
+    pages = synthetic_pages(max(1, args.pairs), max(1, args.pages), max(0.0, min(0.95, args.duplicate_ratio)))
+    baseline = measure(dict_pipeline, pages, args.max_pairs, max(1, args.repeat))
+    compact = measure(record_pipeline, pages, args.max_pairs, max(1, args.repeat))
+    report = {
+        "pairs": args.pairs,
+        "pages": len(pages),
+        "duplicate_ratio": args.duplicate_ratio,
+        "dict": baseline,
+        "pair_record": compact,
+        "speedup": round(baseline["best_ms"] / compact["best_ms"], 2) if compact["best_ms"] else 0.0,
+        "peak_memory_ratio": round(compact["peak_bytes"] / baseline["peak_bytes"], 3) if baseline["peak_bytes"] else 0.0,
+    }
+    if args.lexicon:
+        report["lexicon_index"] = measure_lexicon_index(args.lexicon, max(1, args.repeat))
+    sys.stdout.write(json.dumps(report, indent=2))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
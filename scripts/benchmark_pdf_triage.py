@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure first-page PDF triage cost and accuracy against a labeled fixture set.
+
+The labels file is JSON shaped like the other benchmark fixtures:
+
+    {"cases": [{"pdf": "mouse-spec-sheet.pdf", "label": "spec"},
+               {"pdf": "warranty-terms.pdf", "label": "low_value"}]}
+
+fixtures/pdf_triage/labels.json is the default set: spec sheets, a brochure, a
+scanned page with no text layer, and boilerplate documents (declaration of
+conformity, warranty, quick start, troubleshooting).
+
+PDF paths are resolved relative to the labels file. Each document is triaged
+once; every threshold in --min-scores is then evaluated against the same
+scores, so sweeping thresholds does not re-read the PDFs.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from extract_pdf_kv import detect_available_backends, triage_pdf, write_json
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def evaluate_threshold(rows: List[Dict[str, Any]], min_score: float) -> Dict[str, Any]:
+    counts = {"true_low_value": 0, "false_low_value": 0, "true_spec": 0, "false_spec": 0, "unknown": 0}
+    for row in rows:
+        if row["verdict"] == "unknown":
+            counts["unknown"] += 1
+            continue
+        predicted_low = float(row["score"]) < min_score
+        actual_low = row["label"] == "low_value"
+        if predicted_low and actual_low:
+            counts["true_low_value"] += 1
+        elif predicted_low:
+            counts["false_low_value"] += 1
+        elif actual_low:
+            counts["false_spec"] += 1
+        else:
+            counts["true_spec"] += 1
+    judged = len(rows) - counts["unknown"]
+    predicted_low_total = counts["true_low_value"] + counts["false_low_value"]
+    actual_low_total = counts["true_low_value"] + counts["false_spec"]
+    return {
+        "min_score": min_score,
+        **counts,
+        "accuracy": round((counts["true_low_value"] + counts["true_spec"]) / judged, 4) if judged else 0.0,
+        "low_value_precision": round(counts["true_low_value"] / predicted_low_total, 4) if predicted_low_total else 0.0,
+        "low_value_recall": round(counts["true_low_value"] / actual_low_total, 4) if actual_low_total else 0.0,
+        # Spec sheets wrongly skipped are the expensive mistake; keep this at zero when tuning.
+        "spec_docs_skipped": counts["false_low_value"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PDF first-page triage on labeled fixtures.")
+    parser.add_argument(
+        "--labels",
+        default=os.path.join("fixtures", "pdf_triage", "labels.json"),
+        help="JSON file with cases [{pdf, label}]",
+    )
+    parser.add_argument("--out", default="")
+    parser.add_argument("--triage-pages", type=int, default=2)
+    parser.add_argument("--min-scores", default="0.1,0.15,0.2,0.25,0.3")
+    args = parser.parse_args()
+
+    with open(args.labels, "r", encoding="utf-8") as fh:
+        labels = json.load(fh)
+    base_dir = os.path.dirname(os.path.abspath(args.labels))
+    thresholds = sorted({float(token) for token in str(args.min_scores).split(",") if token.strip()})
+    available = detect_available_backends()
+
+    rows: List[Dict[str, Any]] = []
+    for case in labels.get("cases") or []:
+        pdf_path = os.path.join(base_dir, str(case.get("pdf") or ""))
+        label = str(case.get("label") or "").strip().lower()
+        result = triage_pdf(pdf_path, available=available, max_pages=max(1, int(args.triage_pages)))
+        rows.append(
+            {
+                "pdf": case.get("pdf"),
+                "label": label,
+                "verdict": result["verdict"],
+                "score": result["score"],
+                "backend": result["backend"],
+                "pages_read": result["pages_read"],
+                "elapsed_ms": result["elapsed_ms"],
+                "error": result["error"],
+            }
+        )
+
+    timings = [float(row["elapsed_ms"]) for row in rows]
+    report = {
+        "labels": args.labels,
+        "cases": len(rows),
+        "triage_pages": max(1, int(args.triage_pages)),
+        "elapsed_ms_total": round(sum(timings), 3),
+        "elapsed_ms_mean": round(sum(timings) / len(timings), 2) if timings else 0.0,
+        "elapsed_ms_p50": percentile(timings, 50),
+        "elapsed_ms_p95": percentile(timings, 95),
+        "thresholds": [evaluate_threshold(rows, threshold) for threshold in thresholds],
+        "rows": rows,
+    }
+    if args.out:
+        write_json(args.out, report)
+    summary = {key: value for key, value in report.items() if key != "rows"}
+    sys.stdout.write(json.dumps(summary, indent=2))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Compare page-batched quantity parsing against parsing each pair on its own.
+
+The corpus is a synthetic set of spec values (weights, DPI, ranges, durations,
+names without quantities) spread over pages with repeats, roughly the shape of
+a deduped extraction across many documents.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+from extract_pdf_kv import PairRecord, build_pair_record, normalize_pair_quantities, parse_quantity
+
+SAMPLE_VALUES = [
+    ("Weight", "54 g"),
+    ("Weight", "2.1 oz"),
+    ("Max DPI", "26,000 DPI"),
+    ("DPI range", "100-26000 cpi"),
+    ("Polling rate", "8000 Hz"),
+    ("Polling rate", "1 kHz"),
+    ("Battery life", "Up to 95 hours"),
+    ("Length", "127 mm"),
+    ("Cable length", "1.8 m"),
+    ("Acceleration", "50 G"),
+    ("Sensor", "Focus Pro 35K"),
+    ("Dimensions", "127 x 64 x 40 mm"),
+    ("Switches", "Optical Gen-3"),
+    ("Lift-off distance", "1-2 mm"),
+]
+
+
+def build_corpus(pair_count: int, pages: int, distinct: int) -> List[PairRecord]:
+    pairs = []
+    for idx in range(pair_count):
+        key, value = SAMPLE_VALUES[idx % len(SAMPLE_VALUES)]
+        variant = (idx // len(SAMPLE_VALUES)) % max(1, distinct)
+        if value[0].isdigit():
+            value = f"{variant + 1}{value}" if variant else value
+        pairs.append(
+            build_pair_record(
+                key=key, value=value, page_number=1 + (idx % max(1, pages)), surface="pdf_kv", backend="pymupdf", row_index=idx + 1
+            )
+        )
+    return pairs
+
+
+def per_pair(pairs: List[PairRecord]) -> int:
+    parsed = 0
+    for pair in pairs:
+        pair.quantity = parse_quantity(pair.key, pair.value)
+        parsed += 1 if pair.quantity else 0
+    return parsed
+
+
+def timed(fn: Any, pairs: List[PairRecord], repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    parsed = 0
+    for _ in range(repeat):
+        for pair in pairs:
+            pair.quantity = None
+        started = time.perf_counter()
+        parsed = fn(pairs)
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return {
+        "parsed_pairs": parsed,
+        "best_ms": round(best, 2),
+        "pairs_per_second": round(len(pairs) / (best / 1000.0), 1) if best > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batched PDF quantity parsing.")
+    parser.add_argument("--pairs", type=int, default=200000)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--distinct", type=int, default=50, help="numeric variants per sample value")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pairs = build_corpus(max(1, args.pairs), max(1, args.pages), max(1, args.distinct))
+    single = timed(per_pair, pairs, max(1, args.repeat))
+    expected = [pair.quantity for pair in pairs]
+    batched = timed(normalize_pair_quantities, pairs, max(1, args.repeat))
+    report = {
+        "pairs": len(pairs),
+        "pages": args.pages,
+        "per_pair": single,
+        "page_batched": batched,
+        "results_match": expected == [pair.quantity for pair in pairs],
+        "speedup": round(single["best_ms"] / batched["best_ms"], 2) if batched["best_ms"] else 0.0,
+    }
+    sys.stdout.write(json.dumps(report, indent=2))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
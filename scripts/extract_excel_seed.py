@@ -8,31 +8,73 @@ invoke it without extra dependencies.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
 
 NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
 NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
 NS = {"x": NS_MAIN, "r": NS_REL, "p": NS_PKG_REL}
+TAG_ROW = f"{{{NS_MAIN}}}row"
+TAG_CELL = f"{{{NS_MAIN}}}c"
+TAG_VALUE = f"{{{NS_MAIN}}}v"
+TAG_INLINE = f"{{{NS_MAIN}}}is"
+TAG_TEXT = f"{{{NS_MAIN}}}t"
+TAG_SHEET_DATA = f"{{{NS_MAIN}}}sheetData"
+TAG_SHARED_ITEM = f"{{{NS_MAIN}}}si"
+TAG_SHARED_TABLE = f"{{{NS_MAIN}}}sst"
+SEED_CACHE_VERSION = 2
+SEED_MANIFEST_VERSION = 1
+LAYOUT_DEFAULTS: Dict[str, object] = {
+    "sheet": "dataEntry",
+    "field_label_column": "B",
+    "field_row_start": 9,
+    "field_row_end": 83,
+    "brand_row": 3,
+    "model_row": 4,
+    "variant_row": 5,
+    "data_column_start": "C",
+    "data_column_end": "",
+}
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--workbook", required=True)
-    parser.add_argument("--sheet", default="dataEntry")
-    parser.add_argument("--field-label-column", default="B")
-    parser.add_argument("--field-row-start", type=int, default=9)
-    parser.add_argument("--field-row-end", type=int, default=83)
-    parser.add_argument("--brand-row", type=int, default=3)
-    parser.add_argument("--model-row", type=int, default=4)
-    parser.add_argument("--variant-row", type=int, default=5)
-    parser.add_argument("--data-column-start", default="C")
-    parser.add_argument("--data-column-end", default="")
+    parser.add_argument("--workbook", default="")
+    parser.add_argument("--sheet", default=LAYOUT_DEFAULTS["sheet"])
+    parser.add_argument("--field-label-column", default=LAYOUT_DEFAULTS["field_label_column"])
+    parser.add_argument("--field-row-start", type=int, default=LAYOUT_DEFAULTS["field_row_start"])
+    parser.add_argument("--field-row-end", type=int, default=LAYOUT_DEFAULTS["field_row_end"])
+    parser.add_argument("--brand-row", type=int, default=LAYOUT_DEFAULTS["brand_row"])
+    parser.add_argument("--model-row", type=int, default=LAYOUT_DEFAULTS["model_row"])
+    parser.add_argument("--variant-row", type=int, default=LAYOUT_DEFAULTS["variant_row"])
+    parser.add_argument("--data-column-start", default=LAYOUT_DEFAULTS["data_column_start"])
+    parser.add_argument("--data-column-end", default=LAYOUT_DEFAULTS["data_column_end"])
+    parser.add_argument("--cache-dir", default="", help="reuse payloads while the workbook fingerprint and arguments match")
+    parser.add_argument("--since", default="", help="previous output; emit only added/changed/removed product columns")
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="ndjson: header with field_rows, one product per line, then a summary record",
+    )
+    parser.add_argument(
+        "--batch",
+        default="",
+        help=(
+            "JSON list of {workbook, sheet, <layout>} specs; each workbook is opened once, workbooks run in parallel. "
+            "--cache-dir applies per spec; --since is rejected"
+        ),
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="batch worker processes (default: one per workbook, up to CPU count)")
     return parser.parse_args()
 
 
@@ -103,49 +145,238 @@ def load_shared_strings(zf: zipfile.ZipFile) -> List[str]:
     return out
 
 
-def sheet_cells(zf: zipfile.ZipFile, sheet_path: str, shared: List[str]) -> Dict[str, str]:
-    root = ET.fromstring(zf.read(sheet_path))
-    out: Dict[str, str] = {}
-    for c in root.findall(".//x:c", NS):
-        ref = c.attrib.get("r", "").strip()
-        if not ref:
-            continue
-        t = c.attrib.get("t", "")
-        value = ""
-        inline = c.find("x:is", NS)
-        if inline is not None:
-            parts = [(node.text or "") for node in inline.findall(".//x:t", NS)]
-            value = "".join(parts)
-        else:
-            v = c.find("x:v", NS)
-            if v is None:
+def load_shared_string_subset(zf: zipfile.ZipFile, indices: Set[int]) -> Dict[int, str]:
+    """Stream sharedStrings.xml once, keeping only ``indices`` and stopping after the highest one."""
+    out: Dict[int, str] = {}
+    if not indices:
+        return out
+    last_index = max(indices)
+    table = None
+    position = 0
+    try:
+        fh = zf.open("xl/sharedStrings.xml")
+    except KeyError:
+        return out
+    with fh:
+        for event, elem in ET.iterparse(fh, events=("start", "end")):
+            if event == "start":
+                if elem.tag == TAG_SHARED_TABLE:
+                    table = elem
                 continue
-            raw = v.text or ""
-            if t == "s":
-                try:
-                    value = shared[int(raw)]
-                except Exception:
-                    value = raw
-            else:
-                value = raw
-        out[ref.upper()] = str(value).strip()
+            if elem.tag != TAG_SHARED_ITEM:
+                continue
+            if position in indices:
+                out[position] = "".join((node.text or "") for node in elem.iter(TAG_TEXT))
+            elem.clear()
+            if table is not None:
+                table.remove(elem)
+            position += 1
+            if position > last_index:
+                break
     return out
 
 
-def build_payload(
-    cells: Dict[str, str],
+class SheetGrid:
+    """Cell text stored column by column, each column a list indexed by row position.
+
+    Cell refs are decoded to integer (row, col) once while parsing; lookups
+    afterwards are a dict hit for the column and a list index for the row.
+    """
+
+    __slots__ = ("rows", "row_pos", "columns", "max_col")
+
+    def __init__(self, rows: Iterable[int] = ()) -> None:
+        self.rows: List[int] = []
+        self.row_pos: Dict[int, int] = {}
+        self.columns: Dict[int, List[str]] = {}
+        self.max_col = 0
+        for row in sorted(set(rows)):
+            self.add_row(row)
+
+    def add_row(self, row: int) -> int:
+        pos = self.row_pos.get(row)
+        if pos is None:
+            pos = self.row_pos[row] = len(self.rows)
+            self.rows.append(row)
+        return pos
+
+    def set(self, row: int, col: int, value: str) -> None:
+        pos = self.add_row(row)
+        column = self.columns.get(col)
+        if column is None:
+            column = self.columns[col] = []
+        if len(column) <= pos:
+            column.extend([""] * (len(self.rows) - len(column)))
+        column[pos] = value
+        if col > self.max_col:
+            self.max_col = col
+
+    def get(self, row: int, col: int) -> str:
+        pos = self.row_pos.get(row)
+        column = self.columns.get(col)
+        if pos is None or column is None or pos >= len(column):
+            return ""
+        return column[pos]
+
+
+def sheet_grid(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    shared: Optional[Sequence[str]] = None,
+    rows: Optional[Iterable[int]] = None,
+    min_col: int = 1,
+    max_col: int = 0,
+    shared_cache: Optional[Dict[int, str]] = None,
+) -> SheetGrid:
+    """Stream the worksheet XML, keeping only cells in ``rows`` and columns ``min_col..max_col``.
+
+    Rows and cells are cleared as soon as they are read, and parsing stops at
+    the first row past the last wanted one, so helper rows below the field
+    block are never materialized. ``rows=None`` keeps every row and
+    ``max_col=0`` leaves the column range open-ended.
+
+    With ``shared=None`` shared-string cells are resolved lazily: their indices
+    are collected during the sheet pass and only those entries are read from
+    the shared string table afterwards. Passing the same ``shared_cache`` for
+    several sheets of one workbook only reads entries not resolved before.
+    """
+    wanted = set(rows) if rows is not None else None
+    last_row = max(wanted) if wanted else 0
+    grid = SheetGrid(wanted or ())
+    pending: List[Tuple[int, int, str]] = []
+    col_of: Dict[str, int] = {}
+    sheet_data = None
+    row_idx = 0
+    with zf.open(sheet_path) as fh:
+        for event, elem in ET.iterparse(fh, events=("start", "end")):
+            if event == "start":
+                if elem.tag == TAG_SHEET_DATA:
+                    sheet_data = elem
+                elif elem.tag == TAG_ROW:
+                    raw_row = elem.attrib.get("r", "")
+                    row_idx = int(raw_row) if raw_row.isdigit() else row_idx + 1
+                    if wanted is not None and row_idx > last_row:
+                        break
+                continue
+            if elem.tag == TAG_ROW:
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.remove(elem)
+                continue
+            if elem.tag != TAG_CELL:
+                continue
+            if wanted is not None and row_idx not in wanted:
+                continue
+            ref = elem.attrib.get("r", "").strip().upper()
+            if not ref:
+                continue
+            letters = ref.rstrip("0123456789")
+            col_idx = col_of.get(letters)
+            if col_idx is None:
+                col_idx = col_of[letters] = col_to_index(letters)
+            if col_idx < min_col or (max_col and col_idx > max_col):
+                continue
+            cell_row = int(ref[len(letters):]) if len(letters) < len(ref) else row_idx
+            t = elem.attrib.get("t", "")
+            value = ""
+            inline = elem.find(TAG_INLINE)
+            if inline is not None:
+                parts = [(node.text or "") for node in inline.iter(TAG_TEXT)]
+                value = "".join(parts)
+            else:
+                v = elem.find(TAG_VALUE)
+                if v is None:
+                    continue
+                raw = v.text or ""
+                if t == "s" and shared is None:
+                    pending.append((cell_row, col_idx, raw))
+                    continue
+                if t == "s":
+                    try:
+                        value = shared[int(raw)]
+                    except Exception:
+                        value = raw
+                else:
+                    value = raw
+            grid.set(cell_row, col_idx, str(value).strip())
+    if pending:
+        needed = {int(raw) for _, _, raw in pending if raw.strip().isdigit()}
+        if shared_cache is None:
+            resolved = load_shared_string_subset(zf, needed)
+        else:
+            missing = needed.difference(shared_cache)
+            if missing:
+                shared_cache.update(load_shared_string_subset(zf, missing))
+            resolved = shared_cache
+        for cell_row, col_idx, raw in pending:
+            index = int(raw) if raw.strip().isdigit() else -1
+            grid.set(cell_row, col_idx, str(resolved.get(index, raw)).strip())
+    return grid
+
+
+def normalize_layout(raw: Dict[str, object]) -> Dict[str, object]:
+    """Sheet name and row/column layout with CLI defaults filled in and columns upper-cased."""
+    merged = {**LAYOUT_DEFAULTS, **{key: value for key, value in raw.items() if key in LAYOUT_DEFAULTS and value is not None}}
+    return {
+        "sheet": str(merged["sheet"]),
+        "field_label_column": str(merged["field_label_column"] or "B").strip().upper(),
+        "field_row_start": int(merged["field_row_start"]),
+        "field_row_end": int(merged["field_row_end"]),
+        "brand_row": int(merged["brand_row"]),
+        "model_row": int(merged["model_row"]),
+        "variant_row": int(merged["variant_row"]),
+        "data_column_start": str(merged["data_column_start"] or "C").strip().upper(),
+        "data_column_end": str(merged["data_column_end"] or "").strip().upper(),
+    }
+
+
+def read_sheet(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    layout: Dict[str, object],
+    shared_cache: Optional[Dict[int, str]] = None,
+) -> Tuple[SheetGrid, List[Dict[str, object]]]:
+    """Grid of the header and field rows for ``layout`` plus its labelled field rows."""
+    label_col = str(layout["field_label_column"])
+    data_col_start = str(layout["data_column_start"])
+    data_col_end = str(layout["data_column_end"])
+    header_rows = [int(layout["brand_row"]), int(layout["model_row"]), int(layout["variant_row"])]
+    wanted_rows = {row for row in header_rows if row > 0}
+    wanted_rows.update(range(int(layout["field_row_start"]), int(layout["field_row_end"]) + 1))
+    grid = sheet_grid(
+        zf,
+        sheet_path,
+        rows=wanted_rows,
+        min_col=min(col_to_index(label_col), col_to_index(data_col_start)),
+        max_col=max(col_to_index(label_col), col_to_index(data_col_end)) if data_col_end else 0,
+        shared_cache=shared_cache,
+    )
+    field_rows = payload_field_rows(grid, label_col, int(layout["field_row_start"]), int(layout["field_row_end"]))
+    return grid, field_rows
+
+
+def layout_products(grid: SheetGrid, field_rows: Sequence[Dict[str, object]], layout: Dict[str, object]) -> Iterator[Dict[str, object]]:
+    return iter_products(
+        grid,
+        field_rows,
+        brand_row=int(layout["brand_row"]),
+        model_row=int(layout["model_row"]),
+        variant_row=int(layout["variant_row"]),
+        data_col_start=str(layout["data_column_start"]),
+        data_col_end=str(layout["data_column_end"]) or None,
+    )
+
+
+def payload_field_rows(
+    grid: SheetGrid,
     field_label_col: str,
     field_row_start: int,
     field_row_end: int,
-    brand_row: int,
-    model_row: int,
-    variant_row: int,
-    data_col_start: str,
-    data_col_end: Optional[str],
-) -> Dict[str, object]:
+) -> List[Dict[str, object]]:
+    label_col = col_to_index(field_label_col)
     field_rows = []
     for row_idx in range(field_row_start, field_row_end + 1):
-        label = cells.get(f"{field_label_col}{row_idx}", "").strip()
+        label = grid.get(row_idx, label_col)
         if not label:
             continue
         field_rows.append(
@@ -154,58 +385,569 @@ def build_payload(
                 "label": label,
             }
         )
+    return field_rows
 
-    if not field_rows:
-        return {
-            "field_rows": [],
-            "products": [],
-        }
 
-    max_col_seen = col_to_index(data_col_start)
-    for ref in cells.keys():
-        try:
-            col, _row = split_cell_ref(ref)
-        except ValueError:
-            continue
-        max_col_seen = max(max_col_seen, col_to_index(col))
+def iter_products(
+    grid: SheetGrid,
+    field_rows: Sequence[Dict[str, object]],
+    brand_row: int,
+    model_row: int,
+    variant_row: int,
+    data_col_start: str,
+    data_col_end: Optional[str],
+) -> Iterator[Dict[str, object]]:
+    """Yield one product per data column, in column order, as it is assembled."""
+    if not field_rows:
+        return
 
     start_col = col_to_index(data_col_start)
+    max_col_seen = max(start_col, grid.max_col)
     end_col = col_to_index(data_col_end) if data_col_end else max_col_seen
     end_col = max(start_col, min(end_col, max_col_seen))
 
-    products = []
+    row_pos = grid.row_pos
+    brand_pos = row_pos.get(brand_row, -1)
+    model_pos = row_pos.get(model_row, -1)
+    variant_pos = row_pos.get(variant_row, -1) if variant_row > 0 else -1
+    field_slots = [(str(row["label"]), row_pos.get(int(row["row"]), -1)) for row in field_rows]
+
+    def at(column: List[str], pos: int) -> str:
+        return column[pos] if 0 <= pos < len(column) else ""
+
     for col_idx in range(start_col, end_col + 1):
-        col = index_to_col(col_idx)
-        brand = cells.get(f"{col}{brand_row}", "").strip()
-        model = cells.get(f"{col}{model_row}", "").strip()
+        column = grid.columns.get(col_idx)
+        if column is None:
+            continue
+        brand = at(column, brand_pos)
+        model = at(column, model_pos)
         if not brand and not model:
             continue
-        variant = cells.get(f"{col}{variant_row}", "").strip() if variant_row > 0 else ""
-        values = {}
-        for row in field_rows:
-            row_idx = int(row["row"])
-            label = str(row["label"])
-            values[label] = cells.get(f"{col}{row_idx}", "").strip()
-        products.append(
+        yield {
+            "column": index_to_col(col_idx),
+            "brand": brand,
+            "model": model,
+            "variant": at(column, variant_pos),
+            "values_by_label": {label: at(column, pos) for label, pos in field_slots},
+        }
+
+
+def build_payload(
+    grid: SheetGrid,
+    field_label_col: str,
+    field_row_start: int,
+    field_row_end: int,
+    brand_row: int,
+    model_row: int,
+    variant_row: int,
+    data_col_start: str,
+    data_col_end: Optional[str],
+) -> Dict[str, object]:
+    field_rows = payload_field_rows(grid, field_label_col, field_row_start, field_row_end)
+    products = iter_products(grid, field_rows, brand_row, model_row, variant_row, data_col_start, data_col_end)
+    return {
+        "field_rows": field_rows,
+        "products": list(products),
+    }
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def seed_cache_key(workbook_path: str, options: Dict[str, object]) -> str:
+    """Workbook path plus every argument that changes the payload; the file fingerprint lives in the entry."""
+    raw = json.dumps({"version": SEED_CACHE_VERSION, "workbook_path": workbook_path, **options}, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def seed_cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, f"{key}.ndjson")
+
+
+def read_seed_cache(cache_dir: str, key: str) -> Optional[Dict[str, object]]:
+    """Header line of a cache entry (fingerprint and field_rows); products stay on disk."""
+    try:
+        with open(seed_cache_path(cache_dir, key), "r", encoding="utf-8") as fh:
+            header = json.loads(fh.readline())
+    except Exception:
+        return None
+    if not isinstance(header, dict) or header.get("version") != SEED_CACHE_VERSION:
+        return None
+    return header if isinstance(header.get("fingerprint"), dict) else None
+
+
+def iter_cached_products(cache_dir: str, key: str) -> Iterator[Dict[str, object]]:
+    with open(seed_cache_path(cache_dir, key), "r", encoding="utf-8") as fh:
+        fh.readline()
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+class SeedCacheWriter:
+    """Tee products into an NDJSON cache entry while they stream to stdout.
+
+    The entry is written to a temp file and only renamed into place by
+    ``finish`` once every product went through, so readers never see half an
+    entry. A write error stops caching but never the output; it is reported
+    through ``cache_info``.
+    """
+
+    def __init__(self, cache_dir: str, key: str, header: Dict[str, object], cache_info: Dict[str, object]) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = seed_cache_path(cache_dir, key)
+        self.tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        self.cache_info = cache_info
+        self.fh = open(self.tmp_path, "w", encoding="utf-8")
+        self.fh.write(json.dumps(header))
+        self.fh.write("\n")
+
+    def tee(self, products: Iterable[Dict[str, object]]) -> Iterator[Dict[str, object]]:
+        for product in products:
+            if self.fh is not None:
+                try:
+                    self.fh.write(json.dumps(product))
+                    self.fh.write("\n")
+                except Exception as exc:
+                    self.cache_info["write_error"] = str(exc)
+                    self.discard()
+            yield product
+
+    def discard(self) -> None:
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+    def finish(self) -> None:
+        if self.fh is None:
+            return
+        try:
+            self.fh.close()
+            self.fh = None
+            os.replace(self.tmp_path, self.path)
+        except Exception:
+            self.discard()
+
+
+def match_seed_cache(
+    entry: Optional[Dict[str, object]], workbook_path: str, size: int, mtime_ns: int, known_hash: str = ""
+) -> Tuple[Optional[str], str]:
+    """Return (how the entry was validated, content hash computed along the way).
+
+    Same size and mtime trusts the stored hash without reading the workbook.
+    A touched or copied file with the same size is hashed (or ``known_hash``
+    reused) and still hits when the bytes are unchanged; a size change is
+    always a miss.
+    """
+    if entry is None:
+        return None, known_hash
+    stored = entry["fingerprint"]
+    if int(stored.get("size") or -1) != size:
+        return None, known_hash
+    if int(stored.get("mtime_ns") or -1) == mtime_ns and stored.get("sha256"):
+        return "stat", str(stored["sha256"])
+    content_hash = known_hash or file_sha256(workbook_path)
+    return ("content_hash" if content_hash == stored.get("sha256") else None), content_hash
+
+
+def stable_hash(value: object) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def column_entry(product: Dict[str, object]) -> Dict[str, object]:
+    """Content hash of a product column plus the identity needed to retire it later."""
+    return {
+        "hash": stable_hash(product),
+        "brand": product.get("brand", ""),
+        "model": product.get("model", ""),
+        "variant": product.get("variant", ""),
+    }
+
+
+def load_ndjson_snapshot(fh: TextIO) -> Tuple[Dict[str, Dict[str, object]], str]:
+    """Same as a JSON snapshot, read record by record from --format ndjson output."""
+    field_rows: List[Dict[str, object]] = []
+    columns: Dict[str, Dict[str, object]] = {}
+    summary: Optional[Dict[str, object]] = None
+    for line in fh:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        kind = record.pop("type", "")
+        if kind == "header":
+            if not record.get("ok"):
+                raise ValueError("previous output is not a successful extraction")
+            field_rows = list(record.get("field_rows") or [])
+        elif kind == "product":
+            columns[str(record["column"])] = column_entry(record)
+        elif kind == "summary":
+            summary = record
+    if summary is None or not summary.get("ok"):
+        raise ValueError("previous ndjson output has no successful summary record")
+    manifest = summary.get("manifest")
+    if isinstance(manifest, dict) and isinstance(manifest.get("columns"), dict):
+        return dict(manifest["columns"]), str(manifest.get("field_rows_hash") or "")
+    return columns, stable_hash(field_rows)
+
+
+def load_since_snapshot(path: str) -> Tuple[Dict[str, Dict[str, object]], str]:
+    """Column manifest and field-row hash of a previous run.
+
+    Full outputs are hashed from their products; diff outputs already carry
+    the manifest of the complete state they describe, so runs can chain.
+    Both the JSON document and the NDJSON record stream are accepted.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        first_line = fh.readline()
+        try:
+            first = json.loads(first_line)
+        except ValueError:
+            first = None
+        fh.seek(0)
+        if isinstance(first, dict) and first.get("type") == "header":
+            return load_ndjson_snapshot(fh)
+        previous = json.load(fh)
+    if not isinstance(previous, dict) or not previous.get("ok"):
+        raise ValueError("previous output is not a successful extraction")
+    manifest = previous.get("manifest")
+    if isinstance(manifest, dict) and isinstance(manifest.get("columns"), dict):
+        return dict(manifest["columns"]), str(manifest.get("field_rows_hash") or "")
+    columns = {str(product["column"]): column_entry(product) for product in previous.get("products") or []}
+    return columns, stable_hash(previous.get("field_rows") or [])
+
+
+class ColumnDiff:
+    """Compare product columns against a previous snapshot one product at a time.
+
+    An unreadable snapshot diffs against nothing, so every column comes back
+    as added rather than the run failing.
+    """
+
+    def __init__(self, since_path: str) -> None:
+        self.since_path = since_path
+        self.since_error = ""
+        try:
+            self.previous, self.previous_field_rows_hash = load_since_snapshot(since_path)
+        except Exception as exc:
+            self.previous, self.previous_field_rows_hash = {}, ""
+            self.since_error = f"since_unreadable: {exc}"
+        self.columns: Dict[str, Dict[str, object]] = {}
+        self.added: List[str] = []
+        self.changed: List[str] = []
+
+    def keep(self, product: Dict[str, object]) -> bool:
+        col = str(product["column"])
+        entry = self.columns[col] = column_entry(product)
+        previous = self.previous.get(col)
+        if previous is None:
+            self.added.append(col)
+            return True
+        if previous.get("hash") != entry["hash"]:
+            self.changed.append(col)
+            return True
+        return False
+
+    def finish(self, field_rows: Sequence[Dict[str, object]]) -> Dict[str, object]:
+        field_rows_hash = stable_hash(list(field_rows))
+        removed = [col for col in self.previous if col not in self.columns]
+        manifest: Dict[str, object] = {
+            "version": SEED_MANIFEST_VERSION,
+            "since": self.since_path,
+            "field_rows_hash": field_rows_hash,
+            "field_rows_changed": bool(self.previous_field_rows_hash) and self.previous_field_rows_hash != field_rows_hash,
+            "total": len(self.columns),
+            "added": self.added,
+            "changed": self.changed,
+            "removed": removed,
+            "unchanged": len(self.columns) - len(self.added) - len(self.changed),
+            "columns": self.columns,
+        }
+        if self.since_error:
+            manifest["since_error"] = self.since_error
+        return {
+            "removed": [
+                {"column": col, **{key: self.previous[col].get(key, "") for key in ("brand", "model", "variant")}}
+                for col in removed
+            ],
+            "manifest": manifest,
+        }
+
+
+def write_record(record: Dict[str, object]) -> None:
+    sys.stdout.write(json.dumps(record))
+    sys.stdout.write("\n")
+
+
+def emit_output(
+    workbook_path: str,
+    sheet: str,
+    field_rows: List[Dict[str, object]],
+    products: Iterable[Dict[str, object]],
+    since_path: str,
+    output_format: str,
+    cache: Optional[Dict[str, object]],
+) -> int:
+    """Print the payload as one JSON document, or as NDJSON records written while products are produced."""
+    diff = ColumnDiff(since_path) if since_path else None
+    if output_format == "ndjson":
+        write_record({"type": "header", "ok": True, "workbook_path": workbook_path, "sheet": sheet, "field_rows": field_rows})
+        count = 0
+        for product in products:
+            if diff is None or diff.keep(product):
+                write_record({"type": "product", **product})
+                count += 1
+        summary: Dict[str, object] = {"type": "summary", "ok": True, "products": count}
+        if diff is not None:
+            summary.update(diff.finish(field_rows))
+        if cache is not None:
+            summary["cache"] = cache
+        write_record(summary)
+        return 0
+
+    output: Dict[str, object] = {
+        "ok": True,
+        "workbook_path": workbook_path,
+        "sheet": sheet,
+        "field_rows": field_rows,
+        "products": [product for product in products if diff is None or diff.keep(product)],
+    }
+    if diff is not None:
+        output.update(diff.finish(field_rows))
+    if cache is not None:
+        output["cache"] = cache
+    print(json.dumps(output))
+    return 0
+
+
+def load_batch_specs(path: str) -> List[Dict[str, object]]:
+    """Specs from a JSON list, or an object with a ``specs`` list; workbook paths resolve against the file."""
+    with open(path, "r", encoding="utf-8") as fh:
+        parsed = json.load(fh)
+    rows = parsed.get("specs") if isinstance(parsed, dict) else parsed
+    if not isinstance(rows, list):
+        raise ValueError("batch file must be a list of specs or {\"specs\": [...]}")
+    base_dir = os.path.dirname(os.path.abspath(path))
+    specs = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict) or not str(row.get("workbook") or "").strip():
+            raise ValueError(f"spec {index} has no workbook")
+        specs.append(
             {
-                "column": col,
-                "brand": brand,
-                "model": model,
-                "variant": variant,
-                "values_by_label": values,
+                "id": str(row.get("id") or index),
+                "workbook_path": os.path.abspath(os.path.join(base_dir, str(row["workbook"]))),
+                "layout": normalize_layout(row),
             }
         )
+    return specs
+
+
+def extract_workbook_specs(
+    workbook_path: str, specs: List[Dict[str, object]], cache_dir: str = ""
+) -> List[Dict[str, object]]:
+    """Run every spec of one workbook against a single open zip, sharing the sheet map and shared strings.
+
+    With ``cache_dir`` each spec is looked up under the same key a single run
+    uses; the workbook is only opened when some spec misses.
+    """
+    results: Dict[int, Dict[str, object]] = {}
+
+    def failed(spec: Dict[str, object], error: str, **extra: object) -> Dict[str, object]:
+        return {"id": spec["id"], "ok": False, "workbook_path": workbook_path, "sheet": spec["layout"]["sheet"], "error": error, **extra}
+
+    def done() -> List[Dict[str, object]]:
+        return [results[position] for position in range(len(specs))]
+
+    if not os.path.exists(workbook_path):
+        return [failed(spec, f"workbook_not_found: {workbook_path}") for spec in specs]
+    stat = os.stat(workbook_path)
+    content_hash = ""
+    cache_infos: Dict[int, Dict[str, object]] = {}
+    pending = list(range(len(specs)))
+    if cache_dir:
+        pending = []
+        for position, spec in enumerate(specs):
+            key = seed_cache_key(workbook_path, spec["layout"])
+            entry = read_seed_cache(cache_dir, key)
+            try:
+                validated_by, content_hash = match_seed_cache(
+                    entry, workbook_path, stat.st_size, stat.st_mtime_ns, known_hash=content_hash
+                )
+            except OSError:
+                validated_by = None
+            info: Dict[str, object] = {"hit": bool(entry is not None and validated_by), "key": key, "validated_by": validated_by}
+            cache_infos[position] = info
+            if entry is None or not validated_by:
+                pending.append(position)
+                continue
+            products = list(iter_cached_products(cache_dir, key))
+            if validated_by == "content_hash":
+                refreshed = {**entry, "fingerprint": {**entry["fingerprint"], "mtime_ns": stat.st_mtime_ns}}
+                write_cached_products(cache_dir, key, refreshed, products, info)
+            results[position] = {
+                "id": spec["id"],
+                "ok": True,
+                "workbook_path": workbook_path,
+                "sheet": spec["layout"]["sheet"],
+                "field_rows": list(entry.get("field_rows") or []),
+                "products": products,
+                "cache": info,
+            }
+        if not pending:
+            return done()
+
+    started = time.perf_counter()
+    try:
+        zf = zipfile.ZipFile(workbook_path, "r")
+    except Exception as exc:
+        results.update((position, failed(specs[position], f"parse_failed: {exc}")) for position in pending)
+        return done()
+    with zf:
+        try:
+            sheets = load_workbook_paths(zf)
+        except Exception as exc:
+            results.update((position, failed(specs[position], f"parse_failed: {exc}")) for position in pending)
+            return done()
+        open_ms = round((time.perf_counter() - started) * 1000, 3)
+        shared_cache: Dict[int, str] = {}
+        for position in pending:
+            spec = specs[position]
+            layout = spec["layout"]
+            sheet_path = sheets.get(str(layout["sheet"]))
+            if not sheet_path:
+                results[position] = failed(spec, f"sheet_not_found: {layout['sheet']}", sheets=sorted(sheets.keys()))
+                continue
+            sheet_started = time.perf_counter()
+            try:
+                grid, field_rows = read_sheet(zf, sheet_path, layout, shared_cache=shared_cache)
+                parsed_at = time.perf_counter()
+                products = list(layout_products(grid, field_rows, layout))
+            except Exception as exc:
+                results[position] = failed(spec, f"parse_failed: {exc}")
+                continue
+            finished_at = time.perf_counter()
+            results[position] = {
+                "id": spec["id"],
+                "ok": True,
+                "workbook_path": workbook_path,
+                "sheet": layout["sheet"],
+                "field_rows": field_rows,
+                "products": products,
+                "timings": {
+                    "workbook_open_ms": open_ms,
+                    "parse_ms": round((parsed_at - sheet_started) * 1000, 3),
+                    "build_ms": round((finished_at - parsed_at) * 1000, 3),
+                },
+            }
+            if cache_dir:
+                info = cache_infos[position]
+                try:
+                    content_hash = content_hash or file_sha256(workbook_path)
+                except OSError as exc:
+                    info["write_error"] = str(exc)
+                else:
+                    header = {
+                        "version": SEED_CACHE_VERSION,
+                        "fingerprint": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": content_hash},
+                        "workbook_path": workbook_path,
+                        "sheet": layout["sheet"],
+                        "field_rows": field_rows,
+                    }
+                    write_cached_products(cache_dir, info["key"], header, products, info)
+                results[position]["cache"] = info
+    return done()
+
+
+def write_cached_products(
+    cache_dir: str, key: str, header: Dict[str, object], products: Iterable[Dict[str, object]], cache_info: Dict[str, object]
+) -> None:
+    try:
+        writer = SeedCacheWriter(cache_dir, key, header, cache_info)
+    except Exception as exc:
+        cache_info["write_error"] = str(exc)
+        return
+    for _ in writer.tee(products):
+        pass
+    writer.finish()
 
+
+def run_batch(specs: List[Dict[str, object]], jobs: int, cache_dir: str = "") -> Dict[str, object]:
+    """Group specs by workbook, extract workbooks in parallel and return results in spec order."""
+    started = time.perf_counter()
+    by_workbook: Dict[str, List[Dict[str, object]]] = {}
+    positions: Dict[str, List[int]] = {}
+    for position, spec in enumerate(specs):
+        by_workbook.setdefault(str(spec["workbook_path"]), []).append(spec)
+        positions.setdefault(str(spec["workbook_path"]), []).append(position)
+    workers = max(1, min(jobs or (os.cpu_count() or 1), len(by_workbook)))
+    if workers == 1:
+        grouped = [extract_workbook_specs(path, rows, cache_dir) for path, rows in by_workbook.items()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            grouped = list(
+                pool.map(
+                    extract_workbook_specs,
+                    list(by_workbook.keys()),
+                    list(by_workbook.values()),
+                    [cache_dir] * len(by_workbook),
+                )
+            )
+    ordered: Dict[int, Dict[str, object]] = {}
+    for path, workbook_results in zip(by_workbook.keys(), grouped):
+        ordered.update(zip(positions[path], workbook_results))
+    results = [ordered[position] for position in range(len(specs))]
+    failed = sum(1 for result in results if not result["ok"])
     return {
-        "field_rows": field_rows,
-        "products": products,
+        "ok": failed == 0,
+        "results": results,
+        "summary": {
+            "specs": len(results),
+            "workbooks": len(by_workbook),
+            "workers": workers,
+            "ok": len(results) - failed,
+            "failed": failed,
+            "cache_hits": sum(1 for result in results if (result.get("cache") or {}).get("hit")),
+            "products": sum(len(result.get("products") or []) for result in results),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "timings": [
+                {"id": result["id"], "sheet": result["sheet"], "ok": result["ok"], **(result.get("timings") or {})}
+                for result in results
+            ],
+        },
     }
 
 
 def main() -> int:
     args = parse_args()
-    workbook_path = os.path.abspath(args.workbook)
-    if not os.path.exists(workbook_path):
+    if args.batch:
+        if args.since:
+            # One previous output cannot describe every spec in the batch.
+            print(json.dumps({"ok": False, "error": "since_not_supported_with_batch"}))
+            return 2
+        try:
+            specs = load_batch_specs(os.path.abspath(args.batch))
+        except Exception as exc:
+            print(json.dumps({"ok": False, "error": f"batch_invalid: {exc}"}))
+            return 2
+        report = run_batch(specs, max(0, int(args.jobs)), str(args.cache_dir or "").strip())
+        if args.format == "ndjson":
+            for result in report["results"]:
+                write_record({"type": "result", **result})
+            write_record({"type": "summary", "ok": report["ok"], **report["summary"]})
+        else:
+            print(json.dumps(report))
+        return 0
+
+    workbook_path = os.path.abspath(args.workbook) if args.workbook else ""
+    if not workbook_path or not os.path.exists(workbook_path):
         print(
             json.dumps(
                 {
@@ -216,6 +958,50 @@ def main() -> int:
         )
         return 2
 
+    layout = normalize_layout(vars(args))
+    cache_dir = str(args.cache_dir or "").strip()
+    since_path = os.path.abspath(args.since) if args.since else ""
+    cache_key = ""
+    cache_info: Optional[Dict[str, object]] = None
+    content_hash = ""
+    stat = os.stat(workbook_path)
+    if cache_dir:
+        cache_key = seed_cache_key(workbook_path, layout)
+        entry = read_seed_cache(cache_dir, cache_key)
+        try:
+            validated_by, content_hash = match_seed_cache(entry, workbook_path, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            validated_by, content_hash = None, ""
+        if entry is not None and validated_by:
+            cache_info = {"hit": True, "key": cache_key, "validated_by": validated_by}
+            cached: Iterable[Dict[str, object]] = iter_cached_products(cache_dir, cache_key)
+            writer: Optional[SeedCacheWriter] = None
+            if validated_by == "content_hash":
+                # Same bytes under a new mtime; rewrite the entry as it streams so the next run hits on stat alone.
+                try:
+                    writer = SeedCacheWriter(
+                        cache_dir,
+                        cache_key,
+                        {**entry, "fingerprint": {**entry["fingerprint"], "mtime_ns": stat.st_mtime_ns}},
+                        cache_info,
+                    )
+                    cached = writer.tee(cached)
+                except Exception:
+                    writer = None
+            status = emit_output(
+                workbook_path,
+                args.sheet,
+                list(entry.get("field_rows") or []),
+                cached,
+                since_path,
+                args.format,
+                cache_info,
+            )
+            if writer is not None:
+                writer.finish()
+            return status
+        cache_info = {"hit": False, "key": cache_key, "validated_by": None}
+
     try:
         with zipfile.ZipFile(workbook_path, "r") as zf:
             sheets = load_workbook_paths(zf)
@@ -231,19 +1017,7 @@ def main() -> int:
                     )
                 )
                 return 3
-            shared = load_shared_strings(zf)
-            cells = sheet_cells(zf, sheet_path, shared)
-            payload = build_payload(
-                cells=cells,
-                field_label_col=str(args.field_label_column or "B").strip().upper(),
-                field_row_start=int(args.field_row_start),
-                field_row_end=int(args.field_row_end),
-                brand_row=int(args.brand_row),
-                model_row=int(args.model_row),
-                variant_row=int(args.variant_row),
-                data_col_start=str(args.data_column_start or "C").strip().upper(),
-                data_col_end=str(args.data_column_end or "").strip().upper() or None,
-            )
+            grid, field_rows = read_sheet(zf, sheet_path, layout)
     except Exception as exc:  # pragma: no cover
         print(
             json.dumps(
@@ -255,15 +1029,30 @@ def main() -> int:
         )
         return 4
 
-    output = {
-        "ok": True,
-        "workbook_path": workbook_path,
-        "sheet": args.sheet,
-        "field_rows": payload["field_rows"],
-        "products": payload["products"],
-    }
-    print(json.dumps(output))
-    return 0
+    products: Iterable[Dict[str, object]] = layout_products(grid, field_rows, layout)
+    writer = None
+    if cache_key and cache_info is not None:
+        # Products are teed into the entry as they stream, so caching does not hold the sheet's products in memory.
+        try:
+            header = {
+                "version": SEED_CACHE_VERSION,
+                "fingerprint": {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": content_hash or file_sha256(workbook_path),
+                },
+                "workbook_path": workbook_path,
+                "sheet": args.sheet,
+                "field_rows": field_rows,
+            }
+            writer = SeedCacheWriter(cache_dir, cache_key, header, cache_info)
+            products = writer.tee(products)
+        except Exception as exc:
+            cache_info["write_error"] = str(exc)
+    status = emit_output(workbook_path, args.sheet, field_rows, products, since_path, args.format, cache_info)
+    if writer is not None:
+        writer.finish()
+    return status
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 import argparse
 import json
 import re
+import sys
+import time
 from typing import Dict, List, Sequence, Tuple
 
 
@@ -90,50 +92,112 @@ def write_json(path: str, payload: Dict) -> None:
         json.dump(payload, fh, indent=2)
 
 
-def extract_with_pdfplumber(pdf_path: str, max_pages: int, max_pairs: int, max_text_preview_chars: int) -> Dict:
-    import pdfplumber  # type: ignore
+_DOCLING_CONVERTERS: Dict[int, object] = {}
+
+
+def build_docling_converter(time_budget_ms: int):
+    from docling.document_converter import DocumentConverter  # type: ignore
+
+    if time_budget_ms <= 0:
+        return DocumentConverter(), False
+    try:
+        from docling.datamodel.base_models import InputFormat  # type: ignore
+        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+        from docling.document_converter import PdfFormatOption  # type: ignore
+
+        # docling stops at the timeout and returns the pages it finished as a partial result.
+        options = PdfPipelineOptions(document_timeout=time_budget_ms / 1000.0)
+        converter = DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=options)})
+        return converter, True
+    except Exception:
+        return DocumentConverter(), False
+
+
+def get_docling_converter(time_budget_ms: int = 0):
+    if time_budget_ms not in _DOCLING_CONVERTERS:
+        _DOCLING_CONVERTERS[time_budget_ms] = build_docling_converter(time_budget_ms)
+    return _DOCLING_CONVERTERS[time_budget_ms]
+
+
+def normalize_page_text(raw_text: str) -> Tuple[str, int]:
+    normalized_lines = [normalize(line) for line in str(raw_text or "").splitlines()]
+    normalized_lines = [line for line in normalized_lines if line]
+    return "\n".join(normalized_lines), len(normalized_lines)
+
+
+def elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
 
+def extract_pdfplumber_pages(pdf_path: str, page_numbers: Sequence[int], max_pairs: int, pdf=None) -> Dict:
+    if pdf is None:
+        import pdfplumber  # type: ignore
+
+        with pdfplumber.open(pdf_path) as opened:
+            return extract_pdfplumber_pages(pdf_path, page_numbers, max_pairs, pdf=opened)
+
+    wanted = set(int(n) for n in page_numbers)
     pages: List[Dict] = []
+    page_timings: List[Dict] = []
     all_pairs: List[Dict[str, str]] = []
-    text_preview_chunks: List[str] = []
     table_count = 0
     lines_scanned = 0
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages[:max_pages]:
-            raw_page_text = str(page.extract_text() or "")
-            normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            page_text = "\n".join(normalized_lines)
-            lines_scanned += len(normalized_lines)
-            pages.append(
-                {
-                    "page_number": page.page_number,
-                    "text": page_text[:3000],
-                }
-            )
+    for page_number in sorted(wanted):
+        if page_number < 1 or page_number > len(pdf.pages):
+            continue
+        page_started = time.monotonic()
+        page = pdf.pages[page_number - 1]
+        page_text, line_count = normalize_page_text(page.extract_text() or "")
+        lines_scanned += line_count
+        if page_text:
+            all_pairs.extend(extract_pairs_from_text(page_text, max_pairs))
+
+        try:
+            tables = page.extract_tables() or []
+        except Exception:
+            tables = []
+        table_count += len(tables)
+        for table in tables:
+            all_pairs.extend(extract_pairs_from_table(table, max_pairs))
+
+        pages.append(
+            {
+                "page_number": page_number,
+                "text": page_text[:3000],
+                "backend": "pdfplumber",
+            }
+        )
+        page_timings.append(
+            {
+                "page_number": page_number,
+                "backend": "pdfplumber",
+                "elapsed_ms": elapsed_ms(page_started),
+            }
+        )
+        if len(all_pairs) >= max_pairs * 2:
+            break
+
+    return {
+        "pages": pages,
+        "page_timings": page_timings,
+        "pairs": all_pairs,
+        "tables_found": table_count,
+        "lines_scanned": lines_scanned,
+    }
 
-            if page_text:
-                text_pairs = extract_pairs_from_text(page_text, max_pairs)
-                all_pairs.extend(text_pairs)
-                text_preview_chunks.append(page_text)
-
-            try:
-                tables = page.extract_tables() or []
-            except Exception:
-                tables = []
-
-            table_count += len(tables)
-            for table in tables:
-                table_pairs = extract_pairs_from_table(table, max_pairs)
-                all_pairs.extend(table_pairs)
-                if len(all_pairs) >= max_pairs * 2:
-                    break
-            if len(all_pairs) >= max_pairs * 2:
-                break
+
+def extract_with_pdfplumber(pdf_path: str, max_pages: int, max_pairs: int, max_text_preview_chars: int) -> Dict:
+    import pdfplumber  # type: ignore
+
+    with pdfplumber.open(pdf_path) as pdf:
+        page_total = len(pdf.pages)
+        result = extract_pdfplumber_pages(pdf_path, range(1, min(max_pages, page_total) + 1), max_pairs, pdf=pdf)
+    pages = result["pages"]
+    all_pairs = result["pairs"]
 
     deduped_pairs = dedupe_pairs(all_pairs, max_pairs)
-    text_preview = "\n".join(text_preview_chunks)[:max_text_preview_chars]
+    text_preview = "\n".join(page["text"] for page in pages if page["text"])[:max_text_preview_chars]
     return {
         "ok": True,
         "backend_used": "pdfplumber",
@@ -142,41 +206,168 @@ def extract_with_pdfplumber(pdf_path: str, max_pages: int, max_pairs: int, max_t
         "pages": pages,
         "meta": {
             "pages_scanned": len(pages),
-            "lines_scanned": lines_scanned,
-            "tables_found": table_count,
+            "lines_scanned": result["lines_scanned"],
+            "tables_found": result["tables_found"],
             "pairs_before_dedupe": len(all_pairs),
             "pairs_after_dedupe": len(deduped_pairs),
+            "page_timings": result["page_timings"],
         },
     }
 
 
-def extract_with_docling(pdf_path: str, max_pairs: int, max_text_preview_chars: int) -> Dict:
-    from docling.document_converter import DocumentConverter  # type: ignore
+def docling_pages_text(document) -> Dict[int, str]:
+    # Split one converted document back into pages using each item's provenance.
+    by_page: Dict[int, List[str]] = {}
+    iterate_items = getattr(document, "iterate_items", None)
+    if callable(iterate_items):
+        for item, _level in iterate_items():
+            text = str(getattr(item, "text", "") or "")
+            if not text:
+                continue
+            for prov in getattr(item, "prov", None) or []:
+                page_no = int(getattr(prov, "page_no", 0) or 0)
+                if page_no > 0:
+                    by_page.setdefault(page_no, []).append(text)
+                    break
+        return {page_no: "\n".join(lines) for page_no, lines in by_page.items()}
+    if hasattr(document, "export_to_text"):
+        return {1: str(document.export_to_text() or "")}
+    return {1: str(document or "")}
 
-    converter = DocumentConverter()
-    converted = converter.convert(pdf_path)
-    document = getattr(converted, "document", converted)
 
-    text_preview = ""
-    if hasattr(document, "export_to_text"):
-        text_preview = str(document.export_to_text() or "")
-    else:
-        text_preview = str(document or "")
+def docling_converted_pages(document, page_text: Dict[int, str]) -> List[int]:
+    pages = getattr(document, "pages", None)
+    if isinstance(pages, dict) and pages:
+        return sorted(int(page_no) for page_no in pages.keys())
+    return sorted(page_text.keys())
+
+
+def extract_with_docling(
+    pdf_path: str,
+    max_pages: int,
+    max_pairs: int,
+    max_text_preview_chars: int,
+    docling_max_pages: int = 0,
+    time_budget_ms: int = 0,
+) -> Dict:
+    started = time.monotonic()
+    converter_reused = time_budget_ms in _DOCLING_CONVERTERS
+    converter, time_budget_enforced = get_docling_converter(time_budget_ms)
+
+    docling_last_page = min(max_pages, docling_max_pages) if docling_max_pages > 0 else max_pages
+
+    pages: List[Dict] = []
+    page_timings: List[Dict] = []
+    all_pairs: List[Dict[str, str]] = []
+    fallback_pages: List[int] = []
+    fallback_reasons: Dict[str, str] = {}
+    errors: List[str] = []
+    lines_scanned = 0
+    page_total = 0
+    docling_failed = False
+    timed_out = False
+
+    page_text_by_number: Dict[int, str] = {}
+    converted_pages: List[int] = []
+    try:
+        converted = converter.convert(pdf_path, page_range=(1, docling_last_page))
+        document = getattr(converted, "document", converted)
+        page_total = int(getattr(getattr(converted, "input", None), "page_count", 0) or 0)
+        status = str(getattr(converted, "status", "") or "").lower()
+        timed_out = time_budget_enforced and "partial" in status
+        page_text_by_number = docling_pages_text(document)
+        converted_pages = docling_converted_pages(document, page_text_by_number)
+    except Exception as exc:
+        docling_failed = True
+        errors.append(f"docling_failed: {exc}")
+    convert_ms = elapsed_ms(started)
+
+    if page_total <= 0:
+        page_total = max(converted_pages) if converted_pages and not docling_failed else 0
+    last_page = min(max_pages, page_total) if page_total > 0 else max_pages
+    per_page_ms = convert_ms // max(1, len(converted_pages))
+
+    for page_number in range(1, last_page + 1):
+        if page_number > docling_last_page:
+            fallback_pages.append(page_number)
+            fallback_reasons[str(page_number)] = "page_range_exceeded"
+            continue
+        if page_number not in converted_pages:
+            fallback_pages.append(page_number)
+            if docling_failed:
+                fallback_reasons[str(page_number)] = "docling_failed"
+            elif timed_out:
+                fallback_reasons[str(page_number)] = "time_budget_exceeded"
+            else:
+                fallback_reasons[str(page_number)] = "docling_page_failed"
+            continue
 
-    pairs = extract_pairs_from_text(text_preview, max_pairs)
-    deduped_pairs = dedupe_pairs(pairs, max_pairs)
+        page_text, line_count = normalize_page_text(page_text_by_number.get(page_number, ""))
+        lines_scanned += line_count
+        if page_text:
+            all_pairs.extend(extract_pairs_from_text(page_text, max_pairs))
+        pages.append(
+            {
+                "page_number": page_number,
+                "text": page_text[:3000],
+                "backend": "docling",
+            }
+        )
+        page_timings.append(
+            {
+                "page_number": page_number,
+                "backend": "docling",
+                "elapsed_ms": per_page_ms,
+            }
+        )
+
+    tables_found = 0
+    if fallback_pages:
+        try:
+            fallback = extract_pdfplumber_pages(pdf_path, fallback_pages, max_pairs)
+            pages.extend(fallback["pages"])
+            page_timings.extend(fallback["page_timings"])
+            all_pairs.extend(fallback["pairs"])
+            lines_scanned += fallback["lines_scanned"]
+            tables_found += fallback["tables_found"]
+        except Exception as exc:
+            errors.append(f"pdfplumber_page_fallback_failed: {exc}")
+
+    if not pages and errors:
+        raise RuntimeError(errors[0])
+
+    if page_total <= 0:
+        # Page count came from neither backend; drop fallback entries for pages that do not exist.
+        present = {page["page_number"] for page in pages}
+        fallback_pages = [page_number for page_number in fallback_pages if page_number in present]
+        fallback_reasons = {key: value for key, value in fallback_reasons.items() if int(key) in present}
+
+    pages.sort(key=lambda page: page["page_number"])
+    page_timings.sort(key=lambda row: row["page_number"])
+    text_preview = "\n".join(page["text"] for page in pages if page["text"])
+
+    deduped_pairs = dedupe_pairs(all_pairs, max_pairs)
     return {
         "ok": True,
         "backend_used": "docling",
         "pairs": deduped_pairs,
         "text_preview": text_preview[:max_text_preview_chars],
-        "pages": [],
+        "pages": pages,
+        "errors": errors,
         "meta": {
-            "pages_scanned": 0,
-            "lines_scanned": len(text_preview.splitlines()),
-            "tables_found": 0,
-            "pairs_before_dedupe": len(pairs),
+            "pages_scanned": len(pages),
+            "lines_scanned": lines_scanned,
+            "tables_found": tables_found,
+            "pairs_before_dedupe": len(all_pairs),
             "pairs_after_dedupe": len(deduped_pairs),
+            "page_timings": page_timings,
+            "docling_pages": [row["page_number"] for row in page_timings if row["backend"] == "docling"],
+            "docling_convert_ms": convert_ms,
+            "fallback_pages": sorted(fallback_pages),
+            "fallback_reasons": fallback_reasons,
+            "converter_reused": converter_reused,
+            "time_budget_enforced": time_budget_enforced,
+            "elapsed_ms": elapsed_ms(started),
         },
     }
 
@@ -188,22 +379,23 @@ def parse_backend(value: str) -> str:
     return "auto"
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Extract structured key/value candidates from PDF text using docling/pdfplumber."
-    )
-    parser.add_argument("--pdf", required=True)
-    parser.add_argument("--out", required=True)
-    parser.add_argument("--backend", default="auto", help="auto|docling|pdfplumber")
-    parser.add_argument("--max-pages", type=int, default=60)
-    parser.add_argument("--max-text-preview-chars", type=int, default=20000)
-    parser.add_argument("--max-pairs", type=int, default=5000)
-    args = parser.parse_args()
-
-    backend = parse_backend(args.backend)
-    max_pages = max(1, int(args.max_pages))
-    max_text_preview_chars = max(1000, int(args.max_text_preview_chars))
-    max_pairs = max(100, int(args.max_pairs))
+def run_job(
+    *,
+    pdf_path: str,
+    out_path: str,
+    backend: str,
+    max_pages: int,
+    max_text_preview_chars: int,
+    max_pairs: int,
+    docling_max_pages: int,
+    docling_time_budget_ms: int,
+) -> Dict:
+    backend = parse_backend(backend)
+    max_pages = max(1, int(max_pages))
+    max_text_preview_chars = max(1000, int(max_text_preview_chars))
+    max_pairs = max(100, int(max_pairs))
+    docling_max_pages = max(0, int(docling_max_pages))
+    docling_time_budget_ms = max(0, int(docling_time_budget_ms))
 
     attempted = []
     payload = None
@@ -211,7 +403,14 @@ def main() -> int:
     if backend in {"auto", "docling"}:
         attempted.append("docling")
         try:
-            payload = extract_with_docling(args.pdf, max_pairs, max_text_preview_chars)
+            payload = extract_with_docling(
+                pdf_path,
+                max_pages,
+                max_pairs,
+                max_text_preview_chars,
+                docling_max_pages=docling_max_pages,
+                time_budget_ms=docling_time_budget_ms,
+            )
         except Exception as exc:
             if backend == "docling":
                 payload = {
@@ -228,7 +427,7 @@ def main() -> int:
     if payload is None and backend in {"auto", "pdfplumber"}:
         attempted.append("pdfplumber")
         try:
-            payload = extract_with_pdfplumber(args.pdf, max_pages, max_pairs, max_text_preview_chars)
+            payload = extract_with_pdfplumber(pdf_path, max_pages, max_pairs, max_text_preview_chars)
         except Exception as exc:
             payload = {
                 "ok": False,
@@ -251,16 +450,87 @@ def main() -> int:
 
     payload["backend_requested"] = backend
     payload["backend_attempted"] = attempted
-    write_json(args.out, payload)
-    print(
-        json.dumps(
-            {
-                "ok": bool(payload.get("ok")),
-                "pairs": len(payload.get("pairs", [])),
-                "backend_used": payload.get("backend_used"),
-            }
-        )
+    write_json(out_path, payload)
+    return {
+        "ok": bool(payload.get("ok")),
+        "pairs": len(payload.get("pairs", [])),
+        "backend_used": payload.get("backend_used"),
+    }
+
+
+def serve(defaults: argparse.Namespace) -> int:
+    # Long-lived mode: one JSON job per stdin line, sharing a warm docling converter.
+    for raw_line in sys.stdin:
+        line = raw_line.strip()
+        if not line:
+            continue
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.get("id")
+            summary = run_job(
+                pdf_path=str(job["pdf"]),
+                out_path=str(job["out"]),
+                backend=str(job.get("backend", defaults.backend)),
+                max_pages=int(job.get("max_pages", defaults.max_pages)),
+                max_text_preview_chars=int(job.get("max_text_preview_chars", defaults.max_text_preview_chars)),
+                max_pairs=int(job.get("max_pairs", defaults.max_pairs)),
+                docling_max_pages=int(job.get("docling_max_pages", defaults.docling_max_pages)),
+                docling_time_budget_ms=int(job.get("docling_time_budget_ms", defaults.docling_time_budget_ms)),
+            )
+        except Exception as exc:
+            summary = {"ok": False, "error": f"job_failed: {exc}"}
+        if job_id is not None:
+            summary["id"] = job_id
+        sys.stdout.write(json.dumps(summary) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Extract structured key/value candidates from PDF text using docling/pdfplumber."
+    )
+    parser.add_argument("--pdf", default="")
+    parser.add_argument("--out", default="")
+    parser.add_argument("--backend", default="auto", help="auto|docling|pdfplumber")
+    parser.add_argument("--max-pages", type=int, default=60)
+    parser.add_argument("--max-text-preview-chars", type=int, default=20000)
+    parser.add_argument("--max-pairs", type=int, default=5000)
+    parser.add_argument(
+        "--docling-max-pages",
+        type=int,
+        default=0,
+        help="pages beyond this are extracted with pdfplumber (0 = same as --max-pages)",
+    )
+    parser.add_argument(
+        "--docling-time-budget-ms",
+        type=int,
+        default=0,
+        help="docling conversion timeout; pages it did not finish are extracted with pdfplumber (0 = unlimited)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="read JSON jobs ({id, pdf, out, ...}) from stdin, one per line, reusing the docling converter",
+    )
+    args = parser.parse_args()
+    if args.serve:
+        return serve(args)
+    if not args.pdf or not args.out:
+        parser.error("--pdf and --out are required unless --serve is set")
+
+    summary = run_job(
+        pdf_path=args.pdf,
+        out_path=args.out,
+        backend=args.backend,
+        max_pages=args.max_pages,
+        max_text_preview_chars=args.max_text_preview_chars,
+        max_pairs=args.max_pairs,
+        docling_max_pages=args.docling_max_pages,
+        docling_time_budget_ms=args.docling_time_budget_ms,
     )
+    print(json.dumps(summary))
     return 0
 
 
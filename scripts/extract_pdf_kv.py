@@ -1,8 +1,19 @@
 ﻿#!/usr/bin/env python3
 import argparse
+import hashlib
 import json
+import os
 import re
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 def normalize(value: str) -> str:
@@ -100,6 +111,126 @@ def pair_is_valid(key: str, value: str) -> bool:
     return True
 
 
+PAIR_TABLE_SURFACES = {"pdf_table", "scanned_pdf_ocr_table"}
+PAIR_SURFACES = PAIR_TABLE_SURFACES | {"pdf_kv", "scanned_pdf_ocr_kv"}
+
+
+class PairRecord:
+    """Compact pair kept through extraction, dedupe and split.
+
+    ``path``, ``row_id`` and ``unit_hint`` are derived only when the pair is serialized,
+    so pairs dropped by dedupe never pay for the string formatting.
+    """
+
+    __slots__ = (
+        "key",
+        "value",
+        "raw_key",
+        "raw_value",
+        "page",
+        "row",
+        "surface",
+        "backend",
+        "table_id",
+        "section_header",
+        "column_header",
+        "bbox",
+        "ocr_confidence",
+        "ocr_low_confidence",
+        "quantity",
+        "field_candidates",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        value: str,
+        raw_key: str,
+        raw_value: str,
+        page: int,
+        row: int,
+        surface: str,
+        backend: str,
+        table_id: str,
+        section_header: str,
+        column_header: str,
+        bbox: Optional[Dict[str, float]],
+        ocr_confidence: Optional[float],
+        ocr_low_confidence: bool,
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.raw_key = raw_key
+        self.raw_value = raw_value
+        self.page = page
+        self.row = row
+        self.surface = surface
+        self.backend = backend
+        self.table_id = table_id
+        self.section_header = section_header
+        self.column_header = column_header
+        self.bbox = bbox
+        self.ocr_confidence = ocr_confidence
+        self.ocr_low_confidence = ocr_low_confidence
+        self.quantity: Optional[Tuple[Optional[float], float, float, str]] = None
+        self.field_candidates: Optional[List[str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        page = self.page
+        row = self.row
+        table_token = self.table_id or f"t{page}"
+        surface = self.surface
+        if surface == "pdf_table":
+            path = f"pdf.page[{page}].table[{table_token}].row[{row}]"
+            row_id = f"pdf_{page:02d}.tr_{row:04d}"
+        elif surface == "scanned_pdf_ocr_table":
+            path = f"scanned_pdf.page[{page}].table[{table_token}].row[{row}]"
+            row_id = f"sc_pdf_{page:02d}.ocr_tr_{row:04d}"
+        elif surface == "scanned_pdf_ocr_kv":
+            path = f"scanned_pdf.page[{page}].kv[{row}]"
+            row_id = f"sc_pdf_{page:02d}.ocr_kv_{row:04d}"
+        else:
+            path = f"pdf.page[{page}].kv[{row}]"
+            row_id = f"pdf_{page:02d}.kv_{row:04d}"
+        return {
+            "key": self.key,
+            "value": self.value,
+            "raw_key": self.raw_key,
+            "raw_value": self.raw_value,
+            "normalized_key": self.key,
+            "normalized_value": self.value,
+            "table_id": self.table_id or None,
+            "row_id": row_id,
+            "section_header": self.section_header or None,
+            "column_header": self.column_header or None,
+            "unit_hint": infer_unit_hint(self.key, self.value) or None,
+            "surface": surface,
+            "path": path,
+            "page": page,
+            "bbox": self.bbox,
+            "backend": self.backend,
+            "ocr_confidence": self.ocr_confidence,
+            "ocr_low_confidence": self.ocr_low_confidence,
+            "numeric_value": self.quantity[0] if self.quantity else None,
+            "numeric_min": self.quantity[1] if self.quantity else None,
+            "numeric_max": self.quantity[2] if self.quantity else None,
+            "canonical_unit": (self.quantity[3] or None) if self.quantity else None,
+            "field_candidates": self.field_candidates,
+        }
+
+
+@lru_cache(maxsize=64)
+def pair_backend_token(backend: str) -> str:
+    token = normalize_backend(backend)
+    return token if token != "auto" else normalize(str(backend or "")).lower()
+
+
+@lru_cache(maxsize=16)
+def pair_surface_token(surface: str) -> str:
+    token = normalize(surface).lower()
+    return token if token in PAIR_SURFACES else "pdf_kv"
+
+
 def build_pair_record(
     *,
     key: str,
@@ -114,58 +245,153 @@ def build_pair_record(
     bbox: Optional[Dict[str, float]] = None,
     ocr_confidence: Optional[float] = None,
     ocr_low_confidence: bool = False,
-) -> Dict[str, Any]:
-    normalized_key = normalize(key)
-    normalized_value = normalize(value)
-    requested_surface = normalize(surface).lower()
-    if requested_surface in {"pdf_table", "scanned_pdf_ocr_table"}:
-        surface_token = requested_surface
-    elif requested_surface in {"pdf_kv", "scanned_pdf_ocr_kv"}:
-        surface_token = requested_surface
-    else:
-        surface_token = "pdf_kv"
-    page = max(1, int(page_number or 1))
-    row = max(1, int(row_index or 1))
-    table_token = normalize(table_id)
-
-    if surface_token == "pdf_table":
-        path = f"pdf.page[{page}].table[{table_token or f't{page}'}].row[{row}]"
-    elif surface_token == "scanned_pdf_ocr_table":
-        path = f"scanned_pdf.page[{page}].table[{table_token or f't{page}'}].row[{row}]"
-    elif surface_token == "scanned_pdf_ocr_kv":
-        path = f"scanned_pdf.page[{page}].kv[{row}]"
-    else:
-        path = f"pdf.page[{page}].kv[{row}]"
-
-    if surface_token == "pdf_table":
-        row_id = f"pdf_{page:02d}.tr_{row:04d}"
-    elif surface_token == "scanned_pdf_ocr_table":
-        row_id = f"sc_pdf_{page:02d}.ocr_tr_{row:04d}"
-    elif surface_token == "scanned_pdf_ocr_kv":
-        row_id = f"sc_pdf_{page:02d}.ocr_kv_{row:04d}"
-    else:
-        row_id = f"pdf_{page:02d}.kv_{row:04d}"
+) -> PairRecord:
+    return PairRecord(
+        normalize(key),
+        normalize(value),
+        key,
+        value,
+        max(1, int(page_number or 1)),
+        max(1, int(row_index or 1)),
+        pair_surface_token(surface),
+        pair_backend_token(backend),
+        normalize(table_id) if table_id else "",
+        normalize(section_header) if section_header else "",
+        normalize(column_header) if column_header else "",
+        bbox if bbox and isinstance(bbox, dict) else None,
+        float(ocr_confidence) if ocr_confidence is not None else None,
+        bool(ocr_low_confidence),
+    )
 
-    return {
-        "key": normalized_key,
-        "value": normalized_value,
-        "raw_key": key,
-        "raw_value": value,
-        "normalized_key": normalized_key,
-        "normalized_value": normalized_value,
-        "table_id": table_token or None,
-        "row_id": row_id,
-        "section_header": normalize(section_header) or None,
-        "column_header": normalize(column_header) or None,
-        "unit_hint": infer_unit_hint(normalized_key, normalized_value) or None,
-        "surface": surface_token,
-        "path": path,
-        "page": page,
-        "bbox": bbox if bbox and isinstance(bbox, dict) else None,
-        "backend": normalize_backend(backend) if normalize_backend(backend) != "auto" else normalize(str(backend or "")).lower(),
-        "ocr_confidence": float(ocr_confidence) if ocr_confidence is not None else None,
-        "ocr_low_confidence": bool(ocr_low_confidence),
-    }
+
+QUANTITY_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+# One match per line, anchored at the line start, so a whole page of values is scanned in a single finditer.
+QUANTITY_LINE_RE = re.compile(
+    r"^(?:(?:up to|upto|approx\.?|approximately|about|max\.?|min\.?|~|<|>|\u2264|\u2265)[ \t]*)?"
+    rf"(?P<low>{QUANTITY_NUMBER})[ \t]*(?P<low_unit>(?!to\b)[A-Za-z\"]+)?"
+    rf"(?:[ \t]*(?:-|\u2013|\u2014|~|to)[ \t]*(?P<high>{QUANTITY_NUMBER})[ \t]*(?P<unit>[A-Za-z\"]+)?)?"
+    r"(?![A-Za-z0-9.,])[^\n]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+QUANTITY_DIMENSION_RE = re.compile(r"\d\s*[x\u00d7]\s*\d", re.IGNORECASE)
+# Dates ("2020-01-05", "05/01/2020") and "2 in 1" / "3-in-1" product names read like ranges and inches.
+QUANTITY_NOT_QUANTITY_RE = re.compile(
+    r"^\s*(?:\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}|\d+[ \t]*-?[ \t]*in[ \t]*-?[ \t]*\d)",
+    re.IGNORECASE,
+)
+QUANTITY_UNITS: Dict[str, Tuple[str, float]] = {
+    "g": ("g", 1.0),
+    "gram": ("g", 1.0),
+    "grams": ("g", 1.0),
+    "kg": ("g", 1000.0),
+    "oz": ("g", 28.349523),
+    "ounce": ("g", 28.349523),
+    "ounces": ("g", 28.349523),
+    "lb": ("g", 453.59237),
+    "lbs": ("g", 453.59237),
+    "pound": ("g", 453.59237),
+    "pounds": ("g", 453.59237),
+    "mm": ("mm", 1.0),
+    "cm": ("mm", 10.0),
+    "m": ("mm", 1000.0),
+    "in": ("mm", 25.4),
+    "inch": ("mm", 25.4),
+    "inches": ("mm", 25.4),
+    '"': ("mm", 25.4),
+    "dpi": ("dpi", 1.0),
+    "cpi": ("dpi", 1.0),
+    "hz": ("hz", 1.0),
+    "khz": ("hz", 1000.0),
+    "mhz": ("hz", 1000000.0),
+    "ghz": ("hz", 1000000000.0),
+    "mah": ("mah", 1.0),
+    "h": ("h", 1.0),
+    "hr": ("h", 1.0),
+    "hrs": ("h", 1.0),
+    "hour": ("h", 1.0),
+    "hours": ("h", 1.0),
+    "min": ("h", 1.0 / 60.0),
+    "mins": ("h", 1.0 / 60.0),
+    "minute": ("h", 1.0 / 60.0),
+    "minutes": ("h", 1.0 / 60.0),
+    "ms": ("ms", 1.0),
+    "ips": ("ips", 1.0),
+}
+
+
+def quantity_from_match(key: str, match: Any) -> Optional[Tuple[Optional[float], float, float, str]]:
+    """Turn a QUANTITY_LINE_RE match into (value, min, max, canonical_unit); value is None for ranges.
+
+    Only bare numbers and units listed in QUANTITY_UNITS produce a quantity; "5 buttons" does not.
+    """
+    if QUANTITY_DIMENSION_RE.search(match.group(0)):
+        # "127 x 64 x 40 mm" is a tuple, not a single quantity.
+        return None
+    if QUANTITY_NOT_QUANTITY_RE.search(match.group(0)):
+        return None
+    low = float(match.group("low").replace(",", ""))
+    high_token = match.group("high")
+    high = float(high_token.replace(",", "")) if high_token else low
+    raw_unit = (match.group("unit") or match.group("low_unit") or "").lower()
+    if raw_unit and raw_unit not in QUANTITY_UNITS:
+        return None
+    unit, factor = QUANTITY_UNITS.get(raw_unit, ("", 1.0))
+    if unit == "g" and "acceleration" in key.lower():
+        unit, factor = "g_force", 1.0
+    low = round(low * factor, 4)
+    high = round(high * factor, 4)
+    if high < low:
+        low, high = high, low
+    return (low if low == high else None, low, high, unit)
+
+
+def parse_quantity(key: str, value: str) -> Optional[Tuple[Optional[float], float, float, str]]:
+    match = QUANTITY_LINE_RE.search(value)
+    return quantity_from_match(key, match) if match else None
+
+
+def normalize_pair_quantities(pairs: Sequence[PairRecord]) -> int:
+    """Fill ``quantity`` on every pair, scanning each page's distinct values as one text block.
+
+    Returns the number of pairs that carry a parsed quantity.
+    """
+    by_page: Dict[int, List[PairRecord]] = {}
+    for pair in pairs:
+        by_page.setdefault(pair.page, []).append(pair)
+    parsed = 0
+    for page_pairs in by_page.values():
+        lines: List[str] = []
+        line_of: Dict[Tuple[str, str], int] = {}
+        for pair in page_pairs:
+            signature = (pair.key, pair.value)
+            if signature not in line_of:
+                line_of[signature] = len(lines)
+                lines.append(pair.value.replace("\n", " "))
+        offsets: Dict[int, int] = {}
+        cursor = 0
+        for idx, line in enumerate(lines):
+            offsets[cursor] = idx
+            cursor += len(line) + 1
+        keys = list(line_of)
+        results: List[Optional[Tuple[Optional[float], float, float, str]]] = [None] * len(lines)
+        for match in QUANTITY_LINE_RE.finditer("\n".join(lines)):
+            idx = offsets.get(match.start())
+            if idx is not None:
+                results[idx] = quantity_from_match(keys[idx][0], match)
+        for pair in page_pairs:
+            pair.quantity = results[line_of[(pair.key, pair.value)]]
+            parsed += 1 if pair.quantity else 0
+    return parsed
+
+
+def serialize_pairs(
+    pairs: Sequence[PairRecord],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Materialize pairs once for the JSON payload; returns (pairs, kv_pairs, table_pairs) sharing the dicts."""
+    rows = [pair.to_dict() for pair in pairs]
+    kv_rows = [row for row in rows if row["surface"] not in PAIR_TABLE_SURFACES]
+    table_rows = [row for row in rows if row["surface"] in PAIR_TABLE_SURFACES]
+    return rows, kv_rows, table_rows
 
 
 def extract_pairs_from_text(
@@ -178,8 +404,8 @@ def extract_pairs_from_text(
     surface: str = "pdf_kv",
     ocr_confidence: Optional[float] = None,
     ocr_low_confidence: bool = False,
-) -> Tuple[List[Dict[str, Any]], int]:
-    pairs: List[Dict[str, Any]] = []
+) -> Tuple[List[PairRecord], int]:
+    pairs: List[PairRecord] = []
     row_index = max(0, int(start_index or 0))
     for raw_line in str(text or "").splitlines():
         key, value = parse_line_pair(raw_line)
@@ -202,6 +428,59 @@ def extract_pairs_from_text(
     return pairs, row_index
 
 
+MODEL_HEADER_CORNER_TOKENS = {
+    "",
+    "model",
+    "models",
+    "product",
+    "products",
+    "variant",
+    "version",
+    "specification",
+    "specifications",
+    "spec",
+    "specs",
+    "feature",
+    "features",
+}
+
+
+def cell_looks_like_model_name(cell: str) -> bool:
+    if not cell or len(cell) > 48 or ":" in cell:
+        return False
+    if not re.search(r"[A-Za-z]", cell):
+        return False
+    # "54 g" or "26000 DPI" is a value row, not a model header.
+    return not (re.search(r"\d", cell) and infer_unit_hint(cell, ""))
+
+
+def detect_model_header(table: Sequence[Sequence[str]]) -> Tuple[int, List[str]]:
+    """Find a comparison-table header row: corner cell blank or generic, then one model name per column.
+
+    Returns (header_row_index, column_names) with "" for columns that carry no model, or (-1, []).
+    """
+    for row_idx, row in enumerate(list(table or [])[:2]):
+        cells = [normalize(cell or "") for cell in row or []]
+        if len(cells) < 3:
+            continue
+        models = cells[1:]
+        named = [cell for cell in models if cell]
+        if cells[0].rstrip(":").lower() not in MODEL_HEADER_CORNER_TOKENS:
+            continue
+        if len(named) < 2 or len(set(cell.lower() for cell in named)) != len(named):
+            continue
+        if not all(cell_looks_like_model_name(cell) for cell in named):
+            continue
+        if any(cell.lower() in LAYOUT_HEADER_TOKENS for cell in named):
+            continue
+        body = [[normalize(cell or "") for cell in body_row or []] for body_row in list(table)[row_idx + 1 :]]
+        # At least one body row must fill two or more model columns, otherwise it is just a labelled list.
+        if not any(sum(1 for cell in body_row[1:] if cell) >= 2 for body_row in body):
+            continue
+        return row_idx, [""] + models
+    return -1, []
+
+
 def extract_pairs_from_table(
     *,
     table: Sequence[Sequence[str]],
@@ -213,10 +492,46 @@ def extract_pairs_from_table(
     surface: str = "pdf_table",
     ocr_confidence: Optional[float] = None,
     ocr_low_confidence: bool = False,
-) -> Tuple[List[Dict[str, Any]], int]:
-    pairs: List[Dict[str, Any]] = []
+    pivot: bool = False,
+) -> Tuple[List[PairRecord], int]:
+    """Rows become key/value pairs; with ``pivot`` a model header row yields one pair per (row, model column)."""
+    pairs: List[PairRecord] = []
     row_index = max(0, int(start_index or 0))
-    for row in table or []:
+    header_idx, column_names = detect_model_header(table) if pivot else (-1, [])
+    for table_row_idx, row in enumerate(table or []):
+        if header_idx >= 0:
+            if table_row_idx <= header_idx:
+                continue
+            cells = [normalize(cell or "") for cell in row or []]
+            key = cells[0] if cells else ""
+            filled = [(col, cell) for col, cell in enumerate(cells[1:], start=1) if cell]
+            if len(filled) == 1 and filled[0][0] == 1 and len(column_names) > 2:
+                # A lone value under the first model is a merged cell spanning the family.
+                targets = [("", filled[0][1])]
+            else:
+                targets = [(column_names[col] if col < len(column_names) else "", cell) for col, cell in filled]
+            for column_header, value in targets:
+                if not pair_is_valid(key, value):
+                    continue
+                row_index += 1
+                pairs.append(
+                    build_pair_record(
+                        key=key,
+                        value=value,
+                        page_number=page_number,
+                        surface=surface,
+                        backend=backend,
+                        row_index=row_index,
+                        table_id=table_id,
+                        column_header=column_header,
+                        ocr_confidence=ocr_confidence,
+                        ocr_low_confidence=ocr_low_confidence,
+                    )
+                )
+                if len(pairs) >= limit:
+                    return pairs, row_index
+            continue
+
         cells = [normalize(cell or "") for cell in row or []]
         cells = [cell for cell in cells if cell]
         if len(cells) < 2:
@@ -244,16 +559,302 @@ def extract_pairs_from_table(
     return pairs, row_index
 
 
-def dedupe_pairs(pairs: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
-    seen = set()
+LAYOUT_HEADER_TOKENS = {
+    "specification",
+    "specifications",
+    "spec",
+    "specs",
+    "feature",
+    "features",
+    "parameter",
+    "parameters",
+    "item",
+    "value",
+    "values",
+    "description",
+    "details",
+}
+
+
+def words_from_pdfplumber(page: Any) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
+    for word in page.extract_words(keep_blank_chars=False, use_text_flow=False) or []:
+        text = normalize(str(word.get("text") or ""))
+        if not text:
+            continue
+        out.append(
+            {
+                "text": text,
+                "x0": float(word.get("x0") or 0.0),
+                "y0": float(word.get("top") or 0.0),
+                "x1": float(word.get("x1") or 0.0),
+                "y1": float(word.get("bottom") or 0.0),
+            }
+        )
+    return out
 
+
+def words_from_pymupdf(page: Any) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for word in page.get_text("words") or []:
+        text = normalize(str(word[4] if len(word) > 4 else ""))
+        if not text:
+            continue
+        out.append(
+            {
+                "text": text,
+                "x0": float(word[0]),
+                "y0": float(word[1]),
+                "x1": float(word[2]),
+                "y1": float(word[3]),
+            }
+        )
+    return out
+
+
+def group_words_into_segments(words: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Cluster words into lines, then split each line into phrases at wide horizontal gaps."""
+    ordered = sorted(words, key=lambda w: (w["y0"], w["x0"]))
+    lines: List[List[Dict[str, Any]]] = []
+    line_center = 0.0
+    line_height = 0.0
+    for word in ordered:
+        height = max(1.0, word["y1"] - word["y0"])
+        center = (word["y0"] + word["y1"]) / 2.0
+        if lines and abs(center - line_center) <= max(height, line_height) * 0.5:
+            lines[-1].append(word)
+            count = len(lines[-1])
+            line_center += (center - line_center) / count
+            line_height = max(line_height, height)
+        else:
+            lines.append([word])
+            line_center = center
+            line_height = height
+
+    out: List[List[Dict[str, Any]]] = []
+    for line in lines:
+        line.sort(key=lambda w: w["x0"])
+        height = max(1.0, max(w["y1"] - w["y0"] for w in line))
+        gap_threshold = max(6.0, height * 1.2)
+        segments: List[Dict[str, Any]] = []
+        current: List[Dict[str, Any]] = []
+        for word in line:
+            if current and word["x0"] - current[-1]["x1"] > gap_threshold:
+                segments.append(merge_word_boxes(current))
+                current = []
+            current.append(word)
+        if current:
+            segments.append(merge_word_boxes(current))
+        out.append(segments)
+    return out
+
+
+def merge_word_boxes(words: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "text": normalize(" ".join(w["text"] for w in words)),
+        "x0": min(w["x0"] for w in words),
+        "y0": min(w["y0"] for w in words),
+        "x1": max(w["x1"] for w in words),
+        "y1": max(w["y1"] for w in words),
+    }
+
+
+def build_spatial_index(segments: Sequence[Dict[str, Any]], cell_size: float) -> Dict[Tuple[int, int], List[int]]:
+    index: Dict[Tuple[int, int], List[int]] = {}
+    for seg_id, seg in enumerate(segments):
+        for gx in range(int(seg["x0"] // cell_size), int(seg["x1"] // cell_size) + 1):
+            for gy in range(int(seg["y0"] // cell_size), int(seg["y1"] // cell_size) + 1):
+                index.setdefault((gx, gy), []).append(seg_id)
+    return index
+
+
+def query_spatial_index(
+    index: Dict[Tuple[int, int], List[int]],
+    cell_size: float,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+) -> List[int]:
+    found = set()
+    for gx in range(int(x0 // cell_size), int(x1 // cell_size) + 1):
+        for gy in range(int(y0 // cell_size), int(y1 // cell_size) + 1):
+            found.update(index.get((gx, gy), ()))
+    return sorted(found)
+
+
+def segment_looks_like_label(text: str) -> bool:
+    label = text.rstrip(":").strip()
+    if len(label) < 2 or len(label) > 60 or ":" in label:
+        return False
+    if len(label.split()) > 6:
+        return False
+    if label.endswith("."):
+        return False
+    letters = len(re.findall(r"[A-Za-z]", label))
+    digits = len(re.findall(r"[0-9]", label))
+    return letters >= 2 and letters >= digits
+
+
+def line_is_column_header(segments: Sequence[Dict[str, Any]]) -> bool:
+    if len(segments) < 2:
+        return False
+    if any(re.search(r"[0-9]", seg["text"]) for seg in segments):
+        return False
+    if len(segments) >= 3:
+        return all(len(seg["text"]) <= 30 for seg in segments)
+    return all(seg["text"].rstrip(":").lower() in LAYOUT_HEADER_TOKENS for seg in segments)
+
+
+def extract_layout_pairs_from_words(
+    *,
+    words: Sequence[Dict[str, Any]],
+    limit: int,
+    page_number: int,
+    backend: str,
+    start_index: int = 0,
+    surface: str = "pdf_kv",
+) -> Tuple[List[PairRecord], int]:
+    """Pair labels with values to their right (same row) or directly below, using word geometry.
+
+    Segments are bucketed in a uniform grid so each neighbour lookup touches only
+    a few cells, keeping the whole page close to linear in the number of words.
+    """
+    pairs: List[PairRecord] = []
+    row_index = max(0, int(start_index or 0))
+    lines = group_words_into_segments(words)
+    segments: List[Dict[str, Any]] = []
+    line_of: List[int] = []
+    line_sizes: List[int] = []
+    for line_id, line in enumerate(lines):
+        line_sizes.append(len(line))
+        for seg in line:
+            segments.append(seg)
+            line_of.append(line_id)
+    if len(segments) < 2:
+        return pairs, row_index
+
+    heights = sorted(max(1.0, seg["y1"] - seg["y0"]) for seg in segments)
+    median_height = heights[len(heights) // 2]
+    cell_size = max(24.0, median_height * 4.0)
+    index = build_spatial_index(segments, cell_size)
+    max_right_gap = median_height * 30.0
+    max_below_gap = median_height * 1.6
+
+    consumed = [False] * len(segments)
+    header_lines = {line_id for line_id, line in enumerate(lines) if line_is_column_header(line)}
+    column_headers: List[Dict[str, Any]] = []
+    section_header = ""
+    seg_id = 0
+    for line_id, line in enumerate(lines):
+        line_start = seg_id
+        seg_id += len(line)
+        if line_id in header_lines:
+            column_headers = list(line[1:])
+            for offset in range(len(line)):
+                consumed[line_start + offset] = True
+            continue
+        for offset in range(len(line)):
+            label_id = line_start + offset
+            if consumed[label_id]:
+                continue
+            label = segments[label_id]
+            if not segment_looks_like_label(label["text"]):
+                continue
+
+            height = max(1.0, label["y1"] - label["y0"])
+            best_id = -1
+            best_distance = 0.0
+            for cand_id in query_spatial_index(
+                index, cell_size, label["x1"], label["y0"], label["x1"] + max_right_gap, label["y1"]
+            ):
+                cand = segments[cand_id]
+                if cand_id == label_id or consumed[cand_id] or cand["x0"] < label["x1"]:
+                    continue
+                overlap = min(label["y1"], cand["y1"]) - max(label["y0"], cand["y0"])
+                if overlap < 0.5 * min(height, cand["y1"] - cand["y0"]):
+                    continue
+                distance = cand["x0"] - label["x1"]
+                if distance <= max_right_gap and (best_id < 0 or distance < best_distance):
+                    best_id = cand_id
+                    best_distance = distance
+
+            if best_id < 0 and line_sizes[line_id] == 1 and len(label["text"].split()) <= 5:
+                for cand_id in query_spatial_index(
+                    index, cell_size, label["x0"], label["y1"], label["x1"], label["y1"] + max_below_gap
+                ):
+                    cand = segments[cand_id]
+                    if cand_id == label_id or consumed[cand_id] or line_sizes[line_of[cand_id]] != 1:
+                        continue
+                    if cand["y0"] < label["y1"] - 0.25 * height or len(cand["text"]) > 80 or ":" in cand["text"]:
+                        continue
+                    if min(label["x1"], cand["x1"]) - max(label["x0"], cand["x0"]) <= 0:
+                        continue
+                    # Stacked label/label lines are ambiguous; only accept values that cannot be a label.
+                    if not label["text"].endswith(":") and segment_looks_like_label(cand["text"]) and not re.search(
+                        r"[0-9]", cand["text"]
+                    ):
+                        continue
+                    distance = cand["y0"] - label["y1"]
+                    if distance <= max_below_gap and (best_id < 0 or distance < best_distance):
+                        best_id = cand_id
+                        best_distance = distance
+
+            if best_id < 0:
+                if line_sizes[line_id] == 1 and not re.search(r"[0-9]", label["text"]):
+                    section_header = label["text"].rstrip(":").strip()
+                    column_headers = []
+                continue
+
+            value = segments[best_id]
+            key_text = label["text"].rstrip(":").strip()
+            if not pair_is_valid(key_text, value["text"]):
+                continue
+            consumed[label_id] = True
+            consumed[best_id] = True
+            column_header = ""
+            for header in column_headers:
+                if min(header["x1"], value["x1"]) - max(header["x0"], value["x0"]) > 0:
+                    column_header = header["text"]
+                    break
+            row_index += 1
+            pairs.append(
+                build_pair_record(
+                    key=key_text,
+                    value=value["text"],
+                    page_number=page_number,
+                    surface=surface,
+                    backend=backend,
+                    row_index=row_index,
+                    section_header=section_header,
+                    column_header=column_header,
+                    bbox={
+                        "x0": round(min(label["x0"], value["x0"]), 2),
+                        "y0": round(min(label["y0"], value["y0"]), 2),
+                        "x1": round(max(label["x1"], value["x1"]), 2),
+                        "y1": round(max(label["y1"], value["y1"]), 2),
+                    },
+                )
+            )
+            if len(pairs) >= limit:
+                return pairs, row_index
+    return pairs, row_index
+
+
+def dedupe_pairs(pairs: List[PairRecord], limit: int) -> List[PairRecord]:
+    seen = set()
+    out: List[PairRecord] = []
+
+    # Keys and values are normalized once in build_pair_record; only case folding remains.
+    # Pivoted table pairs add their model column so models sharing a value each keep their pair;
+    # layout pairs also carry a column header but must still dedupe against the text-path pair.
     for pair in pairs:
-        key = normalize(str(pair.get("normalized_key") or pair.get("key") or ""))
-        value = normalize(str(pair.get("normalized_value") or pair.get("value") or ""))
-        signature = (key.lower(), value.lower())
+        key = pair.key
+        value = pair.value
         if not key or not value:
             continue
+        pivot_column = pair.column_header.lower() if pair.surface in PAIR_TABLE_SURFACES else ""
+        signature = (key.lower(), value.lower(), pivot_column)
         if signature in seen:
             continue
         seen.add(signature)
@@ -264,21 +865,201 @@ def dedupe_pairs(pairs: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]
     return out
 
 
-def split_pairs_by_surface(pairs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+def split_pairs_by_surface(pairs: List[PairRecord]) -> Tuple[List[PairRecord], List[PairRecord]]:
     table_pairs = []
     kv_pairs = []
     for pair in pairs:
-        surface = normalize(str(pair.get("surface") or "")).lower()
-        if surface in {"pdf_table", "scanned_pdf_ocr_table"}:
+        if pair.surface in PAIR_TABLE_SURFACES:
             table_pairs.append(pair)
         else:
             kv_pairs.append(pair)
     return kv_pairs, table_pairs
 
 
-def fingerprint_with_pdfplumber(pdf_path: str, max_pages: int) -> Dict[str, Any]:
+class PageTimeoutError(BaseException):
+    """Raised from SIGALRM; derives from BaseException so generic ``except Exception`` handlers let it through."""
+
+
+PAGE_ALARM_GRACE_S = 0.01
+
+
+class ExtractionWatchdog:
+    """Per-page time budget plus a deadline signal that always leaves a payload on disk.
+
+    The page budget uses SIGALRM where available (POSIX main thread) so a stuck page is
+    abandoned and extraction moves on. The deadline is owned by the caller: it sends
+    SIGTERM shortly before its hard kill, and the handler hands control to ``on_deadline``
+    (which writes the partial payload) and exits through SystemExit so open files are
+    closed and stdout is flushed. ``deadline_ms`` arms the same path from a monotonic
+    clock checked before each page, for platforms where SIGTERM cannot be caught
+    (Windows terminates the process outright). Python only runs signal handlers between
+    bytecodes, so a single long native call (a PyMuPDF render, a tesseract run) delays
+    both the page budget and the deadline until it returns; the caller's hard kill
+    covers that case.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_timeout_ms: int = 0,
+        deadline_ms: int = 0,
+        on_deadline: Optional[Callable[["ExtractionWatchdog"], None]] = None,
+    ) -> None:
+        self.page_timeout_s = max(0, int(page_timeout_ms or 0)) / 1000.0
+        deadline_s = max(0, int(deadline_ms or 0)) / 1000.0
+        self.deadline_at = time.monotonic() + deadline_s if deadline_s > 0 else 0.0
+        self.on_deadline = on_deadline
+        self.pages_timed_out: List[Dict[str, Any]] = []
+        self.stage = ""
+        self.current_page = 0
+        self.tracked_backend = ""
+        self.tracked_pages: List[Dict[str, Any]] = []
+        self.tracked_pairs: List[Dict[str, Any]] = []
+        self.committed_backend = ""
+        self.committed_pages: List[Dict[str, Any]] = []
+        self.committed_pairs: List[Dict[str, Any]] = []
+        self.deadline_hit = False
+        self.deadline_source = ""
+        # True only while a page body runs; the alarm handler raises nowhere else.
+        self.in_page_body = False
+        self._alarm_supported = (
+            hasattr(signal, "SIGALRM")
+            and hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+        self._closed = False
+        self._previous_term_handler: Any = None
+        if (
+            on_deadline is not None
+            and hasattr(signal, "SIGTERM")
+            and threading.current_thread() is threading.main_thread()
+        ):
+            self._previous_term_handler = signal.signal(signal.SIGTERM, self._on_deadline)
+
+    @property
+    def page_budget_enforced(self) -> bool:
+        return self._alarm_supported and self.page_timeout_s > 0
+
+    @property
+    def page_budget_status(self) -> str:
+        """Why the page budget is or is not enforced; without SIGALRM (Windows) pages run unbounded."""
+        if self.page_timeout_s <= 0:
+            return "disabled"
+        if not hasattr(signal, "SIGALRM") or not hasattr(signal, "setitimer"):
+            return "unsupported_no_sigalrm"
+        if not self._alarm_supported:
+            return "unsupported_not_main_thread"
+        return "enforced"
+
+    def track(self, *, backend: str, pages: List[Dict[str, Any]], pairs: List[Dict[str, Any]]) -> None:
+        self.tracked_backend = backend
+        self.tracked_pages = pages
+        self.tracked_pairs = pairs
+
+    def commit(self, *, backend: str, pages: List[Dict[str, Any]], pairs: List[Dict[str, Any]]) -> None:
+        """Record results already merged from earlier backends so a partial payload keeps them."""
+        self.committed_backend = backend
+        self.committed_pages = list(pages)
+        self.committed_pairs = list(pairs)
+        self.tracked_pages = []
+        self.tracked_pairs = []
+
+    def timed_out_page_numbers(self, stage: str = "") -> List[int]:
+        return sorted(
+            {int(row["page_number"]) for row in self.pages_timed_out if not stage or row["stage"] == stage}
+        )
+
+    def page_known_bad(self, page_number: int) -> bool:
+        return any(int(row["page_number"]) == int(page_number) for row in self.pages_timed_out)
+
+    def _on_alarm(self, _signum: int, frame: Any) -> None:
+        if not self.in_page_body:
+            return
+        if frame is not None and frame.f_globals.get("__name__") == "contextlib":
+            # The body already returned and the with-statement is handing control back to
+            # page(), which clears in_page_body; raising here would escape the guarded
+            # block, so try again once page() has had a moment to finish.
+            signal.setitimer(signal.ITIMER_REAL, PAGE_ALARM_GRACE_S)
+            return
+        raise PageTimeoutError(f"page {self.current_page} exceeded {int(self.page_timeout_s * 1000)}ms")
+
+    def check_deadline(self) -> None:
+        """Fire the deadline from the monotonic clock; a no-op before ``deadline_ms`` elapses."""
+        if self.deadline_at and time.monotonic() >= self.deadline_at:
+            self._deadline_reached("clock")
+
+    @contextmanager
+    def page(self, stage: str, page_number: int) -> Iterator[None]:
+        self.stage = stage
+        self.check_deadline()
+        self.current_page = int(page_number)
+        previous_handler = None
+        finished = False
+        if self.page_budget_enforced:
+            previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, self.page_timeout_s)
+        try:
+            try:
+                self.in_page_body = True
+                yield
+                self.in_page_body = False
+                finished = True
+            finally:
+                self.in_page_body = False
+                if previous_handler is not None:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except PageTimeoutError:
+            if not finished:
+                self.pages_timed_out.append({"stage": stage, "page_number": int(page_number)})
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGALRM, previous_handler)
+            self.current_page = 0
+
+    def close(self) -> bool:
+        """Stop listening for the deadline; returns False if the deadline already fired."""
+        if not self._closed:
+            self._closed = True
+            if self._previous_term_handler is not None:
+                signal.signal(signal.SIGTERM, self._previous_term_handler)
+        return not self.deadline_hit
+
+    def _on_deadline(self, _signum: int, _frame: Any) -> None:
+        self._deadline_reached("signal")
+
+    def _deadline_reached(self, source: str) -> None:
+        if self._closed or self.deadline_hit:
+            return
+        self.deadline_hit = True
+        self.deadline_source = source
+        if self.page_budget_enforced:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if self.current_page:
+            self.pages_timed_out.append({"stage": self.stage, "page_number": self.current_page})
+        try:
+            if self.on_deadline is not None:
+                self.on_deadline(self)
+        finally:
+            raise SystemExit(0)
+
+
+
+def page_checkpoint(*rows: List[Any]) -> List[Tuple[List[Any], int]]:
+    return [(row, len(row)) for row in rows]
+
+
+def rollback_page(checkpoint: List[Tuple[List[Any], int]]) -> None:
+    for row, mark in checkpoint:
+        del row[mark:]
+
+
+def fingerprint_with_pdfplumber(
+    pdf_path: str, max_pages: int, watchdog: Optional[ExtractionWatchdog] = None
+) -> Dict[str, Any]:
     import pdfplumber  # type: ignore
 
+    watchdog = watchdog or ExtractionWatchdog()
+
     pages_scanned = 0
     tables_found = 0
     lines_scanned = 0
@@ -286,17 +1067,22 @@ def fingerprint_with_pdfplumber(pdf_path: str, max_pages: int) -> Dict[str, Any]
 
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages[:max_pages]:
-            pages_scanned += 1
-            page_text = str(page.extract_text() or "")
-            normalized_lines = [normalize(line) for line in page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            lines_scanned += len(normalized_lines)
-            text_chars += len("\n".join(normalized_lines))
-            try:
-                tables = page.extract_tables() or []
-            except Exception:
-                tables = []
-            tables_found += len(tables)
+            with watchdog.page("fingerprint", int(page.page_number or 1)):
+                try:
+                    page_text = str(page.extract_text() or "")
+                except Exception:
+                    # A broken page must not sink the whole fingerprint; extraction retries it per page.
+                    continue
+                pages_scanned += 1
+                normalized_lines = [normalize(line) for line in page_text.splitlines()]
+                normalized_lines = [line for line in normalized_lines if line]
+                lines_scanned += len(normalized_lines)
+                text_chars += len("\n".join(normalized_lines))
+                try:
+                    tables = page.extract_tables() or []
+                except Exception:
+                    tables = []
+                tables_found += len(tables)
 
     table_density = (tables_found / pages_scanned) if pages_scanned > 0 else 0.0
     return {
@@ -309,9 +1095,13 @@ def fingerprint_with_pdfplumber(pdf_path: str, max_pages: int) -> Dict[str, Any]
     }
 
 
-def fingerprint_with_pymupdf(pdf_path: str, max_pages: int) -> Dict[str, Any]:
+def fingerprint_with_pymupdf(
+    pdf_path: str, max_pages: int, watchdog: Optional[ExtractionWatchdog] = None
+) -> Dict[str, Any]:
     import fitz  # type: ignore
 
+    watchdog = watchdog or ExtractionWatchdog()
+
     pages_scanned = 0
     lines_scanned = 0
     text_chars = 0
@@ -319,13 +1109,14 @@ def fingerprint_with_pymupdf(pdf_path: str, max_pages: int) -> Dict[str, Any]:
     doc = fitz.open(pdf_path)
     try:
         for idx in range(min(max_pages, len(doc))):
-            pages_scanned += 1
-            page = doc[idx]
-            page_text = str(page.get_text("text") or "")
-            normalized_lines = [normalize(line) for line in page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            lines_scanned += len(normalized_lines)
-            text_chars += len("\n".join(normalized_lines))
+            with watchdog.page("fingerprint", idx + 1):
+                pages_scanned += 1
+                page = doc[idx]
+                page_text = str(page.get_text("text") or "")
+                normalized_lines = [normalize(line) for line in page_text.splitlines()]
+                normalized_lines = [line for line in normalized_lines if line]
+                lines_scanned += len(normalized_lines)
+                text_chars += len("\n".join(normalized_lines))
     finally:
         doc.close()
 
@@ -339,6 +1130,255 @@ def fingerprint_with_pymupdf(pdf_path: str, max_pages: int) -> Dict[str, Any]:
     }
 
 
+def probe_pages_with_pymupdf(
+    pdf_path: str, max_pages: int, watchdog: Optional[ExtractionWatchdog] = None
+) -> List[Dict[str, Any]]:
+    """Cheap per-page table evidence: ruling lines from vector drawings plus rows split into 3+ columns."""
+    import fitz  # type: ignore
+
+    watchdog = watchdog or ExtractionWatchdog()
+    out: List[Dict[str, Any]] = []
+    doc = fitz.open(pdf_path)
+    try:
+        for idx in range(min(max_pages, len(doc))):
+            page_number = idx + 1
+            with watchdog.page("fingerprint", page_number):
+                page = doc[idx]
+                try:
+                    words = words_from_pymupdf(page)
+                except Exception:
+                    continue
+                lines = group_words_into_segments(words) if words else []
+                column_rows = sum(1 for segments in lines if len(segments) >= 3)
+                ruling_lines = 0
+                try:
+                    for drawing in page.get_drawings() or []:
+                        for item in drawing.get("items") or []:
+                            if item and item[0] == "re":
+                                ruling_lines += 1
+                            elif item and item[0] == "l":
+                                start, end = item[1], item[2]
+                                if abs(start.x - end.x) < 1.0 or abs(start.y - end.y) < 1.0:
+                                    ruling_lines += 1
+                except Exception:
+                    ruling_lines = 0
+                out.append(
+                    {
+                        "page_number": page_number,
+                        "lines": len(lines),
+                        "text_chars": sum(len(word["text"]) + 1 for word in words),
+                        "column_rows": column_rows,
+                        "ruling_lines": ruling_lines,
+                        "table_evidence": ruling_lines >= 6 or column_rows >= 3,
+                    }
+                )
+    finally:
+        doc.close()
+    return out
+
+
+def fingerprint_from_page_probe(probe: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    pages_scanned = len(probe)
+    tables_found = sum(1 for row in probe if row.get("table_evidence"))
+    lines_scanned = sum(int(row.get("lines") or 0) for row in probe)
+    text_chars = sum(int(row.get("text_chars") or 0) for row in probe)
+    table_density = (tables_found / pages_scanned) if pages_scanned > 0 else 0.0
+    return {
+        "pages_scanned": pages_scanned,
+        "tables_found": tables_found,
+        "lines_scanned": lines_scanned,
+        "text_chars": text_chars,
+        "table_density": round(table_density, 6),
+        "avg_chars_per_page": round((text_chars / pages_scanned), 2) if pages_scanned > 0 else 0.0,
+    }
+
+
+PAGE_ROUTE_TABLE_BACKENDS = ["pdfplumber", "camelot"]
+
+
+def plan_page_routes(
+    probe: Sequence[Dict[str, Any]], available: Dict[str, bool], table_backend: str = ""
+) -> List[Tuple[str, List[int]]]:
+    """Send text-only pages to PyMuPDF and pages with table evidence to a table-capable backend.
+
+    ``table_backend`` comes from the cost model when it has history; otherwise the first
+    available table-capable backend is used.
+    """
+    if table_backend not in PAGE_ROUTE_TABLE_BACKENDS or not available.get(table_backend):
+        table_backend = next((token for token in PAGE_ROUTE_TABLE_BACKENDS if available.get(token)), "")
+    text_pages = [int(row["page_number"]) for row in probe if not row.get("table_evidence")]
+    table_pages = [int(row["page_number"]) for row in probe if row.get("table_evidence")]
+    if not table_backend:
+        return []
+    groups = [("pymupdf", text_pages), (table_backend, table_pages)]
+    return [(backend, pages) for backend, pages in groups if pages]
+
+
+TRIAGE_SPEC_KEYWORDS = [
+    "specification",
+    "specifications",
+    "technical data",
+    "sensor",
+    "dpi",
+    "cpi",
+    "polling rate",
+    "acceleration",
+    "ips",
+    "weight",
+    "dimensions",
+    "battery",
+    "switch",
+    "switches",
+    "buttons",
+    "connectivity",
+    "wireless",
+    "cable",
+    "resolution",
+    "refresh rate",
+    "response time",
+    "panel",
+    "layout",
+    "keycaps",
+    "lighting",
+]
+TRIAGE_LOW_VALUE_KEYWORDS = [
+    "declaration of conformity",
+    "warranty",
+    "limited warranty",
+    "safety information",
+    "safety instructions",
+    "regulatory",
+    "fcc",
+    "weee",
+    "hereby declares",
+    "quick start",
+    "getting started",
+    "troubleshooting",
+]
+TRIAGE_MIN_SCORE = 0.2
+
+
+def triage_lines_with_pymupdf(
+    pdf_path: str, max_pages: int, watchdog: Optional[ExtractionWatchdog] = None
+) -> Tuple[List[str], int]:
+    import fitz  # type: ignore
+
+    watchdog = watchdog or ExtractionWatchdog()
+    lines: List[str] = []
+    pages_read = 0
+    doc = fitz.open(pdf_path)
+    try:
+        for idx in range(min(max_pages, len(doc))):
+            with watchdog.page("triage", idx + 1):
+                page_text = str(doc[idx].get_text("text") or "")
+                pages_read += 1
+                lines.extend(line for line in (normalize(row) for row in page_text.splitlines()) if line)
+    finally:
+        doc.close()
+    return lines, pages_read
+
+
+def triage_lines_with_pdfplumber(
+    pdf_path: str, max_pages: int, watchdog: Optional[ExtractionWatchdog] = None
+) -> Tuple[List[str], int]:
+    import pdfplumber  # type: ignore
+
+    watchdog = watchdog or ExtractionWatchdog()
+    lines: List[str] = []
+    pages_read = 0
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[:max_pages]:
+            with watchdog.page("triage", int(page.page_number or 1)):
+                try:
+                    page_text = str(page.extract_text() or "")
+                except Exception:
+                    continue
+                pages_read += 1
+                lines.extend(line for line in (normalize(row) for row in page_text.splitlines()) if line)
+    return lines, pages_read
+
+
+def score_spec_density(lines: Sequence[str]) -> Dict[str, Any]:
+    """Score how much a document's opening text looks like a spec sheet (0..1)."""
+    line_count = len(lines)
+    kv_lines = 0
+    unit_lines = 0
+    for line in lines:
+        key, value = parse_line_pair(line)
+        if pair_is_valid(key, value):
+            kv_lines += 1
+        if re.search(r"\d", line) and infer_unit_hint(line, ""):
+            unit_lines += 1
+    haystack = " ".join(lines).lower()
+    category_hits = sorted(
+        token for token in TRIAGE_SPEC_KEYWORDS if re.search(rf"\b{re.escape(token)}\b", haystack)
+    )
+    low_value_hits = sorted(
+        token for token in TRIAGE_LOW_VALUE_KEYWORDS if re.search(rf"\b{re.escape(token)}\b", haystack)
+    )
+
+    # Short pages are judged against a floor so a cover page with two KV lines does not score as dense.
+    denominator = max(10, line_count)
+    kv_density = min(1.0, (kv_lines / denominator) * 2.5)
+    unit_density = min(1.0, (unit_lines / denominator) * 4.0)
+    keyword_density = min(1.0, len(category_hits) / 6.0)
+    penalty = min(0.3, 0.1 * len(low_value_hits))
+    score = max(0.0, (0.4 * kv_density) + (0.3 * unit_density) + (0.3 * keyword_density) - penalty)
+    return {
+        "score": round(min(1.0, score), 4),
+        "lines": line_count,
+        "kv_lines": kv_lines,
+        "unit_lines": unit_lines,
+        "category_hits": category_hits,
+        "low_value_hits": low_value_hits,
+    }
+
+
+def triage_pdf(
+    pdf_path: str,
+    *,
+    available: Dict[str, bool],
+    max_pages: int = 2,
+    min_score: float = TRIAGE_MIN_SCORE,
+    watchdog: Optional[ExtractionWatchdog] = None,
+) -> Dict[str, Any]:
+    """Read the first pages with the cheapest text backend and return a spec/low_value verdict."""
+    started = time.monotonic()
+    lines: List[str] = []
+    pages_read = 0
+    backend = "none"
+    error = ""
+    for token, reader in [("pymupdf", triage_lines_with_pymupdf), ("pdfplumber", triage_lines_with_pdfplumber)]:
+        if not available.get(token):
+            continue
+        try:
+            lines, pages_read = reader(pdf_path, max_pages, watchdog=watchdog)
+            backend = token
+            error = ""
+            break
+        except Exception as exc:
+            error = f"{token}_triage_failed:{exc}"
+
+    signals = score_spec_density(lines)
+    if not lines:
+        # No text layer (or no reader): scanned spec sheets look exactly like this, so let extraction/OCR decide.
+        verdict = "unknown"
+    elif float(signals["score"]) < min_score:
+        verdict = "low_value"
+    else:
+        verdict = "spec"
+    return {
+        "verdict": verdict,
+        "score": signals["score"],
+        "min_score": min_score,
+        "backend": backend,
+        "pages_read": pages_read,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 3),
+        "signals": signals,
+        "error": error,
+    }
+
+
 def choose_backend(
     requested_backend: str,
     available: Dict[str, bool],
@@ -417,9 +1457,267 @@ def choose_backend(
     }
 
 
+ROUTER_STATS_BACKENDS = ["pdfplumber", "pymupdf", "camelot"]
+ROUTER_STATS_MIN_RUNS = 3
+ROUTER_STATS_EXPLORE_EVERY = 10
+
+
+def fingerprint_bucket(fingerprint: Dict[str, Any]) -> str:
+    pages_scanned = int(fingerprint.get("pages_scanned") or 0)
+    table_density = float(fingerprint.get("table_density") or 0.0)
+    avg_chars = float(fingerprint.get("avg_chars_per_page") or 0.0)
+    if pages_scanned <= 4:
+        pages_token = "small"
+    elif pages_scanned <= 20:
+        pages_token = "medium"
+    else:
+        pages_token = "large"
+    if table_density < 0.05:
+        table_token = "none"
+    elif table_density < 0.35:
+        table_token = "some"
+    else:
+        table_token = "dense"
+    if avg_chars < 45:
+        text_token = "sparse"
+    elif avg_chars < 600:
+        text_token = "light"
+    else:
+        text_token = "rich"
+    return f"pages:{pages_token}|tables:{table_token}|text:{text_token}"
+
+
+def default_router_stats() -> Dict[str, Any]:
+    return {
+        "version": 1,
+        "updated_at": "",
+        "by_host": {},
+        "by_fingerprint": {},
+        "stats": {"updates_total": 0},
+    }
+
+
+def load_router_stats(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            parsed = json.load(fh)
+    except Exception:
+        return default_router_stats()
+    if not isinstance(parsed, dict):
+        return default_router_stats()
+    out = default_router_stats()
+    out.update(parsed)
+    for scope in ["by_host", "by_fingerprint", "stats"]:
+        if not isinstance(out.get(scope), dict):
+            out[scope] = default_router_stats()[scope]
+    return out
+
+
+def router_backend_rows(stats: Dict[str, Any], scope: str, key: str) -> Dict[str, Dict[str, Any]]:
+    bucket = (stats.get(scope) or {}).get(key) if key else None
+    if not isinstance(bucket, dict) or not isinstance(bucket.get("backends"), dict):
+        return {}
+    return bucket["backends"]
+
+
+def router_pairs_per_second(row: Dict[str, Any]) -> float:
+    elapsed_s = max(0.001, float(row.get("elapsed_ms") or 0.0) / 1000.0)
+    return float(row.get("pairs") or 0.0) / elapsed_s
+
+
+def choose_backend_by_cost(
+    requested_backend: str,
+    available: Dict[str, bool],
+    fingerprint: Dict[str, Any],
+    stats: Dict[str, Any],
+    source_host: str,
+) -> Optional[Dict[str, Any]]:
+    """Pick the backend with the best historical valid-pair yield per second.
+
+    Host history wins over fingerprint-bucket history when it has enough runs. While any
+    candidate has fewer than ``ROUTER_STATS_MIN_RUNS`` runs in the fingerprint bucket
+    (including an empty stats file), the least-sampled one is explored so the bucket warms
+    up; after that, every ``ROUTER_STATS_EXPLORE_EVERY`` updates the least-sampled backend
+    is tried again. Explore choices run one backend over the whole document, which is the
+    only kind of run that is recorded. Returns None when no history applies, in which case
+    the caller uses ``choose_backend``.
+    """
+    if normalize_backend(requested_backend) != "auto":
+        return None
+    candidates = [token for token in ROUTER_STATS_BACKENDS if bool(available.get(token))]
+    if not candidates:
+        return None
+
+    bucket = fingerprint_bucket(fingerprint)
+    host = normalize(source_host).lower()
+    base = {
+        "requested": "auto",
+        "fallback_used": False,
+        "table_density": round(float(fingerprint.get("table_density") or 0.0), 6),
+        "pages_scanned": int(fingerprint.get("pages_scanned") or 0),
+        "tables_found": int(fingerprint.get("tables_found") or 0),
+    }
+
+    bucket_rows = router_backend_rows(stats, "by_fingerprint", bucket)
+    updates_total = int((stats.get("stats") or {}).get("updates_total") or 0)
+    runs = {token: int((bucket_rows.get(token) or {}).get("runs") or 0) for token in candidates}
+    warming = [token for token in candidates if runs[token] < ROUTER_STATS_MIN_RUNS]
+    if warming:
+        explore = min(warming, key=lambda token: runs[token])
+        return {
+            **base,
+            "selected": explore,
+            "reason": f"cost_model_warmup:{explore}@{runs[explore]}runs",
+            "cost_model": {"scope": "explore", "host": host, "fingerprint_bucket": bucket, "candidates": runs},
+        }
+    if len(candidates) > 1 and updates_total > 0 and updates_total % ROUTER_STATS_EXPLORE_EVERY == 0:
+        explore = min(candidates, key=lambda token: runs[token])
+        if runs[explore] < max(runs.values()):
+            return {
+                **base,
+                "selected": explore,
+                "reason": f"cost_model_explore:{explore}@{runs[explore]}runs",
+                "cost_model": {"scope": "explore", "host": host, "fingerprint_bucket": bucket, "candidates": runs},
+            }
+
+    for scope, key, rows in [
+        ("host", host, router_backend_rows(stats, "by_host", host)),
+        ("fingerprint", bucket, bucket_rows),
+    ]:
+        scored = {
+            token: round(router_pairs_per_second(rows[token]), 3)
+            for token in candidates
+            if int((rows.get(token) or {}).get("runs") or 0) >= ROUTER_STATS_MIN_RUNS
+        }
+        if not scored or (len(scored) < 2 and len(candidates) > 1):
+            continue
+        ranked = sorted(scored.items(), key=lambda item: (-item[1], candidates.index(item[0])))
+        selected = ranked[0][0]
+        return {
+            **base,
+            "selected": selected,
+            "reason": f"cost_model_{scope}:" + ">".join(f"{token}@{rate}pps" for token, rate in ranked),
+            "cost_model": {
+                "scope": scope,
+                "key": key,
+                "host": host,
+                "fingerprint_bucket": bucket,
+                "pairs_per_second": scored,
+            },
+        }
+    return None
+
+
+def cost_model_table_backend(choice: Optional[Dict[str, Any]]) -> str:
+    """Best-yielding table-capable backend in a cost-model ranking, or "" without history."""
+    rates = ((choice or {}).get("cost_model") or {}).get("pairs_per_second") or {}
+    ranked = [token for token in PAGE_ROUTE_TABLE_BACKENDS if token in rates]
+    if not ranked:
+        return ""
+    return max(ranked, key=lambda token: (float(rates[token]), -ranked.index(token)))
+
+
+def router_stats_runs(runs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Runs worth learning from: every run covered the whole document and one backend produced it.
+
+    Page-routed and per-page retry runs only see a subset of pages, so their yield per
+    second is not comparable with a whole-document run and would skew the stats.
+    """
+    if not runs or any(not run.get("whole_document") for run in runs):
+        return []
+    if sum(1 for run in runs if not run.get("failed")) > 1:
+        return []
+    return list(runs)
+
+
+def locked_router_stats_file(path: str):
+    """Exclusive lock on a sidecar file so concurrent extractors do not lose each other's updates."""
+    lock_fh = open(f"{path}.lock", "a+", encoding="utf-8")
+    try:
+        import fcntl  # type: ignore
+
+        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+    except ImportError:
+        pass
+    return lock_fh
+
+
+def record_router_stats(
+    path: str,
+    *,
+    fingerprint: Dict[str, Any],
+    source_host: str,
+    runs: Sequence[Dict[str, Any]],
+) -> None:
+    """Fold this document's per-backend timings and yields into the on-disk stats file."""
+    if not path or not runs:
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Closing the handle releases the lock after the rename below.
+    with locked_router_stats_file(path):
+        update_router_stats(path, fingerprint=fingerprint, source_host=source_host, runs=runs)
+
+
+def update_router_stats(
+    path: str,
+    *,
+    fingerprint: Dict[str, Any],
+    source_host: str,
+    runs: Sequence[Dict[str, Any]],
+) -> None:
+    stats = load_router_stats(path)
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    host = normalize(source_host).lower()
+    targets = [("by_fingerprint", fingerprint_bucket(fingerprint))]
+    if host:
+        targets.append(("by_host", host))
+    for scope, key in targets:
+        bucket = stats[scope].setdefault(key, {"attempts": 0, "backends": {}})
+        bucket["attempts"] = int(bucket.get("attempts") or 0) + 1
+        bucket["updated_at"] = now
+        backends = bucket.setdefault("backends", {})
+        for run in runs:
+            row = backends.setdefault(
+                str(run["backend"]),
+                {"runs": 0, "failures": 0, "elapsed_ms": 0, "pairs": 0, "pages": 0, "pairs_per_second": 0.0},
+            )
+            row["runs"] = int(row.get("runs") or 0) + 1
+            row["failures"] = int(row.get("failures") or 0) + (1 if run.get("failed") else 0)
+            row["elapsed_ms"] = int(row.get("elapsed_ms") or 0) + int(run.get("elapsed_ms") or 0)
+            row["pairs"] = int(row.get("pairs") or 0) + int(run.get("pairs") or 0)
+            row["pages"] = int(row.get("pages") or 0) + int(run.get("pages") or 0)
+            row["pairs_per_second"] = round(router_pairs_per_second(row), 3)
+    stats["stats"]["updates_total"] = int(stats["stats"].get("updates_total") or 0) + 1
+    stats["updated_at"] = now
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write_json(tmp_path, stats)
+    os.replace(tmp_path, path)
+
+
+def detect_ocr_engines() -> Dict[str, bool]:
+    """Ways to reach tesseract: a persistent API handle, one batched CLI run, or a CLI spawn per image."""
+    return {
+        "tesserocr": module_available("tesserocr") and module_available("PIL"),
+        "tesseract_batch": bool(shutil.which("tesseract")),
+        "pytesseract": module_available("pytesseract") and module_available("PIL"),
+    }
+
+
+def choose_ocr_engine(requested: str, available: Dict[str, bool]) -> str:
+    token = normalize(str(requested or "")).lower().replace("-", "_")
+    if token in OCR_ENGINES and available.get(token):
+        return token
+    for engine in OCR_ENGINES:
+        if available.get(engine):
+            return engine
+    return "none"
+
+
 def detect_available_ocr_backends() -> Dict[str, bool]:
     return {
-        "tesseract": module_available("pytesseract") and module_available("PIL") and module_available("fitz"),
+        "tesseract": module_available("fitz") and any(detect_ocr_engines().values()),
         "paddleocr": module_available("paddleocr") and module_available("fitz"),
     }
 
@@ -494,118 +1792,803 @@ def should_route_to_scanned_ocr(
     }
 
 
-def extract_with_tesseract_ocr(
+ESTIMATE_MS_PER_PAGE = {
+    "pymupdf": 25.0,
+    "pdfplumber": 180.0,
+    "camelot": 900.0,
+    "tabula": 1200.0,
+    "legacy": 25.0,
+}
+ESTIMATE_OCR_MS_PER_PAGE = 2500.0
+ESTIMATE_OPEN_MS = 60.0
+ESTIMATE_VECTOR_OPS_PER_DOUBLING = 2000.0
+
+
+def sample_page_indices(page_count: int, sample_pages: int) -> List[int]:
+    """First page, last page and evenly spaced pages in between."""
+    if page_count <= 0:
+        return []
+    if page_count <= sample_pages:
+        return list(range(page_count))
+    if sample_pages <= 1:
+        return [0]
+    step = (page_count - 1) / float(sample_pages - 1)
+    return sorted({int(round(step * slot)) for slot in range(sample_pages)})
+
+
+def sample_pages_with_pymupdf(pdf_path: str, max_pages: int, sample_pages: int) -> Tuple[int, List[Dict[str, Any]]]:
+    import fitz  # type: ignore
+
+    rows: List[Dict[str, Any]] = []
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = len(doc)
+        for idx in sample_page_indices(min(max_pages, page_count), sample_pages):
+            page = doc[idx]
+            page_area = max(1.0, float(page.rect.width) * float(page.rect.height))
+            text = str(page.get_text("text") or "")
+            image_area = 0.0
+            for info in page.get_image_info() or []:
+                x0, y0, x1, y1 = info.get("bbox") or (0, 0, 0, 0)
+                image_area += max(0.0, x1 - x0) * max(0.0, y1 - y0)
+            # get_cdrawings skips building Python path objects; only the count matters here.
+            drawings = page.get_cdrawings() if hasattr(page, "get_cdrawings") else page.get_drawings()
+            rows.append(
+                {
+                    "page_number": idx + 1,
+                    "text_chars": len(normalize(text)),
+                    "lines": sum(1 for line in text.splitlines() if line.strip()),
+                    "image_coverage": round(min(1.0, image_area / page_area), 4),
+                    "vector_ops": len(drawings or []),
+                }
+            )
+    finally:
+        doc.close()
+    return page_count, rows
+
+
+def sample_pages_with_pdfplumber(pdf_path: str, max_pages: int, sample_pages: int) -> Tuple[int, List[Dict[str, Any]]]:
+    import pdfplumber  # type: ignore
+
+    rows: List[Dict[str, Any]] = []
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+        for idx in sample_page_indices(min(max_pages, page_count), sample_pages):
+            page = pdf.pages[idx]
+            page_area = max(1.0, float(page.width) * float(page.height))
+            image_area = sum(
+                max(0.0, float(image.get("x1") or 0) - float(image.get("x0") or 0))
+                * max(0.0, float(image.get("bottom") or 0) - float(image.get("top") or 0))
+                for image in page.images or []
+            )
+            chars = page.chars or []
+            rows.append(
+                {
+                    "page_number": idx + 1,
+                    "text_chars": sum(1 for char in chars if str(char.get("text") or "").strip()),
+                    "lines": len({round(float(char.get("top") or 0)) for char in chars}),
+                    "image_coverage": round(min(1.0, image_area / page_area), 4),
+                    "vector_ops": len(page.lines or []) + len(page.rects or []) + len(page.curves or []),
+                }
+            )
+    return page_count, rows
+
+
+def learned_ms_per_page(
+    router_stats: Optional[Dict[str, Any]], fingerprint: Dict[str, Any], backend: str
+) -> Optional[float]:
+    """Recorded ms per page for ``backend`` in the fingerprint's bucket, once it has enough runs."""
+    if router_stats is None:
+        return None
+    learned = router_backend_rows(router_stats, "by_fingerprint", fingerprint_bucket(fingerprint)).get(backend) or {}
+    if int(learned.get("runs") or 0) < ROUTER_STATS_MIN_RUNS or int(learned.get("pages") or 0) <= 0:
+        return None
+    return float(learned.get("elapsed_ms") or 0) / float(learned["pages"])
+
+
+def estimate_extraction_cost(
+    pdf_path: str,
+    *,
+    available: Dict[str, bool],
+    requested_backend: str,
+    max_pages: int,
+    sample_pages: int,
+    enable_scanned_ocr: bool,
+    scanned_ocr_max_pages: int,
+    scanned_ocr_min_chars_per_page: int,
+    scanned_ocr_min_lines_per_page: int,
+    page_routing: bool = True,
+    router_stats: Optional[Dict[str, Any]] = None,
+    source_host: str = "",
+) -> Dict[str, Any]:
+    """Predict extraction time, OCR need and backend from a few sampled pages, without extracting anything."""
+    started = time.monotonic()
+    reader = "none"
+    page_count = 0
+    rows: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    for token, sampler in [("pymupdf", sample_pages_with_pymupdf), ("pdfplumber", sample_pages_with_pdfplumber)]:
+        if not available.get(token):
+            continue
+        try:
+            page_count, rows = sampler(pdf_path, max_pages, sample_pages)
+            reader = token
+            break
+        except Exception as exc:
+            errors.append(f"{token}_estimate_failed:{exc}")
+
+    sampled = max(1, len(rows))
+    pages_in_scope = min(max_pages, page_count)
+    avg_chars = sum(int(row["text_chars"]) for row in rows) / sampled
+    image_coverage = sum(float(row["image_coverage"]) for row in rows) / sampled
+    vector_ops = sum(int(row["vector_ops"]) for row in rows) / sampled
+    ruled_pages = sum(1 for row in rows if int(row["vector_ops"]) >= 6)
+    fingerprint = {
+        "pages_scanned": pages_in_scope,
+        "tables_found": ruled_pages,
+        "lines_scanned": sum(int(row["lines"]) for row in rows),
+        "text_chars": int(avg_chars * sampled),
+        "table_density": round(ruled_pages / sampled, 6) if rows else 0.0,
+        "avg_chars_per_page": round(avg_chars, 2),
+    }
+    # Sampled totals stand in for the whole document; only the per-page ratios matter to the OCR rule.
+    scan_route = should_route_to_scanned_ocr(
+        fingerprint={**fingerprint, "pages_scanned": sampled},
+        pairs_after_dedupe=0,
+        min_chars_per_page=scanned_ocr_min_chars_per_page,
+        min_lines_per_page=scanned_ocr_min_lines_per_page,
+    )
+    text_layer = avg_chars > float(scanned_ocr_min_chars_per_page)
+    ocr_likely = bool(rows) and bool(scan_route.get("scanned_pdf_detected")) and (image_coverage >= 0.3 or not text_layer)
+
+    cost_choice = None
+    if router_stats is not None:
+        cost_choice = choose_backend_by_cost(requested_backend, available, fingerprint, router_stats, source_host)
+    choice = cost_choice or choose_backend(requested_backend, available, fingerprint)
+    backend = normalize_backend(str(choice.get("selected") or "legacy"))
+
+    def backend_ms_per_page(token: str) -> Tuple[float, str]:
+        learned_ms = learned_ms_per_page(router_stats, fingerprint, token)
+        if learned_ms is not None:
+            return learned_ms, "router_stats"
+        default_ms = ESTIMATE_MS_PER_PAGE.get(token, ESTIMATE_MS_PER_PAGE["pdfplumber"])
+        if token != "pymupdf":
+            # Layout analysis scales with the number of vector objects on the page.
+            default_ms *= 1.0 + (vector_ops / ESTIMATE_VECTOR_OPS_PER_DOUBLING)
+        return default_ms, "default"
+
+    ms_per_page, ms_per_page_source = backend_ms_per_page(backend)
+    predicted_ms = ESTIMATE_OPEN_MS + (ms_per_page * pages_in_scope)
+    # Same gates as main: an exploring cost model runs one backend over the whole document.
+    exploring = ((cost_choice or {}).get("cost_model") or {}).get("scope") == "explore"
+    routed = bool(
+        page_routing
+        and requested_backend == "auto"
+        and available.get("pymupdf")
+        and (available.get("pdfplumber") or available.get("camelot"))
+        and not exploring
+    )
+    backend_reason = str(choice.get("reason") or "")
+    if routed:
+        # Mirrors plan_page_routes: only the pages with table evidence pay for the table backend,
+        # which is the cost model's best-yielding one when it has history.
+        table_backend = cost_model_table_backend(cost_choice)
+        if table_backend and available.get(table_backend):
+            backend_reason = f"auto_page_routing|table_backend:{choice.get('reason')}"
+        else:
+            table_backend = next(token for token in PAGE_ROUTE_TABLE_BACKENDS if available.get(token))
+            backend_reason = "auto_page_routing"
+        table_pages = round(float(fingerprint["table_density"]) * pages_in_scope)
+        text_ms, text_source = backend_ms_per_page("pymupdf")
+        ms_per_page, table_source = backend_ms_per_page(table_backend)
+        predicted_ms = ESTIMATE_OPEN_MS + (text_ms * (pages_in_scope - table_pages)) + (ms_per_page * table_pages)
+        backend = table_backend if table_pages * 2 > pages_in_scope else "pymupdf"
+        learned_sources = {text_source, table_source} - {"default"}
+        ms_per_page_source = "page_routing+router_stats" if learned_sources else "page_routing"
+    ocr_pages = min(scanned_ocr_max_pages, pages_in_scope) if ocr_likely else 0
+    if enable_scanned_ocr:
+        predicted_ms += ESTIMATE_OCR_MS_PER_PAGE * ocr_pages
+
+    return {
+        "page_count": page_count,
+        "pages_in_scope": pages_in_scope,
+        "pages_sampled": [int(row["page_number"]) for row in rows],
+        "reader": reader,
+        "text_layer": text_layer,
+        "avg_chars_per_page": round(avg_chars, 2),
+        "image_coverage": round(image_coverage, 4),
+        "vector_ops_per_page": round(vector_ops, 2),
+        "ocr_likely": ocr_likely,
+        "ocr_pages": ocr_pages,
+        "recommended_backend": backend,
+        "backend_reason": backend_reason,
+        "page_routing": routed,
+        "ms_per_page": round(ms_per_page, 2),
+        "ms_per_page_source": ms_per_page_source,
+        "predicted_ms": int(round(predicted_ms)),
+        "fingerprint": fingerprint,
+        "samples": rows,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 3),
+        "errors": errors,
+    }
+
+
+OCR_ENGINES = ("tesserocr", "tesseract_batch", "pytesseract")
+TESSERACT_TSV_INT_FIELDS = ("page_num", "block_num", "par_num", "line_num", "left", "top", "width", "height")
+
+
+def parse_tesseract_tsv(text: str) -> Dict[int, Dict[str, List[Any]]]:
+    """Word rows of tesseract TSV output, grouped by page_num in the image_to_data dict layout."""
+    pages: Dict[int, Dict[str, List[Any]]] = {}
+    lines = str(text or "").splitlines()
+    if not lines:
+        return pages
+    header = lines[0].split("\t")
+    for raw in lines[1:]:
+        cells = raw.split("\t")
+        if len(cells) < len(header):
+            cells.extend([""] * (len(header) - len(cells)))
+        row = dict(zip(header, cells))
+        if row.get("level") != "5":
+            continue
+        page = pages.setdefault(
+            int(row.get("page_num") or 1), {field: [] for field in (*TESSERACT_TSV_INT_FIELDS, "conf", "text")}
+        )
+        for field in TESSERACT_TSV_INT_FIELDS:
+            page[field].append(int(float(row.get(field) or 0)))
+        page["conf"].append(row.get("conf") or "-1")
+        page["text"].append(row.get("text") or "")
+    return pages
+
+
+def ocr_lines_from_data(data: Dict[str, Any]) -> Tuple[List[str], List[float]]:
+    """Rebuild text lines (block/paragraph/line order) and 0..1 word confidences from one image's OCR data."""
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    confidences: List[float] = []
+    texts = data.get("text") or []
+    for idx, raw in enumerate(texts):
+        text = normalize(str(raw or ""))
+        if not text:
+            continue
+        key = tuple(int((data.get(field) or [0] * len(texts))[idx] or 0) for field in ("block_num", "par_num", "line_num"))
+        lines.setdefault(key, []).append(text)
+        try:
+            conf = float(str((data.get("conf") or [])[idx]))
+        except Exception:
+            continue
+        if conf >= 0:
+            confidences.append(max(0.0, min(1.0, conf / 100.0)))
+    return [" ".join(words) for words in lines.values()], confidences
+
+
+def pixmap_samples(pix: Any) -> Tuple[Any, int]:
+    """The pixmap's pixel buffer and how many bytes Python copied to get it.
+
+    ``samples_mv`` is a memoryview over MuPDF's own buffer; ``samples`` (older
+    PyMuPDF) materializes a fresh bytes object.
+    """
+    view = getattr(pix, "samples_mv", None)
+    if view is not None:
+        return view, 0
+    samples = pix.samples
+    return samples, len(samples)
+
+
+def write_pixmap_pnm(pix: Any, path: str) -> int:
+    """Write the pixmap as binary PNM straight from its buffer.
+
+    Returns the bytes the image cost: any in-process copy of the samples plus
+    the PNM written to disk for the CLI to read back.
+    """
+    channels = int(getattr(pix, "n", 0) or 0)
+    row_bytes = int(pix.width) * channels
+    if channels in {1, 3} and int(getattr(pix, "stride", row_bytes) or row_bytes) == row_bytes:
+        buffer, copied = pixmap_samples(pix)
+        header = f"P{5 if channels == 1 else 6}\n{pix.width} {pix.height}\n255\n".encode("ascii")
+        with open(path, "wb") as fh:
+            fh.write(header)
+            fh.write(buffer)
+        return copied + len(header) + len(buffer)
+    # Alpha or padded rows are not plain PNM; let MuPDF encode them (one copy in memory, one on disk).
+    data = pix.tobytes("pnm")
+    with open(path, "wb") as fh:
+        fh.write(data)
+    return 2 * len(data)
+
+
+class TesseractOcrSession:
+    """Feed rendered pixmaps to tesseract through one engine and collect per-image word data.
+
+    ``pytesseract`` spawns the CLI once per image. ``tesserocr`` keeps one API
+    handle (traineddata loaded once) for the whole session. ``tesseract_batch``
+    writes each image as it arrives and OCRs all of them in a single CLI run
+    over a file list; that run is bounded by the per-page budget times the
+    image count rather than by per-page alarms.
+
+    Pixels never pass through PIL: the CLI engines get a PNM written from the
+    pixmap buffer, and tesserocr gets the samples as bytes via SetImageBytes
+    (it does not accept a buffer view). ``bytes_copied`` records what each image
+    cost on its way to tesseract: in-process copies plus the PNM file write.
+    """
+
+    def __init__(self, engine: str, *, watchdog: ExtractionWatchdog, stage: str) -> None:
+        self.engine = engine
+        self.watchdog = watchdog
+        self.stage = stage
+        self.calls = 0
+        self.elapsed_ms = 0.0
+        self.error = ""
+        self._results: Dict[int, Dict[str, List[Any]]] = {}
+        self._pending: List[Tuple[int, int, str]] = []
+        self.bytes_copied: Dict[int, int] = {}
+        self._api: Any = None
+        self._tmp_dir = ""
+        if engine == "tesserocr":
+            import tesserocr  # type: ignore
+
+            self._api = tesserocr.PyTessBaseAPI()
+        else:
+            self._tmp_dir = tempfile.mkdtemp(prefix="pdf-ocr-")
+
+    def add(self, key: int, pix: Any, page_number: int) -> None:
+        started = time.perf_counter()
+        try:
+            if self.engine == "tesseract_batch":
+                path = os.path.join(self._tmp_dir, f"{len(self._pending):04d}.pnm")
+                self.bytes_copied[key] = write_pixmap_pnm(pix, path)
+                self._pending.append((key, page_number, path))
+                return
+            if self._api is not None:
+                # SetImageBytes takes bytes, so the samples are copied once here.
+                buffer = bytes(pix.samples)
+                copied = len(buffer)
+                with self.watchdog.page(self.stage, page_number):
+                    self.calls += 1
+                    self._api.SetImageBytes(buffer, pix.width, pix.height, pix.n, pix.stride)
+                    self._results[key] = parse_tesseract_tsv(
+                        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+                        + str(self._api.GetTSVText(0) or "")
+                    ).get(1, {})
+                self.bytes_copied[key] = copied
+                return
+            import pytesseract  # type: ignore
+
+            # A path argument goes to the CLI as-is; a PIL image would be re-encoded to a temp PNG first.
+            path = os.path.join(self._tmp_dir, f"{key}.pnm")
+            self.bytes_copied[key] = write_pixmap_pnm(pix, path)
+            try:
+                with self.watchdog.page(self.stage, page_number):
+                    self.calls += 1
+                    self._results[key] = pytesseract.image_to_data(path, output_type=pytesseract.Output.DICT)
+            finally:
+                os.remove(path)
+        finally:
+            self.elapsed_ms += (time.perf_counter() - started) * 1000
+
+    def results(self) -> Dict[int, Dict[str, List[Any]]]:
+        if self._pending:
+            self._run_batch()
+        return self._results
+
+    def _run_batch(self) -> None:
+        started = time.perf_counter()
+        pending, self._pending = self._pending, []
+        list_path = os.path.join(self._tmp_dir, "images.txt")
+        with open(list_path, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(path for _, _, path in pending) + "\n")
+        out_base = os.path.join(self._tmp_dir, "out")
+        timeout_s = self.watchdog.page_timeout_s * len(pending) if self.watchdog.page_timeout_s > 0 else None
+        self.calls += 1
+        try:
+            subprocess.run(
+                ["tesseract", list_path, out_base, "tsv"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout_s,
+            )
+            with open(f"{out_base}.tsv", "r", encoding="utf-8") as fh:
+                by_image = parse_tesseract_tsv(fh.read())
+            for position, (key, _, _) in enumerate(pending, start=1):
+                self._results[key] = by_image.get(position, {})
+        except subprocess.TimeoutExpired:
+            for _, page_number, _ in pending:
+                self.watchdog.pages_timed_out.append({"stage": self.stage, "page_number": int(page_number)})
+        except Exception as exc:
+            # One unreadable image fails the whole list run; retry image by image so the rest keep their text.
+            self.error = f"tesseract_batch_failed:{exc}"
+            self._run_each(pending)
+        finally:
+            self.elapsed_ms += (time.perf_counter() - started) * 1000
+
+    def _run_each(self, pending: Sequence[Tuple[int, int, str]]) -> None:
+        timeout_s = self.watchdog.page_timeout_s if self.watchdog.page_timeout_s > 0 else None
+        failed = 0
+        last_error = ""
+        for key, page_number, path in pending:
+            self.calls += 1
+            try:
+                completed = subprocess.run(
+                    ["tesseract", path, "stdout", "tsv"],
+                    check=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout_s,
+                )
+                self._results[key] = parse_tesseract_tsv(completed.stdout.decode("utf-8", "replace")).get(1, {})
+            except subprocess.TimeoutExpired:
+                self.watchdog.pages_timed_out.append({"stage": self.stage, "page_number": int(page_number)})
+            except Exception as exc:
+                failed += 1
+                last_error = str(exc)
+        if failed:
+            self.error += f";tesseract_image_failed:{failed}/{len(pending)}:{last_error}"
+
+    def close(self) -> None:
+        if self._api is not None:
+            self._api.End()
+            self._api = None
+        if self._tmp_dir:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = ""
+
+    def meta(self) -> Dict[str, Any]:
+        return {
+            "ocr_engine": self.engine,
+            "ocr_engine_calls": self.calls,
+            "ocr_engine_ms": round(self.elapsed_ms, 3),
+            "ocr_engine_error": self.error,
+            "ocr_bytes_copied": sum(self.bytes_copied.values()),
+            "ocr_bytes_copied_per_page": (
+                int(sum(self.bytes_copied.values()) / len(self.bytes_copied)) if self.bytes_copied else 0
+            ),
+        }
+
+
+def extract_with_tesseract_ocr(
+    *,
+    pdf_path: str,
+    max_pages: int,
+    max_pairs: int,
+    max_text_preview_chars: int,
+    min_confidence: float,
+    watchdog: Optional[ExtractionWatchdog] = None,
+    engine: str = "auto",
+) -> Dict[str, Any]:
+    import fitz  # type: ignore
+
+    watchdog = watchdog or ExtractionWatchdog()
+    session = TesseractOcrSession(choose_ocr_engine(engine, detect_ocr_engines()), watchdog=watchdog, stage="ocr")
+
+    pages: List[Dict[str, Any]] = []
+    all_pairs: List[Dict[str, Any]] = []
+    kv_pairs: List[Dict[str, Any]] = []
+    table_pairs: List[Dict[str, Any]] = []
+    text_preview_chunks: List[str] = []
+    lines_scanned = 0
+    kv_cursor = 0
+    confidence_sum = 0.0
+    confidence_samples = 0
+    low_confidence_pairs = 0
+    threshold = max(0.0, min(1.0, float(min_confidence)))
+
+    doc = fitz.open(pdf_path)
+    try:
+        page_numbers: List[int] = []
+        for idx in range(min(max_pages, len(doc))):
+            pix = None
+            with watchdog.page("ocr_render", idx + 1):
+                pix = doc[idx].get_pixmap(matrix=fitz.Matrix(2.0, 2.0), alpha=False)
+            if pix is not None:
+                page_numbers.append(idx + 1)
+                session.add(idx + 1, pix, idx + 1)
+            pix = None
+        results = session.results()
+    finally:
+        doc.close()
+        session.close()
+
+    for page_number in page_numbers:
+        if page_number not in results:
+            continue
+        normalized_lines, conf_values = ocr_lines_from_data(results[page_number])
+        page_text = "\n".join(normalized_lines)
+        lines_scanned += len(normalized_lines)
+        pages.append(
+            {
+                "page_number": page_number,
+                "text": page_text[:3000],
+                "char_count": len(page_text),
+                "ocr_bytes_copied": session.bytes_copied.get(page_number, 0),
+            }
+        )
+        if page_text:
+            text_preview_chunks.append(page_text)
+
+        page_confidence = None
+        if conf_values:
+            page_confidence = float(sum(conf_values) / len(conf_values))
+            confidence_sum += float(sum(conf_values))
+            confidence_samples += len(conf_values)
+
+        row_low_confidence = bool(page_confidence is not None and page_confidence < threshold)
+        if page_text:
+            text_rows, kv_cursor = extract_pairs_from_text(
+                text=page_text,
+                limit=max_pairs,
+                page_number=page_number,
+                backend="tesseract",
+                start_index=kv_cursor,
+                surface="scanned_pdf_ocr_kv",
+                ocr_confidence=page_confidence,
+                ocr_low_confidence=row_low_confidence,
+            )
+            kv_pairs.extend(text_rows)
+            all_pairs.extend(text_rows)
+            if row_low_confidence:
+                low_confidence_pairs += len(text_rows)
+        if len(all_pairs) >= max_pairs * 3:
+            break
+
+    text_preview = "\n".join(text_preview_chunks)[:max_text_preview_chars]
+    confidence_avg = (confidence_sum / confidence_samples) if confidence_samples > 0 else 0.0
+    return {
+        "pairs": all_pairs,
+        "kv_pairs": kv_pairs,
+        "table_pairs": table_pairs,
+        "text_preview": text_preview,
+        "pages": pages,
+        "meta": {
+            "pages_scanned": len(pages),
+            "lines_scanned": lines_scanned,
+            "tables_found": 0,
+            "pairs_before_dedupe": len(all_pairs),
+            "kv_pairs_before_dedupe": len(kv_pairs),
+            "table_pairs_before_dedupe": 0,
+            "backend": "tesseract",
+            "pages_timed_out": sorted(
+                set(watchdog.timed_out_page_numbers("ocr")) | set(watchdog.timed_out_page_numbers("ocr_render"))
+            ),
+            "ocr_confidence_avg": round(float(confidence_avg), 6),
+            "ocr_confidence_samples": int(confidence_samples),
+            "ocr_low_confidence_pairs": int(low_confidence_pairs),
+            **session.meta(),
+        },
+    }
+
+
+ROI_OCR_MIN_AREA_RATIO = 0.06
+# Images covering most of the page are scanned pages; whole-page OCR owns those.
+ROI_OCR_MAX_AREA_RATIO = 0.85
+ROI_OCR_MIN_SIDE_PT = 96.0
+ROI_OCR_MAX_TEXT_WORDS = 6
+ROI_OCR_MIN_ZOOM = 1.5
+ROI_OCR_MAX_ZOOM = 4.0
+ROI_OCR_MAX_PIXELS = 8_000_000
+ROI_OCR_FULL_PAGE_ZOOM = 2.0
+
+
+def roi_ocr_zoom(bbox: Sequence[float], native_width: int, native_height: int) -> float:
+    """Render at the embedded image's own resolution, within OCR-friendly bounds and a pixel budget."""
+    width_pt = max(1.0, float(bbox[2]) - float(bbox[0]))
+    height_pt = max(1.0, float(bbox[3]) - float(bbox[1]))
+    native = max(float(native_width or 0) / width_pt, float(native_height or 0) / height_pt)
+    zoom = max(ROI_OCR_MIN_ZOOM, min(ROI_OCR_MAX_ZOOM, native or ROI_OCR_FULL_PAGE_ZOOM))
+    budget = (ROI_OCR_MAX_PIXELS / (width_pt * height_pt)) ** 0.5
+    return round(max(0.5, min(zoom, budget)), 3)
+
+
+def find_roi_image_regions(page: Any) -> List[Dict[str, Any]]:
+    """Large embedded images on a page that carry no text layer of their own."""
+    page_area = max(1.0, float(page.rect.width) * float(page.rect.height))
+    words = None
+    regions: List[Dict[str, Any]] = []
+    seen = set()
+    for info in page.get_image_info() or []:
+        x0, y0, x1, y1 = (float(value) for value in (info.get("bbox") or (0, 0, 0, 0)))
+        width = x1 - x0
+        height = y1 - y0
+        area_ratio = (max(0.0, width) * max(0.0, height)) / page_area
+        signature = (round(x0), round(y0), round(x1), round(y1))
+        if signature in seen or min(width, height) < ROI_OCR_MIN_SIDE_PT:
+            continue
+        if area_ratio < ROI_OCR_MIN_AREA_RATIO or area_ratio > ROI_OCR_MAX_AREA_RATIO:
+            continue
+        seen.add(signature)
+        if words is None:
+            words = words_from_pymupdf(page)
+        inside = sum(
+            1
+            for word in words
+            if x0 <= (word["x0"] + word["x1"]) / 2.0 <= x1 and y0 <= (word["y0"] + word["y1"]) / 2.0 <= y1
+        )
+        if inside > ROI_OCR_MAX_TEXT_WORDS:
+            continue
+        regions.append(
+            {
+                "bbox": (x0, y0, x1, y1),
+                "area_ratio": round(area_ratio, 4),
+                "zoom": roi_ocr_zoom((x0, y0, x1, y1), int(info.get("width") or 0), int(info.get("height") or 0)),
+            }
+        )
+    return regions
+
+
+def ocr_words_from_tesseract_data(
+    data: Dict[str, Any], *, origin_x: float, origin_y: float, zoom: float
+) -> Tuple[List[Dict[str, Any]], List[float]]:
+    """Map tesseract word boxes back to page coordinates; returns (words, confidences in 0..1)."""
+    words: List[Dict[str, Any]] = []
+    confidences: List[float] = []
+    texts = data.get("text") or []
+    for idx, raw in enumerate(texts):
+        text = normalize(str(raw or ""))
+        try:
+            conf = float(str((data.get("conf") or [])[idx]))
+        except Exception:
+            conf = -1.0
+        if not text or conf < 0:
+            continue
+        left = float(data["left"][idx]) / zoom
+        top = float(data["top"][idx]) / zoom
+        words.append(
+            {
+                "text": text,
+                "x0": round(origin_x + left, 2),
+                "y0": round(origin_y + top, 2),
+                "x1": round(origin_x + left + float(data["width"][idx]) / zoom, 2),
+                "y1": round(origin_y + top + float(data["height"][idx]) / zoom, 2),
+            }
+        )
+        confidences.append(max(0.0, min(1.0, conf / 100.0)))
+    return words, confidences
+
+
+def extract_with_roi_ocr(
     *,
     pdf_path: str,
     max_pages: int,
     max_pairs: int,
-    max_text_preview_chars: int,
+    max_regions: int,
     min_confidence: float,
+    min_page_chars: int,
+    watchdog: Optional[ExtractionWatchdog] = None,
+    engine: str = "auto",
 ) -> Dict[str, Any]:
+    """OCR only the large embedded images on text pages, e.g. a spec table pasted in as a picture.
+
+    Pairs carry the page-space ``bbox`` of the OCR line or label/value they came
+    from. ``pixel_area`` is what tesseract actually saw; ``page_pixel_area`` is
+    what whole-page OCR of the same pages would have cost.
+    """
     import fitz  # type: ignore
-    import pytesseract  # type: ignore
-    from PIL import Image  # type: ignore
 
-    pages: List[Dict[str, Any]] = []
-    all_pairs: List[Dict[str, Any]] = []
-    kv_pairs: List[Dict[str, Any]] = []
-    table_pairs: List[Dict[str, Any]] = []
-    text_preview_chunks: List[str] = []
-    lines_scanned = 0
-    kv_cursor = 0
-    confidence_sum = 0.0
-    confidence_samples = 0
-    low_confidence_pairs = 0
+    watchdog = watchdog or ExtractionWatchdog()
+    session = TesseractOcrSession(choose_ocr_engine(engine, detect_ocr_engines()), watchdog=watchdog, stage="roi_ocr")
+    pairs: List[PairRecord] = []
+    regions_out: List[Dict[str, Any]] = []
+    pages_with_regions: List[int] = []
+    pixel_area = 0
+    page_pixel_area = 0
     threshold = max(0.0, min(1.0, float(min_confidence)))
+    cursor = 0
+    started = time.perf_counter()
 
     doc = fitz.open(pdf_path)
     try:
         for idx in range(min(max_pages, len(doc))):
-            page = doc[idx]
-            page_number = idx + 1
-            pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0), alpha=False)
-            mode = "RGB" if int(getattr(pix, "n", 0) or 0) >= 3 else "L"
-            image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-
-            raw_page_text = str(pytesseract.image_to_string(image) or "")
-            normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            page_text = "\n".join(normalized_lines)
-            lines_scanned += len(normalized_lines)
-            pages.append(
-                {
-                    "page_number": page_number,
-                    "text": page_text[:3000],
-                    "char_count": len(page_text),
-                }
-            )
-            if page_text:
-                text_preview_chunks.append(page_text)
-
-            page_confidence = None
-            try:
-                ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-                conf_rows = ocr_data.get("conf") if isinstance(ocr_data, dict) else []
-                conf_values: List[float] = []
-                for raw in conf_rows or []:
-                    token = normalize(str(raw or ""))
-                    if not token or token == "-1":
-                        continue
-                    try:
-                        conf = float(token)
-                    except Exception:
-                        continue
-                    if conf < 0:
-                        continue
-                    normalized_conf = max(0.0, min(1.0, conf / 100.0))
-                    conf_values.append(normalized_conf)
-                if conf_values:
-                    page_confidence = float(sum(conf_values) / len(conf_values))
-                    confidence_sum += float(sum(conf_values))
-                    confidence_samples += len(conf_values)
-            except Exception:
-                page_confidence = None
+            if len(regions_out) >= max_regions:
+                break
+            rendered: List[Tuple[int, Any]] = []
+            checkpoint = page_checkpoint(regions_out, pages_with_regions)
+            area_mark = (pixel_area, page_pixel_area)
+            timed_out_mark = len(watchdog.pages_timed_out)
+            with watchdog.page("roi_ocr", idx + 1):
+                page = doc[idx]
+                page_number = idx + 1
+                if len(normalize(str(page.get_text("text") or ""))) < min_page_chars:
+                    continue
+                regions = find_roi_image_regions(page)[: max(0, max_regions - len(regions_out))]
+                if not regions:
+                    continue
+                pages_with_regions.append(page_number)
+                page_pixel_area += int(
+                    float(page.rect.width) * ROI_OCR_FULL_PAGE_ZOOM * float(page.rect.height) * ROI_OCR_FULL_PAGE_ZOOM
+                )
+                for region in regions:
+                    x0, y0, x1, y1 = region["bbox"]
+                    zoom = region["zoom"]
+                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=fitz.Rect(x0, y0, x1, y1), alpha=False)
+                    pixels = int(pix.width) * int(pix.height)
+                    pixel_area += pixels
+                    regions_out.append(
+                        {
+                            "page_number": page_number,
+                            "bbox": {"x0": round(x0, 2), "y0": round(y0, 2), "x1": round(x1, 2), "y1": round(y1, 2)},
+                            "area_ratio": region["area_ratio"],
+                            "zoom": zoom,
+                            "pixels": pixels,
+                        }
+                    )
+                    rendered.append((len(regions_out) - 1, pix))
+            if len(watchdog.pages_timed_out) > timed_out_mark:
+                # Drop the regions a timed-out page had already recorded.
+                rollback_page(checkpoint)
+                pixel_area, page_pixel_area = area_mark
+                rendered = []
+            # OCR outside the render budget: per-image engines arm their own page alarm.
+            for region_idx, pix in rendered:
+                session.add(region_idx, pix, idx + 1)
+            rendered = []
+        results = session.results()
+    finally:
+        doc.close()
+        session.close()
 
-            row_low_confidence = bool(page_confidence is not None and page_confidence < threshold)
-            if page_text:
-                text_rows, kv_cursor = extract_pairs_from_text(
-                    text=page_text,
-                    limit=max_pairs,
+    for region_idx, region in enumerate(regions_out):
+        data = results.get(region_idx)
+        if data is None:
+            region.update({"words": 0, "pairs": 0, "ocr_confidence": None})
+            continue
+        page_number = region["page_number"]
+        words, confidences = ocr_words_from_tesseract_data(
+            data, origin_x=region["bbox"]["x0"], origin_y=region["bbox"]["y0"], zoom=region["zoom"]
+        )
+        confidence = (sum(confidences) / len(confidences)) if confidences else None
+        low_confidence = bool(confidence is not None and confidence < threshold)
+        region_pairs, cursor = extract_layout_pairs_from_words(
+            words=words,
+            limit=max_pairs,
+            page_number=page_number,
+            backend="tesseract",
+            start_index=cursor,
+            surface="scanned_pdf_ocr_kv",
+        )
+        for line in group_words_into_segments(words):
+            merged = merge_word_boxes(line)
+            key, value = parse_line_pair(merged["text"])
+            if not pair_is_valid(key, value):
+                continue
+            cursor += 1
+            region_pairs.append(
+                build_pair_record(
+                    key=key,
+                    value=value,
                     page_number=page_number,
-                    backend="tesseract",
-                    start_index=kv_cursor,
                     surface="scanned_pdf_ocr_kv",
-                    ocr_confidence=page_confidence,
-                    ocr_low_confidence=row_low_confidence,
+                    backend="tesseract",
+                    row_index=cursor,
+                    bbox={key_: round(merged[key_], 2) for key_ in ("x0", "y0", "x1", "y1")},
                 )
-                kv_pairs.extend(text_rows)
-                all_pairs.extend(text_rows)
-                if row_low_confidence:
-                    low_confidence_pairs += len(text_rows)
-            if len(all_pairs) >= max_pairs * 3:
-                break
-    finally:
-        doc.close()
+            )
+        for pair in region_pairs:
+            pair.ocr_confidence = confidence
+            pair.ocr_low_confidence = low_confidence
+        pairs.extend(region_pairs)
+        region.update(
+            {
+                "bytes_copied": session.bytes_copied.get(region_idx, 0),
+                "words": len(words),
+                "pairs": len(region_pairs),
+                "ocr_confidence": round(confidence, 4) if confidence is not None else None,
+            }
+        )
+        if len(pairs) >= max_pairs * 3:
+            break
 
-    text_preview = "\n".join(text_preview_chunks)[:max_text_preview_chars]
-    confidence_avg = (confidence_sum / confidence_samples) if confidence_samples > 0 else 0.0
     return {
-        "pairs": all_pairs,
-        "kv_pairs": kv_pairs,
-        "table_pairs": table_pairs,
-        "text_preview": text_preview,
-        "pages": pages,
+        "pairs": pairs,
         "meta": {
-            "pages_scanned": len(pages),
-            "lines_scanned": lines_scanned,
-            "tables_found": 0,
-            "pairs_before_dedupe": len(all_pairs),
-            "kv_pairs_before_dedupe": len(kv_pairs),
-            "table_pairs_before_dedupe": 0,
-            "backend": "tesseract",
-            "ocr_confidence_avg": round(float(confidence_avg), 6),
-            "ocr_confidence_samples": int(confidence_samples),
-            "ocr_low_confidence_pairs": int(low_confidence_pairs),
+            "regions": regions_out,
+            "region_count": len(regions_out),
+            "pages_with_regions": pages_with_regions,
+            "pixel_area": pixel_area,
+            "page_pixel_area": page_pixel_area,
+            "pixel_fraction": round(pixel_area / page_pixel_area, 4) if page_pixel_area else 0.0,
+            "pairs_before_dedupe": len(pairs),
+            "pages_timed_out": watchdog.timed_out_page_numbers("roi_ocr"),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            **session.meta(),
         },
     }
 
@@ -616,9 +2599,15 @@ def extract_with_pdfplumber(
     max_pages: int,
     max_pairs: int,
     max_text_preview_chars: int,
+    layout_pairs: bool = True,
+    watchdog: Optional[ExtractionWatchdog] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    table_pivot: bool = True,
 ) -> Dict[str, Any]:
     import pdfplumber  # type: ignore
 
+    watchdog = watchdog or ExtractionWatchdog()
+
     pages: List[Dict[str, Any]] = []
     all_pairs: List[Dict[str, Any]] = []
     kv_pairs: List[Dict[str, Any]] = []
@@ -628,57 +2617,91 @@ def extract_with_pdfplumber(
     lines_scanned = 0
     kv_cursor = 0
     table_cursor = 0
+    layout_pair_count = 0
+    failed_pages: List[Dict[str, Any]] = []
+    wanted_pages = set(int(n) for n in page_numbers) if page_numbers is not None else None
+    watchdog.track(backend="pdfplumber", pages=pages, pairs=all_pairs)
 
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages[:max_pages]:
-            raw_page_text = str(page.extract_text() or "")
-            normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            page_text = "\n".join(normalized_lines)
-            lines_scanned += len(normalized_lines)
             page_number = int(page.page_number or 1)
+            if wanted_pages is not None and page_number not in wanted_pages:
+                continue
+            if watchdog.page_known_bad(page_number):
+                continue
+            with watchdog.page("extract", page_number):
+                checkpoint = page_checkpoint(pages, all_pairs, kv_pairs, table_pairs, text_preview_chunks)
+                try:
+                    raw_page_text = str(page.extract_text() or "")
+                    normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
+                    normalized_lines = [line for line in normalized_lines if line]
+                    page_text = "\n".join(normalized_lines)
+                    lines_scanned += len(normalized_lines)
+
+                    pages.append(
+                        {
+                            "page_number": page_number,
+                            "text": page_text[:3000],
+                            "char_count": len(page_text),
+                            "backend": "pdfplumber",
+                        }
+                    )
+
+                    if layout_pairs and page_text:
+                        try:
+                            layout_rows, kv_cursor = extract_layout_pairs_from_words(
+                                words=words_from_pdfplumber(page),
+                                limit=max_pairs,
+                                page_number=page_number,
+                                backend="pdfplumber",
+                                start_index=kv_cursor,
+                            )
+                        except Exception:
+                            layout_rows = []
+                        layout_pair_count += len(layout_rows)
+                        kv_pairs.extend(layout_rows)
+                        all_pairs.extend(layout_rows)
+
+                    if page_text:
+                        text_rows, kv_cursor = extract_pairs_from_text(
+                            text=page_text,
+                            limit=max_pairs,
+                            page_number=page_number,
+                            backend="pdfplumber",
+                            start_index=kv_cursor,
+                        )
+                        kv_pairs.extend(text_rows)
+                        all_pairs.extend(text_rows)
+                        text_preview_chunks.append(page_text)
 
-            pages.append(
-                {
-                    "page_number": page_number,
-                    "text": page_text[:3000],
-                    "char_count": len(page_text),
-                }
-            )
-
-            if page_text:
-                text_rows, kv_cursor = extract_pairs_from_text(
-                    text=page_text,
-                    limit=max_pairs,
-                    page_number=page_number,
-                    backend="pdfplumber",
-                    start_index=kv_cursor,
-                )
-                kv_pairs.extend(text_rows)
-                all_pairs.extend(text_rows)
-                text_preview_chunks.append(page_text)
-
-            try:
-                tables = page.extract_tables() or []
-            except Exception:
-                tables = []
-
-            table_count += len(tables)
-            for table_index, table in enumerate(tables):
-                table_rows, table_cursor = extract_pairs_from_table(
-                    table=table,
-                    limit=max_pairs,
-                    page_number=page_number,
-                    backend="pdfplumber",
-                    table_id=f"p{page_number}_t{table_index + 1}",
-                    start_index=table_cursor,
-                )
-                table_pairs.extend(table_rows)
-                all_pairs.extend(table_rows)
-                if len(all_pairs) >= max_pairs * 3:
-                    break
-            if len(all_pairs) >= max_pairs * 3:
-                break
+                    try:
+                        tables = page.extract_tables() or []
+                    except Exception:
+                        tables = []
+
+                    table_count += len(tables)
+                    for table_index, table in enumerate(tables):
+                        table_rows, table_cursor = extract_pairs_from_table(
+                            table=table,
+                            limit=max_pairs,
+                            page_number=page_number,
+                            backend="pdfplumber",
+                            table_id=f"p{page_number}_t{table_index + 1}",
+                            start_index=table_cursor,
+                            pivot=table_pivot,
+                        )
+                        table_pairs.extend(table_rows)
+                        all_pairs.extend(table_rows)
+                        if len(all_pairs) >= max_pairs * 3:
+                            break
+                    if len(all_pairs) >= max_pairs * 3:
+                        break
+                except PageTimeoutError:
+                    rollback_page(checkpoint)
+                    raise
+                except Exception as exc:
+                    rollback_page(checkpoint)
+                    failed_pages.append({"page_number": page_number, "error": normalize(str(exc))[:200]})
 
     text_preview = "\n".join(text_preview_chunks)[:max_text_preview_chars]
     return {
@@ -694,6 +2717,9 @@ def extract_with_pdfplumber(
             "pairs_before_dedupe": len(all_pairs),
             "kv_pairs_before_dedupe": len(kv_pairs),
             "table_pairs_before_dedupe": len(table_pairs),
+            "layout_pairs_before_dedupe": layout_pair_count,
+            "pages_timed_out": watchdog.timed_out_page_numbers(),
+            "failed_pages": failed_pages,
             "backend": "pdfplumber",
         }
     }
@@ -705,47 +2731,84 @@ def extract_with_pymupdf(
     max_pages: int,
     max_pairs: int,
     max_text_preview_chars: int,
+    layout_pairs: bool = True,
+    watchdog: Optional[ExtractionWatchdog] = None,
+    page_numbers: Optional[Sequence[int]] = None,
 ) -> Dict[str, Any]:
     import fitz  # type: ignore
 
+    watchdog = watchdog or ExtractionWatchdog()
+
     pages: List[Dict[str, Any]] = []
     all_pairs: List[Dict[str, Any]] = []
     kv_pairs: List[Dict[str, Any]] = []
     text_preview_chunks: List[str] = []
     lines_scanned = 0
     kv_cursor = 0
+    layout_pair_count = 0
+    failed_pages: List[Dict[str, Any]] = []
+    wanted_pages = set(int(n) for n in page_numbers) if page_numbers is not None else None
+    watchdog.track(backend="pymupdf", pages=pages, pairs=all_pairs)
 
     doc = fitz.open(pdf_path)
     try:
         for idx in range(min(max_pages, len(doc))):
-            page = doc[idx]
             page_number = idx + 1
-            raw_page_text = str(page.get_text("text") or "")
-            normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
-            normalized_lines = [line for line in normalized_lines if line]
-            page_text = "\n".join(normalized_lines)
-            lines_scanned += len(normalized_lines)
-            pages.append(
-                {
-                    "page_number": page_number,
-                    "text": page_text[:3000],
-                    "char_count": len(page_text),
-                }
-            )
-            if not page_text:
+            if wanted_pages is not None and page_number not in wanted_pages:
                 continue
-            text_rows, kv_cursor = extract_pairs_from_text(
-                text=page_text,
-                limit=max_pairs,
-                page_number=page_number,
-                backend="pymupdf",
-                start_index=kv_cursor,
-            )
-            kv_pairs.extend(text_rows)
-            all_pairs.extend(text_rows)
-            text_preview_chunks.append(page_text)
-            if len(all_pairs) >= max_pairs * 3:
-                break
+            if watchdog.page_known_bad(page_number):
+                continue
+            with watchdog.page("extract", page_number):
+                checkpoint = page_checkpoint(pages, all_pairs, kv_pairs, text_preview_chunks)
+                try:
+                    page = doc[idx]
+                    raw_page_text = str(page.get_text("text") or "")
+                    normalized_lines = [normalize(line) for line in raw_page_text.splitlines()]
+                    normalized_lines = [line for line in normalized_lines if line]
+                    page_text = "\n".join(normalized_lines)
+                    lines_scanned += len(normalized_lines)
+                    pages.append(
+                        {
+                            "page_number": page_number,
+                            "text": page_text[:3000],
+                            "char_count": len(page_text),
+                            "backend": "pymupdf",
+                        }
+                    )
+                    if not page_text:
+                        continue
+                    if layout_pairs:
+                        try:
+                            layout_rows, kv_cursor = extract_layout_pairs_from_words(
+                                words=words_from_pymupdf(page),
+                                limit=max_pairs,
+                                page_number=page_number,
+                                backend="pymupdf",
+                                start_index=kv_cursor,
+                            )
+                        except Exception:
+                            layout_rows = []
+                        layout_pair_count += len(layout_rows)
+                        kv_pairs.extend(layout_rows)
+                        all_pairs.extend(layout_rows)
+                    text_rows, kv_cursor = extract_pairs_from_text(
+                        text=page_text,
+                        limit=max_pairs,
+                        page_number=page_number,
+                        backend="pymupdf",
+                        start_index=kv_cursor,
+                    )
+                    kv_pairs.extend(text_rows)
+                    all_pairs.extend(text_rows)
+                    text_preview_chunks.append(page_text)
+                    if len(all_pairs) >= max_pairs * 3:
+                        break
+                except PageTimeoutError:
+                    rollback_page(checkpoint)
+                    raise
+                except Exception as exc:
+                    rollback_page(checkpoint)
+                    failed_pages.append({"page_number": page_number, "error": normalize(str(exc))[:200]})
     finally:
         doc.close()
 
@@ -763,6 +2826,9 @@ def extract_with_pymupdf(
             "pairs_before_dedupe": len(all_pairs),
             "kv_pairs_before_dedupe": len(kv_pairs),
             "table_pairs_before_dedupe": 0,
+            "layout_pairs_before_dedupe": layout_pair_count,
+            "pages_timed_out": watchdog.timed_out_page_numbers(),
+            "failed_pages": failed_pages,
             "backend": "pymupdf",
         }
     }
@@ -774,10 +2840,15 @@ def extract_with_camelot(
     max_pages: int,
     max_pairs: int,
     max_text_preview_chars: int,
+    page_numbers: Optional[Sequence[int]] = None,
+    table_pivot: bool = True,
 ) -> Dict[str, Any]:
     import camelot  # type: ignore
 
-    page_expr = f"1-{max_pages}"
+    if page_numbers is not None:
+        page_expr = ",".join(str(n) for n in sorted(set(int(n) for n in page_numbers)))
+    else:
+        page_expr = f"1-{max_pages}"
     tables = camelot.read_pdf(pdf_path, pages=page_expr, flavor="lattice")
 
     pages: List[Dict[str, Any]] = []
@@ -805,6 +2876,7 @@ def extract_with_camelot(
             backend="camelot",
             table_id=f"p{page_number}_t{idx + 1}",
             start_index=table_cursor,
+            pivot=table_pivot,
         )
         table_pairs.extend(table_rows)
         all_pairs.extend(table_rows)
@@ -827,6 +2899,7 @@ def extract_with_camelot(
                 "page_number": int(page_number),
                 "text": "",
                 "char_count": 0,
+                "backend": "camelot",
             }
         )
 
@@ -844,11 +2917,96 @@ def extract_with_camelot(
             "pairs_before_dedupe": len(all_pairs),
             "kv_pairs_before_dedupe": 0,
             "table_pairs_before_dedupe": len(table_pairs),
+            "failed_pages": [],
             "backend": "camelot",
         }
     }
 
 
+def run_extraction_backend(
+    backend: str,
+    *,
+    pdf_path: str,
+    max_pages: int,
+    max_pairs: int,
+    max_text_preview_chars: int,
+    layout_pairs: bool,
+    watchdog: ExtractionWatchdog,
+    page_numbers: Optional[Sequence[int]] = None,
+    table_pivot: bool = True,
+) -> Optional[Dict[str, Any]]:
+    if backend == "pdfplumber":
+        return extract_with_pdfplumber(
+            pdf_path=pdf_path,
+            max_pages=max_pages,
+            max_pairs=max_pairs,
+            max_text_preview_chars=max_text_preview_chars,
+            layout_pairs=layout_pairs,
+            watchdog=watchdog,
+            page_numbers=page_numbers,
+            table_pivot=table_pivot,
+        )
+    if backend == "pymupdf":
+        return extract_with_pymupdf(
+            pdf_path=pdf_path,
+            max_pages=max_pages,
+            max_pairs=max_pairs,
+            max_text_preview_chars=max_text_preview_chars,
+            layout_pairs=layout_pairs,
+            watchdog=watchdog,
+            page_numbers=page_numbers,
+        )
+    if backend == "camelot":
+        return extract_with_camelot(
+            pdf_path=pdf_path,
+            max_pages=max_pages,
+            max_pairs=max_pairs,
+            max_text_preview_chars=max_text_preview_chars,
+            page_numbers=page_numbers,
+            table_pivot=table_pivot,
+        )
+    return None
+
+
+def merge_extractions(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold a fallback backend's page results into the primary extraction, keeping page order."""
+
+    def by_page(rows: List[Dict[str, Any]], field: str) -> List[Dict[str, Any]]:
+        return sorted(rows, key=lambda row: int(row.get(field) or 0))
+
+    def pairs_by_page(rows: List[PairRecord]) -> List[PairRecord]:
+        return sorted(rows, key=lambda pair: pair.page)
+
+    base_meta = base.get("meta") if isinstance(base.get("meta"), dict) else {}
+    extra_meta = extra.get("meta") if isinstance(extra.get("meta"), dict) else {}
+    meta = dict(base_meta)
+    for field in [
+        "pages_scanned",
+        "lines_scanned",
+        "tables_found",
+        "pairs_before_dedupe",
+        "kv_pairs_before_dedupe",
+        "table_pairs_before_dedupe",
+        "layout_pairs_before_dedupe",
+    ]:
+        meta[field] = int(base_meta.get(field) or 0) + int(extra_meta.get(field) or 0)
+    meta["pages_timed_out"] = sorted(
+        set(base_meta.get("pages_timed_out") or []) | set(extra_meta.get("pages_timed_out") or [])
+    )
+    meta["failed_pages"] = list(extra_meta.get("failed_pages") or [])
+    text_preview = "\n".join(
+        chunk for chunk in [str(base.get("text_preview") or ""), str(extra.get("text_preview") or "")] if chunk
+    )
+    return {
+        "pairs": pairs_by_page(list(base.get("pairs") or []) + list(extra.get("pairs") or [])),
+        "kv_pairs": pairs_by_page(list(base.get("kv_pairs") or []) + list(extra.get("kv_pairs") or [])),
+        "table_pairs": pairs_by_page(list(base.get("table_pairs") or []) + list(extra.get("table_pairs") or [])),
+        "text_preview": text_preview,
+        "pages": by_page(list(base.get("pages") or []) + list(extra.get("pages") or []), "page_number"),
+        "meta": meta,
+    }
+
+
 def build_attempt_order(selected_backend: str, available: Dict[str, bool]) -> List[str]:
     order = [selected_backend]
     for token in ["pdfplumber", "pymupdf", "camelot", "tabula"]:
@@ -871,6 +3029,231 @@ def write_json(path: str, payload: Dict[str, Any]) -> None:
         json.dump(payload, fh, indent=2)
 
 
+PAYLOAD_CACHE_VERSION = 2
+
+
+def payload_cache_key(pdf_path: str, options: Dict[str, Any]) -> str:
+    """Content hash of the PDF plus every option that changes the payload."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(json.dumps({"version": PAYLOAD_CACHE_VERSION, **options}, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def read_payload_cache(cache_dir: str, key: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            parsed = json.load(fh)
+    except Exception:
+        return None
+    if not (isinstance(parsed, dict) and parsed.get("ok")):
+        return None
+    try:
+        # mtime doubles as last use, so pruning drops the least recently used payloads first.
+        os.utime(path)
+    except OSError:
+        pass
+    return parsed
+
+
+def write_payload_cache(cache_dir: str, key: str, payload: Dict[str, Any]) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh)
+    os.replace(tmp_path, path)
+
+
+PAYLOAD_CACHE_STALE_TMP_S = 3600
+
+
+def prune_payload_cache(cache_dir: str, max_bytes: int) -> Dict[str, int]:
+    """Delete least recently used payloads until the cache fits in ``max_bytes`` (0 = unbounded).
+
+    Only ``<sha256>.json`` payloads count; the lexicon index kept in the same directory is
+    left alone. Temp files older than an hour are leftovers of killed writers and go too.
+    """
+    stats = {"files": 0, "bytes": 0, "removed": 0, "removed_bytes": 0}
+    entries: List[Tuple[float, int, str]] = []
+    now = time.time()
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        try:
+            info = os.stat(path)
+        except OSError:
+            continue
+        if name.endswith(".tmp") and now - info.st_mtime > PAYLOAD_CACHE_STALE_TMP_S:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        stem, ext = os.path.splitext(name)
+        if ext != ".json" or len(stem) != 64 or any(ch not in "0123456789abcdef" for ch in stem):
+            continue
+        entries.append((info.st_mtime, info.st_size, path))
+    stats["files"] = len(entries)
+    stats["bytes"] = sum(size for _, size, _ in entries)
+    if max_bytes <= 0:
+        return stats
+    total = stats["bytes"]
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        stats["removed"] += 1
+        stats["removed_bytes"] += size
+    stats["files"] -= stats["removed"]
+    stats["bytes"] = total
+    return stats
+
+
+LEXICON_INDEX_VERSION = 1
+# Learned lexicons pick up source-method tokens ("helper", "props") that land under dozens of fields.
+LEXICON_MAX_FIELDS_PER_SYNONYM = 3
+
+
+def lexicon_text(text: str) -> str:
+    """Lowercase alphanumeric tokens padded with spaces, so index hits always fall on word boundaries."""
+    tokens = re.sub(r"[^a-z0-9]+", " ", str(text or "").lower()).strip()
+    return f" {tokens} " if tokens else ""
+
+
+def build_lexicon_index(
+    lexicon: Dict[str, Any], *, max_fields_per_synonym: int = LEXICON_MAX_FIELDS_PER_SYNONYM
+) -> Dict[str, Any]:
+    """Compile every field key and learned synonym into one Aho-Corasick automaton.
+
+    States are list-indexed: ``goto[state]`` maps a character to the next state,
+    ``fail[state]`` is the failure link, and ``out[state]`` lists [field_index,
+    synonym_length] for every synonym ending there (failure outputs merged in),
+    so matching a key is one pass over its characters.
+    """
+    fields_by_synonym: Dict[str, set] = {}
+    owner_of: Dict[str, str] = {}
+    field_names = sorted(str(name) for name in (lexicon.get("fields") or {}).keys())
+    for name in field_names:
+        row = (lexicon.get("fields") or {}).get(name) or {}
+        synonyms = row.get("synonyms") if isinstance(row.get("synonyms"), dict) else {}
+        owner_of.setdefault(lexicon_text(name.replace("_", " ")), name)
+        for token in [name.replace("_", " "), *synonyms.keys()]:
+            padded = lexicon_text(token)
+            if padded:
+                fields_by_synonym.setdefault(padded, set()).add(name)
+    field_index = {name: idx for idx, name in enumerate(field_names)}
+    goto: List[Dict[str, int]] = [{}]
+    out: List[List[List[int]]] = [[]]
+    synonym_count = 0
+    ambiguous = 0
+    for padded, names in sorted(fields_by_synonym.items()):
+        if len(names) > max(1, int(max_fields_per_synonym)):
+            ambiguous += 1
+            if padded not in owner_of:
+                continue
+            # A field's own key stays in the index even when other fields learned it as a synonym.
+            names = {owner_of[padded]}
+        synonym_count += 1
+        state = 0
+        for char in padded:
+            nxt = goto[state].get(char)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][char] = nxt
+                goto.append({})
+                out.append([])
+            state = nxt
+        out[state].extend([field_index[name], len(padded) - 2] for name in sorted(names))
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for char, nxt in goto[state].items():
+            queue.append(nxt)
+            probe = fail[state]
+            while probe and char not in goto[probe]:
+                probe = fail[probe]
+            fail[nxt] = goto[probe].get(char, 0)
+            out[nxt].extend(out[fail[nxt]])
+    return {
+        "version": LEXICON_INDEX_VERSION,
+        "fields": field_names,
+        "synonyms": synonym_count,
+        "ambiguous_synonyms_skipped": ambiguous,
+        "goto": goto,
+        "fail": fail,
+        "out": out,
+    }
+
+
+def load_lexicon_index(
+    lexicon_path: str, *, index_path: str = "", max_fields_per_synonym: int = LEXICON_MAX_FIELDS_PER_SYNONYM
+) -> Dict[str, Any]:
+    """Load the compiled index for a lexicon, rebuilding and persisting it when the lexicon changed."""
+    with open(lexicon_path, "rb") as fh:
+        raw = fh.read()
+    source_hash = hashlib.sha256(raw + f"|{LEXICON_INDEX_VERSION}|{max_fields_per_synonym}".encode("utf-8")).hexdigest()
+    if index_path:
+        try:
+            with open(index_path, "r", encoding="utf-8") as fh:
+                cached = json.load(fh)
+            if isinstance(cached, dict) and cached.get("source_hash") == source_hash:
+                cached["loaded_from"] = "index"
+                return cached
+        except Exception:
+            pass
+    index = build_lexicon_index(json.loads(raw.decode("utf-8-sig")), max_fields_per_synonym=max_fields_per_synonym)
+    index["source_hash"] = source_hash
+    if index_path:
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    index["loaded_from"] = "built"
+    return index
+
+
+def match_lexicon_fields(index: Dict[str, Any], text: str) -> List[str]:
+    """Field keys whose synonyms occur in ``text``, longest synonym first, the field named exactly by ``text`` winning ties."""
+    goto = index["goto"]
+    fail = index["fail"]
+    out = index["out"]
+    padded = lexicon_text(text)
+    exact = padded.strip().replace(" ", "_")
+    best: Dict[int, int] = {}
+    state = 0
+    for char in padded:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        for field_idx, length in out[state]:
+            if length > best.get(field_idx, 0):
+                best[field_idx] = length
+    names = index["fields"]
+    ranked = sorted(best.items(), key=lambda item: (-item[1], names[item[0]] != exact, names[item[0]]))
+    return [names[idx] for idx, _ in ranked]
+
+
+def tag_pair_fields(pairs: Sequence[PairRecord], index: Dict[str, Any]) -> int:
+    """Set ``field_candidates`` on every pair from its key; returns how many pairs matched a field."""
+    by_key: Dict[str, List[str]] = {}
+    matched = 0
+    for pair in pairs:
+        candidates = by_key.get(pair.key)
+        if candidates is None:
+            candidates = by_key[pair.key] = match_lexicon_fields(index, pair.key)
+        pair.field_candidates = candidates
+        matched += 1 if candidates else 0
+    return matched
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Extract structured key/value candidates from PDF text and tables."
@@ -883,11 +3266,50 @@ def main() -> int:
     parser.add_argument("--max-pairs", type=int, default=5000)
     parser.add_argument("--enable-scanned-ocr", default="0")
     parser.add_argument("--scanned-ocr-backend", default="auto")
+    parser.add_argument(
+        "--ocr-engine",
+        default="auto",
+        help="tesserocr (persistent API), tesseract_batch (one CLI run per document) or pytesseract (one spawn per image)",
+    )
     parser.add_argument("--scanned-ocr-max-pages", type=int, default=8)
     parser.add_argument("--scanned-ocr-max-pairs", type=int, default=1200)
     parser.add_argument("--scanned-ocr-min-chars-per-page", type=int, default=45)
     parser.add_argument("--scanned-ocr-min-lines-per-page", type=int, default=3)
     parser.add_argument("--scanned-ocr-min-confidence", type=float, default=0.55)
+    parser.add_argument("--layout-pairs", default="1")
+    parser.add_argument("--roi-ocr", default="0", help="1 = OCR large embedded images on text pages")
+    parser.add_argument("--roi-ocr-max-regions", type=int, default=6)
+    parser.add_argument("--unit-normalization", default="1", help="emit numeric_value/min/max and canonical_unit per pair")
+    parser.add_argument("--lexicon", default="", help="category lexicon JSON; tags pairs with field_candidates")
+    parser.add_argument("--lexicon-index", default="", help="compiled lexicon index path (default: inside --cache-dir)")
+    parser.add_argument("--lexicon-drop-unmatched", default="0", help="1 = drop pairs whose key matches no lexicon field")
+    parser.add_argument("--table-pivot", default="1", help="emit one pair per (row, model column) on comparison tables")
+    parser.add_argument("--cache-dir", default="", help="reuse payloads for identical PDF bytes and extraction options")
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=512,
+        help="prune least recently used payloads past this size after each write (0 = unbounded)",
+    )
+    parser.add_argument("--page-routing", default="1", help="auto backend only: route each page by table evidence")
+    parser.add_argument("--page-timeout-ms", type=int, default=20000)
+    parser.add_argument(
+        "--deadline-ms",
+        type=int,
+        default=0,
+        help="write a partial payload and exit once this much time has passed (checked between pages)",
+    )
+    parser.add_argument("--router-stats", default="", help="JSON file of learned per-backend timing/yield stats")
+    parser.add_argument("--source-host", default="")
+    parser.add_argument(
+        "--triage",
+        default="0",
+        help="1 = skip extraction/OCR when the first pages score low_value; only = report the triage verdict and exit",
+    )
+    parser.add_argument("--triage-pages", type=int, default=2)
+    parser.add_argument("--estimate", default="0", help="1 = only predict extraction cost from sampled pages and exit")
+    parser.add_argument("--estimate-sample-pages", type=int, default=4)
+    parser.add_argument("--triage-min-score", type=float, default=TRIAGE_MIN_SCORE)
     args = parser.parse_args()
 
     max_pages = max(1, int(args.max_pages))
@@ -896,15 +3318,260 @@ def main() -> int:
     requested_backend = normalize_backend(args.backend)
     enable_scanned_ocr = parse_bool_token(args.enable_scanned_ocr, False)
     requested_scanned_ocr_backend = normalize_ocr_backend(args.scanned_ocr_backend)
+    requested_ocr_engine = normalize(str(args.ocr_engine or "auto")).lower().replace("-", "_")
     scanned_ocr_max_pages = max(1, int(args.scanned_ocr_max_pages))
     scanned_ocr_max_pairs = max(50, int(args.scanned_ocr_max_pairs))
     scanned_ocr_min_chars_per_page = max(0, int(args.scanned_ocr_min_chars_per_page))
     scanned_ocr_min_lines_per_page = max(0, int(args.scanned_ocr_min_lines_per_page))
     scanned_ocr_min_confidence = max(0.0, min(1.0, float(args.scanned_ocr_min_confidence)))
+    layout_pairs = parse_bool_token(args.layout_pairs, True)
+    roi_ocr = parse_bool_token(args.roi_ocr, False)
+    roi_ocr_max_regions = max(1, int(args.roi_ocr_max_regions))
+    page_routing = parse_bool_token(args.page_routing, True)
+    table_pivot = parse_bool_token(args.table_pivot, True)
+    unit_normalization = parse_bool_token(args.unit_normalization, True)
+    page_timeout_ms = max(0, int(args.page_timeout_ms))
+    deadline_ms = max(0, int(args.deadline_ms))
+    triage_mode = normalize(str(args.triage or "")).lower()
+    triage_only = triage_mode == "only"
+    triage_enabled = triage_only or parse_bool_token(triage_mode, False)
+    triage_pages = max(1, int(args.triage_pages))
+    triage_min_score = max(0.0, min(1.0, float(args.triage_min_score)))
 
     available = detect_available_backends()
     available_ocr = detect_available_ocr_backends()
 
+    if parse_bool_token(args.estimate, False):
+        estimate_stats_path = normalize(str(args.router_stats or ""))
+        estimate = estimate_extraction_cost(
+            args.pdf,
+            available=available,
+            requested_backend=requested_backend,
+            max_pages=max_pages,
+            sample_pages=max(1, int(args.estimate_sample_pages)),
+            enable_scanned_ocr=bool(enable_scanned_ocr) and any(available_ocr.values()),
+            scanned_ocr_max_pages=scanned_ocr_max_pages,
+            scanned_ocr_min_chars_per_page=scanned_ocr_min_chars_per_page,
+            scanned_ocr_min_lines_per_page=scanned_ocr_min_lines_per_page,
+            page_routing=parse_bool_token(args.page_routing, True),
+            router_stats=load_router_stats(estimate_stats_path) if estimate_stats_path else None,
+            source_host=normalize(str(args.source_host or "")).lower(),
+        )
+        write_json(args.out, {"ok": bool(estimate["reader"] != "none"), "estimate": estimate, "errors": estimate["errors"]})
+        print(
+            json.dumps(
+                {
+                    "ok": estimate["reader"] != "none",
+                    "predicted_ms": estimate["predicted_ms"],
+                    "ocr_likely": estimate["ocr_likely"],
+                    "backend": estimate["recommended_backend"],
+                }
+            )
+        )
+        return 0
+
+    cache_dir = normalize(str(args.cache_dir or ""))
+    cache_max_bytes = max(0, int(args.cache_max_mb)) * 1024 * 1024
+    lexicon_path = normalize(str(args.lexicon or ""))
+    lexicon_drop_unmatched = parse_bool_token(args.lexicon_drop_unmatched, False)
+    lexicon_index: Optional[Dict[str, Any]] = None
+    lexicon_error = ""
+    lexicon_load_ms = 0.0
+    if lexicon_path:
+        lexicon_index_path = normalize(str(args.lexicon_index or ""))
+        if not lexicon_index_path and cache_dir:
+            stem = os.path.splitext(os.path.basename(lexicon_path))[0]
+            lexicon_index_path = os.path.join(cache_dir, f"{stem}.acindex.json")
+        started = time.perf_counter()
+        try:
+            lexicon_index = load_lexicon_index(lexicon_path, index_path=lexicon_index_path)
+        except Exception as exc:
+            lexicon_error = f"lexicon_load_failed:{exc}"
+        lexicon_load_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    # Every variant of a product family points at the same PDF; identical bytes and options reuse one payload.
+    cache_key = ""
+    if cache_dir:
+        try:
+            cache_key = payload_cache_key(
+                args.pdf,
+                {
+                    "backend": requested_backend,
+                    "max_pages": max_pages,
+                    "max_pairs": max_pairs,
+                    "max_text_preview_chars": max_text_preview_chars,
+                    "layout_pairs": layout_pairs,
+                    "page_routing": page_routing,
+                    "table_pivot": table_pivot,
+                    "unit_normalization": unit_normalization,
+                    "lexicon": lexicon_index["source_hash"] if lexicon_index else "",
+                    "lexicon_drop_unmatched": lexicon_drop_unmatched,
+                    "enable_scanned_ocr": enable_scanned_ocr,
+                    "roi_ocr": roi_ocr,
+                    "roi_ocr_max_regions": roi_ocr_max_regions,
+                    "scanned_ocr_backend": requested_scanned_ocr_backend,
+                    "ocr_engine": requested_ocr_engine,
+                    "scanned_ocr_max_pages": scanned_ocr_max_pages,
+                    "scanned_ocr_max_pairs": scanned_ocr_max_pairs,
+                    "scanned_ocr_min_chars_per_page": scanned_ocr_min_chars_per_page,
+                    "scanned_ocr_min_lines_per_page": scanned_ocr_min_lines_per_page,
+                    "scanned_ocr_min_confidence": scanned_ocr_min_confidence,
+                    "triage": normalize(str(args.triage or "")).lower(),
+                    "triage_pages": max(1, int(args.triage_pages)),
+                    "triage_min_score": float(args.triage_min_score),
+                },
+            )
+        except Exception:
+            cache_key = ""
+        cached = read_payload_cache(cache_dir, cache_key) if cache_key else None
+        if cached is not None:
+            cached.setdefault("meta", {})["cache"] = {"hit": True, "key": cache_key}
+            write_json(args.out, cached)
+            print(json.dumps({"ok": True, "pairs": len(cached.get("pairs") or []), "cache_hit": True}))
+            return 0
+
+    def store_payload(payload: Dict[str, Any]) -> None:
+        meta = payload.setdefault("meta", {})
+        if not cache_key:
+            return
+        meta["cache"] = {"hit": False, "key": cache_key}
+        # Timed-out or failed pages make a payload incomplete; the next run should try again.
+        if meta.get("pages_timed_out") or meta.get("failed_pages") or payload.get("partial"):
+            return
+        try:
+            write_payload_cache(cache_dir, cache_key, payload)
+            meta["cache"]["pruned"] = prune_payload_cache(cache_dir, cache_max_bytes)["removed"]
+        except Exception as exc:
+            payload.setdefault("errors", []).append(f"payload_cache_write_failed:{exc}")
+
+    progress: Dict[str, Any] = {"fingerprint": {}, "attempts": [], "errors": []}
+
+    def write_partial_payload(dog: ExtractionWatchdog) -> None:
+        raw_partial = list(dog.committed_pairs) + list(dog.tracked_pairs)
+        partial_pages = sorted(
+            list(dog.committed_pages) + list(dog.tracked_pages),
+            key=lambda page: int(page.get("page_number") or 0),
+        )
+        partial_pairs = dedupe_pairs(raw_partial, max_pairs)
+        partial_rows, partial_kv, partial_table = serialize_pairs(partial_pairs)
+        partial_backend = dog.committed_backend or dog.tracked_backend or "legacy"
+        partial_preview = normalize("\n".join(str(page.get("text") or "") for page in partial_pages))
+        partial_payload = {
+            "ok": True,
+            "partial": True,
+            "backend": {
+                "requested": requested_backend,
+                "selected": partial_backend,
+                "fallback_used": partial_backend == "legacy",
+                "reason": "deadline_exceeded",
+                "attempts": progress["attempts"],
+                "available": available,
+            },
+            "pairs": partial_rows,
+            "kv_pairs": partial_kv,
+            "table_pairs": partial_table,
+            "ocr_pairs": [],
+            "ocr_kv_pairs": [],
+            "ocr_table_pairs": [],
+            "ocr_text_preview": "",
+            "text_preview": partial_preview[:max_text_preview_chars],
+            "pages": partial_pages,
+            "meta": {
+                "pages_scanned": len(partial_pages),
+                "lines_scanned": 0,
+                "tables_found": 0,
+                "pairs_before_dedupe": len(raw_partial),
+                "pairs_after_dedupe": len(partial_pairs),
+                "kv_pairs_count": len(partial_kv),
+                "table_pairs_count": len(partial_table),
+                "backend_requested": requested_backend,
+                "backend_selected": partial_backend,
+                "backend_reason": "deadline_exceeded",
+                "pdf_fingerprint": progress["fingerprint"],
+                "deadline_exceeded": True,
+                "deadline_stage": dog.stage,
+                "deadline_source": dog.deadline_source,
+                "page_budget_enforced": dog.page_budget_enforced,
+                "page_budget_status": dog.page_budget_status,
+                "pages_timed_out": dog.timed_out_page_numbers(),
+                "page_timeouts": list(dog.pages_timed_out),
+                "scanned_pdf_detected": False,
+                "scanned_pdf_ocr_enabled": bool(enable_scanned_ocr),
+                "scanned_pdf_ocr_attempted": dog.stage == "ocr",
+                "scanned_pdf_ocr_backend_requested": requested_scanned_ocr_backend,
+                "scanned_pdf_ocr_backend_selected": "none",
+                "scanned_pdf_ocr_pair_count": 0,
+                "scanned_pdf_ocr_error": "deadline_exceeded" if dog.stage == "ocr" else "",
+            },
+            "errors": list(progress["errors"]) + [f"deadline_exceeded:{dog.stage}"],
+        }
+        write_json(args.out, partial_payload)
+        sys.stdout.write(json.dumps({"ok": True, "pairs": len(partial_pairs), "backend": partial_backend, "partial": True}))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    watchdog = ExtractionWatchdog(
+        page_timeout_ms=page_timeout_ms,
+        deadline_ms=deadline_ms,
+        on_deadline=write_partial_payload,
+    )
+
+    triage: Optional[Dict[str, Any]] = None
+    if triage_enabled:
+        triage = triage_pdf(
+            args.pdf,
+            available=available,
+            max_pages=triage_pages,
+            min_score=triage_min_score,
+            watchdog=watchdog,
+        )
+        if triage_only or triage["verdict"] == "low_value":
+            payload = {
+                "ok": True,
+                "skipped": not triage_only,
+                "backend": {
+                    "requested": requested_backend,
+                    "selected": str(triage.get("backend") or "none"),
+                    "fallback_used": False,
+                    "reason": f"triage_{triage['verdict']}",
+                    "attempts": [],
+                    "available": available,
+                },
+                "pairs": [],
+                "kv_pairs": [],
+                "table_pairs": [],
+                "ocr_pairs": [],
+                "ocr_kv_pairs": [],
+                "ocr_table_pairs": [],
+                "ocr_text_preview": "",
+                "text_preview": "",
+                "pages": [],
+                "meta": {
+                    "pages_scanned": int(triage.get("pages_read") or 0),
+                    "lines_scanned": int(triage["signals"].get("lines") or 0),
+                    "tables_found": 0,
+                    "pairs_before_dedupe": 0,
+                    "pairs_after_dedupe": 0,
+                    "kv_pairs_count": 0,
+                    "table_pairs_count": 0,
+                    "triage": triage,
+                    "scanned_pdf_detected": False,
+                    "scanned_pdf_ocr_enabled": bool(enable_scanned_ocr),
+                    "scanned_pdf_ocr_attempted": False,
+                    "scanned_pdf_ocr_backend_requested": requested_scanned_ocr_backend,
+                    "scanned_pdf_ocr_backend_selected": "none",
+                    "scanned_pdf_ocr_pair_count": 0,
+                    "scanned_pdf_ocr_error": "",
+                },
+                "errors": [triage["error"]] if triage.get("error") else [],
+            }
+            watchdog.close()
+            if not triage_only:
+                store_payload(payload)
+            write_json(args.out, payload)
+            print(json.dumps({"ok": True, "pairs": 0, "triage": triage["verdict"], "score": triage["score"]}))
+            return 0
+
     fingerprint: Dict[str, Any] = {
         "pages_scanned": 0,
         "tables_found": 0,
@@ -915,56 +3582,168 @@ def main() -> int:
     }
 
     fingerprint_errors: List[str] = []
-    if available.get("pdfplumber"):
+    page_probe: List[Dict[str, Any]] = []
+    page_routes: List[Tuple[str, List[int]]] = []
+    if (
+        page_routing
+        and requested_backend == "auto"
+        and available.get("pymupdf")
+        and (available.get("pdfplumber") or available.get("camelot"))
+    ):
+        # The PyMuPDF probe doubles as the fingerprint, so pdfplumber's table pass never runs on text-only pages.
+        try:
+            page_probe = probe_pages_with_pymupdf(args.pdf, max_pages, watchdog=watchdog)
+            fingerprint = fingerprint_from_page_probe(page_probe)
+            page_routes = plan_page_routes(page_probe, available)
+        except Exception as exc:
+            fingerprint_errors.append(f"pymupdf_page_probe_failed:{exc}")
+    if not page_probe and available.get("pdfplumber"):
         try:
-            fingerprint = fingerprint_with_pdfplumber(args.pdf, max_pages)
+            fingerprint = fingerprint_with_pdfplumber(args.pdf, max_pages, watchdog=watchdog)
         except Exception as exc:
             fingerprint_errors.append(f"pdfplumber_fingerprint_failed:{exc}")
-    elif available.get("pymupdf"):
+    elif not page_probe and available.get("pymupdf"):
         try:
-            fingerprint = fingerprint_with_pymupdf(args.pdf, max_pages)
+            fingerprint = fingerprint_with_pymupdf(args.pdf, max_pages, watchdog=watchdog)
         except Exception as exc:
             fingerprint_errors.append(f"pymupdf_fingerprint_failed:{exc}")
 
-    backend_choice = choose_backend(requested_backend, available, fingerprint)
+    progress["fingerprint"] = fingerprint
+    progress["errors"] = fingerprint_errors
+
+    router_stats_path = normalize(str(args.router_stats or ""))
+    source_host = normalize(str(args.source_host or "")).lower()
+    cost_choice = None
+    if router_stats_path and not fingerprint_errors:
+        cost_choice = choose_backend_by_cost(
+            requested_backend,
+            available,
+            fingerprint,
+            load_router_stats(router_stats_path),
+            source_host,
+        )
+    backend_choice = None
+    if page_routes and cost_choice and (cost_choice.get("cost_model") or {}).get("scope") == "explore":
+        # Exploration runs one backend over the whole document so its timings can be learned from.
+        page_routes = []
+    if page_routes:
+        table_backend = cost_model_table_backend(cost_choice)
+        if table_backend:
+            page_routes = plan_page_routes(page_probe, available, table_backend=table_backend)
+        routed = ",".join(f"{backend}={len(pages)}" for backend, pages in page_routes)
+        if table_backend:
+            routed += f"|table_backend:{cost_choice['reason']}"
+        backend_choice = {
+            "requested": requested_backend,
+            "selected": max(page_routes, key=lambda group: len(group[1]))[0],
+            "fallback_used": False,
+            "reason": f"auto_page_routing:{routed}",
+            "table_density": fingerprint.get("table_density", 0.0),
+            "pages_scanned": fingerprint.get("pages_scanned", 0),
+            "tables_found": fingerprint.get("tables_found", 0),
+            "cost_model": (cost_choice or {}).get("cost_model") if table_backend else None,
+        }
+    else:
+        backend_choice = cost_choice
+    backend_choice = backend_choice or choose_backend(requested_backend, available, fingerprint)
     selected_backend = normalize_backend(str(backend_choice.get("selected") or "legacy"))
     attempts = build_attempt_order(selected_backend, available)
+    progress["attempts"] = attempts
 
     extraction: Optional[Dict[str, Any]] = None
     extraction_error = ""
     used_backend = selected_backend
 
-    for backend in attempts:
+    pending_pages: Optional[List[int]] = None
+    page_backends: Dict[str, str] = {}
+    page_failures: List[Dict[str, Any]] = []
+    backend_runs: List[Dict[str, Any]] = []
+
+    failed_on: Dict[int, set] = {}
+
+    def run_backend(backend: str, page_numbers: Optional[List[int]]) -> Optional[List[int]]:
+        """Run one backend over some pages and fold it in; returns the pages that raised, or None if it never ran."""
+        nonlocal extraction, extraction_error, used_backend
+        run_started = time.monotonic()
         try:
-            if backend == "pdfplumber":
-                extraction = extract_with_pdfplumber(
-                    pdf_path=args.pdf,
-                    max_pages=max_pages,
-                    max_pairs=max_pairs,
-                    max_text_preview_chars=max_text_preview_chars,
-                )
-            elif backend == "pymupdf":
-                extraction = extract_with_pymupdf(
-                    pdf_path=args.pdf,
-                    max_pages=max_pages,
-                    max_pairs=max_pairs,
-                    max_text_preview_chars=max_text_preview_chars,
-                )
-            elif backend == "camelot":
-                extraction = extract_with_camelot(
-                    pdf_path=args.pdf,
-                    max_pages=max_pages,
-                    max_pairs=max_pairs,
-                    max_text_preview_chars=max_text_preview_chars,
-                )
-            else:
-                extraction = None
-            if extraction is not None:
-                used_backend = backend
-                break
+            result = run_extraction_backend(
+                backend,
+                pdf_path=args.pdf,
+                max_pages=max_pages,
+                max_pairs=max_pairs,
+                max_text_preview_chars=max_text_preview_chars,
+                layout_pairs=layout_pairs,
+                watchdog=watchdog,
+                page_numbers=page_numbers,
+                table_pivot=table_pivot,
+            )
         except Exception as exc:
             extraction_error = str(exc)
+            backend_runs.append(
+                {
+                    "backend": backend,
+                    "elapsed_ms": max(1, int((time.monotonic() - run_started) * 1000)),
+                    "whole_document": page_numbers is None,
+                    "failed": True,
+                }
+            )
+            for page_number in page_numbers or []:
+                failed_on.setdefault(page_number, set()).add(backend)
+            return None
+        if result is None:
+            return None
+
+        result_meta = result.get("meta") if isinstance(result.get("meta"), dict) else {}
+        backend_runs.append(
+            {
+                "backend": backend,
+                "elapsed_ms": max(1, int((time.monotonic() - run_started) * 1000)),
+                "pages": len(result.get("pages") or []),
+                "page_numbers": sorted(int(page.get("page_number") or 0) for page in result.get("pages") or []),
+                "whole_document": page_numbers is None,
+                "failed": False,
+            }
+        )
+        failed_rows = [row for row in result_meta.get("failed_pages") or [] if isinstance(row, dict)]
+        for row in failed_rows:
+            page_failures.append({"backend": backend, **row})
+            failed_on.setdefault(int(row.get("page_number") or 0), set()).add(backend)
+        for page in result.get("pages") or []:
+            page_backends[str(int(page.get("page_number") or 0))] = backend
+
+        if extraction is None:
+            extraction = result
+            used_backend = backend
+        else:
+            extraction = merge_extractions(extraction, result)
+        watchdog.commit(backend=used_backend, pages=extraction.get("pages") or [], pairs=extraction.get("pairs") or [])
+        return sorted({int(row.get("page_number") or 0) for row in failed_rows})
+
+    if page_routes:
+        routed_failures: set = set()
+        for backend, route_pages in page_routes:
+            failed = run_backend(backend, route_pages)
+            routed_failures.update(route_pages if failed is None else failed)
+        pending_pages = sorted(routed_failures)
+
+    for backend in attempts:
+        if pending_pages is not None and not pending_pages:
+            break
+        retry_pages = None
+        if pending_pages is not None:
+            retry_pages = [page for page in pending_pages if backend not in failed_on.get(page, set())]
+            if not retry_pages:
+                continue
+        failed = run_backend(backend, retry_pages)
+        if failed is None:
             continue
+        # Only pages that raised are retried on the next backend; everything else is kept.
+        skipped = set(pending_pages or []) - set(retry_pages or [])
+        pending_pages = sorted(set(failed) | skipped)
+
+    if page_backends:
+        page_counts = {token: list(page_backends.values()).count(token) for token in attempts}
+        used_backend = max(attempts, key=lambda token: page_counts.get(token, 0))
 
     if extraction is None:
         payload = {
@@ -1011,13 +3790,49 @@ def main() -> int:
             },
             "errors": fingerprint_errors,
         }
+        watchdog.close()
+        payload["meta"]["pages_timed_out"] = watchdog.timed_out_page_numbers()
+        payload["meta"]["page_timeouts"] = list(watchdog.pages_timed_out)
         write_json(args.out, payload)
         print(json.dumps({"ok": False, "pairs": 0}))
         return 0
 
     raw_pairs = extraction.get("pairs") or []
     deduped_pairs = dedupe_pairs(raw_pairs, max_pairs)
-    kv_pairs, table_pairs = split_pairs_by_surface(deduped_pairs)
+    quantity_pairs_count = normalize_pair_quantities(deduped_pairs) if unit_normalization else 0
+    lexicon_meta: Optional[Dict[str, Any]] = None
+    if lexicon_index:
+        started = time.perf_counter()
+        lexicon_matched = tag_pair_fields(deduped_pairs, lexicon_index)
+        lexicon_unmatched = len(deduped_pairs) - lexicon_matched
+        if lexicon_drop_unmatched and lexicon_unmatched:
+            deduped_pairs = [pair for pair in deduped_pairs if pair.field_candidates]
+        lexicon_meta = {
+            "fields": len(lexicon_index["fields"]),
+            "synonyms": int(lexicon_index.get("synonyms") or 0),
+            "index": lexicon_index.get("loaded_from"),
+            "load_ms": lexicon_load_ms,
+            "match_ms": round((time.perf_counter() - started) * 1000, 3),
+            "matched_pairs": lexicon_matched,
+            "unmatched_pairs": lexicon_unmatched,
+            "dropped_pairs": lexicon_unmatched if lexicon_drop_unmatched else 0,
+        }
+    pair_rows, kv_pairs, table_pairs = serialize_pairs(deduped_pairs)
+
+    for run in backend_runs:
+        run_pages = set(run.get("page_numbers") or [])
+        run["pairs"] = sum(
+            1
+            for pair in deduped_pairs
+            if pair.backend == run["backend"] and pair.page in run_pages
+        )
+    router_stats_error = ""
+    learned_runs = router_stats_runs(backend_runs)
+    if router_stats_path and learned_runs:
+        try:
+            record_router_stats(router_stats_path, fingerprint=fingerprint, source_host=source_host, runs=learned_runs)
+        except Exception as exc:
+            router_stats_error = f"router_stats_write_failed:{exc}"
 
     text_preview = normalize(str(extraction.get("text_preview") or ""))
     text_preview = text_preview[:max_text_preview_chars]
@@ -1044,6 +3859,7 @@ def main() -> int:
     ocr_text_preview = ""
     ocr_confidence_avg = 0.0
     ocr_low_confidence_pairs = 0
+    ocr_meta: Dict[str, Any] = {}
     if bool(enable_scanned_ocr) and scanned_pdf_detected:
         ocr_attempted = True
         if ocr_backend_selected == "paddleocr":
@@ -1063,10 +3879,16 @@ def main() -> int:
                     max_pairs=scanned_ocr_max_pairs,
                     max_text_preview_chars=max_text_preview_chars,
                     min_confidence=scanned_ocr_min_confidence,
+                    watchdog=watchdog,
+                    engine=requested_ocr_engine,
                 )
                 ocr_raw_pairs = ocr_extraction.get("pairs") if isinstance(ocr_extraction.get("pairs"), list) else []
-                ocr_pairs = dedupe_pairs(ocr_raw_pairs, scanned_ocr_max_pairs)
-                ocr_kv_pairs, ocr_table_pairs = split_pairs_by_surface(ocr_pairs)
+                ocr_deduped = dedupe_pairs(ocr_raw_pairs, scanned_ocr_max_pairs)
+                if unit_normalization:
+                    normalize_pair_quantities(ocr_deduped)
+                if lexicon_index:
+                    tag_pair_fields(ocr_deduped, lexicon_index)
+                ocr_pairs, ocr_kv_pairs, ocr_table_pairs = serialize_pairs(ocr_deduped)
                 ocr_text_preview = normalize(str(ocr_extraction.get("text_preview") or ""))[:max_text_preview_chars]
                 ocr_meta = ocr_extraction.get("meta") if isinstance(ocr_extraction.get("meta"), dict) else {}
                 ocr_confidence_avg = float(ocr_meta.get("ocr_confidence_avg") or 0.0)
@@ -1076,6 +3898,39 @@ def main() -> int:
         else:
             ocr_error = ocr_error or f"unsupported_ocr_backend:{ocr_backend_selected}"
 
+    # Text pages with a spec table pasted in as a picture never trip whole-document OCR; read just the pictures.
+    roi_rows: List[Dict[str, Any]] = []
+    roi_kv_rows: List[Dict[str, Any]] = []
+    roi_error = ""
+    roi_meta: Dict[str, Any] = {"enabled": bool(roi_ocr), "attempted": False}
+    if roi_ocr and not ocr_attempted:
+        roi_meta["attempted"] = True
+        if not available_ocr.get("tesseract"):
+            roi_error = "ocr_backend_unavailable"
+        else:
+            try:
+                roi_extraction = extract_with_roi_ocr(
+                    pdf_path=args.pdf,
+                    max_pages=max_pages,
+                    max_pairs=scanned_ocr_max_pairs,
+                    max_regions=roi_ocr_max_regions,
+                    min_confidence=scanned_ocr_min_confidence,
+                    min_page_chars=scanned_ocr_min_chars_per_page,
+                    watchdog=watchdog,
+                    engine=requested_ocr_engine,
+                )
+                roi_deduped = dedupe_pairs(roi_extraction["pairs"], scanned_ocr_max_pairs)
+                if unit_normalization:
+                    normalize_pair_quantities(roi_deduped)
+                if lexicon_index:
+                    tag_pair_fields(roi_deduped, lexicon_index)
+                roi_rows, roi_kv_rows, _ = serialize_pairs(roi_deduped)
+                roi_meta.update(roi_extraction["meta"])
+            except Exception as exc:
+                roi_error = str(exc)
+    roi_meta["pair_count"] = len(roi_rows)
+    roi_meta["error"] = roi_error
+
     payload = {
         "ok": True,
         "backend": {
@@ -1085,12 +3940,15 @@ def main() -> int:
             "reason": str(backend_choice.get("reason") or ""),
             "attempts": attempts,
             "available": available,
+            "cost_model": backend_choice.get("cost_model"),
+            "runs": backend_runs,
+            "router_stats_recorded": bool(router_stats_path and learned_runs and not router_stats_error),
         },
-        "pairs": deduped_pairs,
+        "pairs": pair_rows,
         "kv_pairs": kv_pairs,
         "table_pairs": table_pairs,
-        "ocr_pairs": ocr_pairs,
-        "ocr_kv_pairs": ocr_kv_pairs,
+        "ocr_pairs": ocr_pairs + roi_rows,
+        "ocr_kv_pairs": ocr_kv_pairs + roi_kv_rows,
         "ocr_table_pairs": ocr_table_pairs,
         "ocr_text_preview": ocr_text_preview,
         "text_preview": text_preview,
@@ -1103,6 +3961,15 @@ def main() -> int:
             "pairs_after_dedupe": len(deduped_pairs),
             "kv_pairs_count": len(kv_pairs),
             "table_pairs_count": len(table_pairs),
+            "layout_pairs_before_dedupe": int(extraction_meta.get("layout_pairs_before_dedupe") or 0),
+            "quantity_pairs_count": quantity_pairs_count,
+            "lexicon": lexicon_meta,
+            "page_backends": page_backends,
+            "page_routes": {backend: route_pages for backend, route_pages in page_routes},
+            "page_probe": page_probe,
+            "page_fallback_count": sum(1 for token in page_backends.values() if token != used_backend),
+            "page_failures": page_failures,
+            "failed_pages": pending_pages or [],
             "backend_requested": requested_backend,
             "backend_selected": used_backend,
             "backend_fallback_used": bool(backend_choice.get("fallback_used") or used_backend != selected_backend),
@@ -1123,15 +3990,35 @@ def main() -> int:
             "scanned_pdf_ocr_confidence_avg": float(ocr_confidence_avg),
             "scanned_pdf_ocr_low_confidence_pairs": int(ocr_low_confidence_pairs),
             "scanned_pdf_ocr_error": str(ocr_error or ""),
+            "scanned_pdf_ocr_engine": str(ocr_meta.get("ocr_engine") or "none"),
+            "scanned_pdf_ocr_engine_calls": int(ocr_meta.get("ocr_engine_calls") or 0),
+            "scanned_pdf_ocr_engine_ms": float(ocr_meta.get("ocr_engine_ms") or 0.0),
+            "scanned_pdf_ocr_bytes_copied": int(ocr_meta.get("ocr_bytes_copied") or 0),
+            "scanned_pdf_ocr_bytes_copied_per_page": int(ocr_meta.get("ocr_bytes_copied_per_page") or 0),
+            "roi_ocr": roi_meta,
+            "page_timeout_ms": page_timeout_ms,
+            "page_budget_enforced": watchdog.page_budget_enforced,
+            "page_budget_status": watchdog.page_budget_status,
+            "pages_timed_out": watchdog.timed_out_page_numbers(),
+            "page_timeouts": list(watchdog.pages_timed_out),
+            "triage": triage,
         },
         "errors": fingerprint_errors,
     }
 
     if extraction_error:
         payload.setdefault("errors", []).append(extraction_error)
+    if router_stats_error:
+        payload.setdefault("errors", []).append(router_stats_error)
+    if lexicon_error:
+        payload.setdefault("errors", []).append(lexicon_error)
     if ocr_error:
         payload.setdefault("errors", []).append(f"scanned_pdf_ocr:{ocr_error}")
+    if roi_error:
+        payload.setdefault("errors", []).append(f"roi_ocr:{roi_error}")
 
+    watchdog.close()
+    store_payload(payload)
     write_json(args.out, payload)
     print(
         json.dumps(
@@ -1146,4 +4033,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main())
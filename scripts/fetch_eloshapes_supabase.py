@@ -1,15 +1,48 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import math
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 
+class TokenBucket:
+    """Thread-safe token bucket shared by page workers: ``rate`` requests per second, ``burst`` banked.
+
+    A rate of 0 or less never blocks.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.waited_s = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait_s = (1.0 - self.tokens) / self.rate
+                self.waited_s += wait_s
+            time.sleep(wait_s)
+
+
 def normalize_token(value: str) -> str:
     value = value or ""
     value = value.lower().strip()
@@ -28,6 +61,37 @@ def make_url(endpoint: str) -> str:
     )
 
 
+def build_server_filter(required_tokens: List[str], columns: List[str]) -> Tuple[str, str]:
+    """PostgREST logic filter: every token must ilike-match at least one of ``columns``.
+
+    Tokens are already normalized to ``[a-z0-9 ]``, so spaces become ``*``
+    wildcards and nothing needs quoting. Within a column the pattern accepts
+    everything the contiguous match in row_matches() accepts, but only those
+    columns are searched while row_matches() searches the whole row, so the
+    caller passes just the tokens known to live in them (brand and model).
+    row_matches() stays the final check.
+    """
+    if not required_tokens or not columns:
+        return "", ""
+    groups = []
+    for token in required_tokens:
+        pattern = "*" + "*".join(token.split()) + "*"
+        groups.append(",".join(f"{column}.ilike.{pattern}" for column in columns))
+    if len(groups) == 1:
+        return "or", f"({groups[0]})"
+    return "and", "(" + ",".join(f"or({group})" for group in groups) + ")"
+
+
+def with_query_param(url: str, key: str, value: str) -> str:
+    parsed = urllib.parse.urlparse(url)
+    query = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
+    query[key] = [value]
+    new_query = urllib.parse.urlencode(query, doseq=True, safe="*(),.")
+    return urllib.parse.urlunparse(
+        (parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment)
+    )
+
+
 def parse_content_range(value: str) -> Optional[int]:
     token = str(value or "").strip()
     if "/" not in token:
@@ -83,15 +147,21 @@ def fetch_page_with_retry(
     timeout_seconds: int,
     max_retries: int,
     retry_base_ms: int,
-    verbose: bool
+    verbose: bool,
+    limiter: Optional[TokenBucket] = None
 ) -> Tuple[List[Dict[str, Any]], str, int]:
     delay = max(0.05, retry_base_ms / 1000.0)
     attempt = 0
 
     while True:
+        if limiter is not None:
+            limiter.acquire()
         try:
             return fetch_page_once(url, anon_key, start, end, timeout_seconds)
         except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, ValueError) as exc:
+            if isinstance(exc, urllib.error.HTTPError) and 400 <= exc.code < 500 and exc.code not in {408, 429}:
+                # A rejected request (bad filter, auth) fails the same way again; let the caller fall back now.
+                raise exc
             if attempt >= max_retries:
                 raise exc
             attempt += 1
@@ -104,6 +174,176 @@ def fetch_page_with_retry(
             time.sleep(sleep_for)
 
 
+def fetch_pages(
+    url: str,
+    anon_key: str,
+    rows: List[Dict[str, Any]],
+    page_trace: List[Dict[str, Any]],
+    page_size: int,
+    max_pages: int,
+    max_rows: int,
+    request_delay_s: float,
+    timeout_seconds: int,
+    max_retries: int,
+    retry_base_ms: int,
+    verbose: bool,
+    concurrency: int = 1,
+    limiter: Optional[TokenBucket] = None
+) -> Optional[int]:
+    """Page through ``url`` with Range headers, appending to ``rows``/``page_trace``; returns the reported total.
+
+    With ``concurrency`` above 1, once the first page reports a total the
+    remaining ranges go to fetch_pages_concurrently(); without a total the
+    walk stays sequential.
+    """
+    total_count_reported: Optional[int] = None
+    for page_index in range(max_pages):
+        if page_index == 1 and concurrency > 1 and total_count_reported is not None:
+            fetch_pages_concurrently(
+                url=url,
+                anon_key=anon_key,
+                rows=rows,
+                page_trace=page_trace,
+                total=total_count_reported,
+                page_size=page_size,
+                max_pages=max_pages,
+                max_rows=max_rows,
+                timeout_seconds=timeout_seconds,
+                max_retries=max_retries,
+                retry_base_ms=retry_base_ms,
+                verbose=verbose,
+                concurrency=concurrency,
+                limiter=limiter,
+            )
+            return total_count_reported
+
+        start = page_index * page_size
+        end = start + page_size - 1
+
+        page_rows, content_range, status = fetch_page_with_retry(
+            url=url,
+            anon_key=anon_key,
+            start=start,
+            end=end,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_base_ms=retry_base_ms,
+            verbose=verbose,
+            limiter=limiter if concurrency > 1 else None,
+        )
+
+        page_trace.append(
+            {
+                "page_index": page_index,
+                "range_start": start,
+                "range_end": end,
+                "status": status,
+                "rows": len(page_rows),
+                "content_range": content_range,
+            }
+        )
+
+        maybe_total = parse_content_range(content_range)
+        if maybe_total is not None:
+            total_count_reported = maybe_total
+
+        if not page_rows:
+            break
+
+        rows.extend(page_rows)
+
+        if len(rows) >= max_rows:
+            del rows[max_rows:]
+            break
+
+        if len(page_rows) < page_size:
+            break
+
+        if total_count_reported is not None and len(rows) >= total_count_reported:
+            break
+
+        if request_delay_s > 0 and concurrency <= 1:
+            time.sleep(request_delay_s)
+    return total_count_reported
+
+
+def fetch_pages_concurrently(
+    url: str,
+    anon_key: str,
+    rows: List[Dict[str, Any]],
+    page_trace: List[Dict[str, Any]],
+    total: int,
+    page_size: int,
+    max_pages: int,
+    max_rows: int,
+    timeout_seconds: int,
+    max_retries: int,
+    retry_base_ms: int,
+    verbose: bool,
+    concurrency: int,
+    limiter: Optional[TokenBucket]
+) -> None:
+    """Fetch pages 1..N of a known total on a bounded pool, then append rows and trace in page order.
+
+    Every requested page gets a trace entry, including the one that failed;
+    pages queued behind a failure are cancelled. Rows are kept only up to the
+    first failed or short page so the result stays a contiguous prefix.
+    """
+    wanted_rows = min(total, max_rows)
+    last_page = min(max_pages, math.ceil(wanted_rows / page_size))
+    page_indexes = list(range(1, last_page))
+    if not page_indexes:
+        return
+
+    def fetch(page_index: int) -> Tuple[List[Dict[str, Any]], str, int]:
+        start = page_index * page_size
+        return fetch_page_with_retry(
+            url=url,
+            anon_key=anon_key,
+            start=start,
+            end=start + page_size - 1,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_base_ms=retry_base_ms,
+            verbose=verbose,
+            limiter=limiter,
+        )
+
+    first_error: Optional[BaseException] = None
+    contiguous = True
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(page_indexes)))) as pool:
+        futures = [(page_index, pool.submit(fetch, page_index)) for page_index in page_indexes]
+        for page_index, future in futures:
+            start = page_index * page_size
+            entry: Dict[str, Any] = {
+                "page_index": page_index,
+                "range_start": start,
+                "range_end": start + page_size - 1,
+            }
+            if future.cancelled():
+                continue
+            try:
+                page_rows, content_range, status = future.result()
+            except Exception as exc:
+                entry.update({"status": getattr(exc, "code", None), "rows": 0, "content_range": "", "error": str(exc)})
+                page_trace.append(entry)
+                if first_error is None:
+                    first_error = exc
+                    for _, pending in futures:
+                        pending.cancel()
+                contiguous = False
+                continue
+            entry.update({"status": status, "rows": len(page_rows), "content_range": content_range})
+            page_trace.append(entry)
+            if contiguous:
+                rows.extend(page_rows)
+                contiguous = len(page_rows) == page_size
+    if len(rows) > max_rows:
+        del rows[max_rows:]
+    if first_error is not None:
+        raise first_error
+
+
 def row_matches(row: Dict[str, Any], required_tokens: List[str]) -> bool:
     if not required_tokens:
         return True
@@ -131,10 +371,27 @@ def main() -> int:
     parser.add_argument("--brand", default="")
     parser.add_argument("--model", default="")
     parser.add_argument("--variant", default="")
+    parser.add_argument(
+        "--filter-columns",
+        default="brand,model,name",
+        help="name columns the brand/model tokens are pushed to as PostgREST ilike filters; empty disables",
+    )
     parser.add_argument("--page-size", type=int, default=1000)
     parser.add_argument("--max-pages", type=int, default=50)
     parser.add_argument("--max-rows", type=int, default=50000)
     parser.add_argument("--request-delay-ms", type=int, default=120)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="page workers once the first page reports a total; 1 keeps the sequential walk",
+    )
+    parser.add_argument(
+        "--rate-limit-rps",
+        type=float,
+        default=0.0,
+        help="requests per second shared by the workers (default: 1000 / --request-delay-ms)",
+    )
     parser.add_argument("--timeout-seconds", type=int, default=30)
     parser.add_argument("--max-retries", type=int, default=3)
     parser.add_argument("--retry-base-ms", type=int, default=250)
@@ -151,6 +408,11 @@ def main() -> int:
     timeout_seconds = max(1, int(args.timeout_seconds))
     max_retries = max(0, int(args.max_retries))
     retry_base_ms = max(10, int(args.retry_base_ms))
+    concurrency = max(1, int(args.concurrency))
+    rate_limit_rps = float(args.rate_limit_rps)
+    if rate_limit_rps <= 0:
+        rate_limit_rps = 1.0 / request_delay_s if request_delay_s > 0 else 0.0
+    limiter = TokenBucket(rate_limit_rps, burst=concurrency) if concurrency > 1 else None
 
     required_tokens = [
         token
@@ -162,58 +424,53 @@ def main() -> int:
         if token
     ]
 
+    # Variant text can sit in any column (name, sku, colorway), so only brand and model go to the server.
+    server_tokens = [token for token in [normalize_token(args.brand), normalize_token(args.model)] if token]
+    filter_columns = [column.strip() for column in str(args.filter_columns or "").split(",") if column.strip()]
+    filter_key, filter_value = build_server_filter(server_tokens, filter_columns)
+    existing_query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+    server_filter: Dict[str, Any] = {
+        "columns": filter_columns,
+        "predicate": f"{filter_key}={filter_value}" if filter_key else "",
+        "applied": False,
+        "fallback_reason": "",
+    }
+    fetch_url = url
+    if filter_key and ("or" in existing_query or "and" in existing_query):
+        server_filter["fallback_reason"] = "endpoint_has_logic_filter"
+    elif filter_key:
+        fetch_url = with_query_param(url, filter_key, filter_value)
+        server_filter["applied"] = True
+
     rows: List[Dict[str, Any]] = []
     page_trace: List[Dict[str, Any]] = []
     total_count_reported: Optional[int] = None
+    fetch_options = {
+        "anon_key": args.anon_key,
+        "rows": rows,
+        "page_trace": page_trace,
+        "page_size": page_size,
+        "max_pages": max_pages,
+        "max_rows": max_rows,
+        "request_delay_s": request_delay_s,
+        "timeout_seconds": timeout_seconds,
+        "max_retries": max_retries,
+        "retry_base_ms": retry_base_ms,
+        "verbose": args.verbose,
+        "concurrency": concurrency,
+        "limiter": limiter,
+    }
 
     try:
-        for page_index in range(max_pages):
-            start = page_index * page_size
-            end = start + page_size - 1
-
-            page_rows, content_range, status = fetch_page_with_retry(
-                url=url,
-                anon_key=args.anon_key,
-                start=start,
-                end=end,
-                timeout_seconds=timeout_seconds,
-                max_retries=max_retries,
-                retry_base_ms=retry_base_ms,
-                verbose=args.verbose,
-            )
-
-            page_trace.append(
-                {
-                    "page_index": page_index,
-                    "range_start": start,
-                    "range_end": end,
-                    "status": status,
-                    "rows": len(page_rows),
-                    "content_range": content_range,
-                }
-            )
-
-            maybe_total = parse_content_range(content_range)
-            if maybe_total is not None:
-                total_count_reported = maybe_total
-
-            if not page_rows:
-                break
-
-            rows.extend(page_rows)
-
-            if len(rows) >= max_rows:
-                rows = rows[:max_rows]
-                break
-
-            if len(page_rows) < page_size:
-                break
-
-            if total_count_reported is not None and len(rows) >= total_count_reported:
-                break
-
-            if request_delay_s > 0:
-                time.sleep(request_delay_s)
+        try:
+            total_count_reported = fetch_pages(fetch_url, **fetch_options)
+        except urllib.error.HTTPError as exc:
+            if not server_filter["applied"] or exc.code != 400 or rows:
+                raise
+            # A filter column the table does not have is a 400; pull unfiltered and let row_matches() decide.
+            server_filter["applied"] = False
+            server_filter["fallback_reason"] = sanitize_error_message(f"http_400: {exc.reason}", args.anon_key)
+            total_count_reported = fetch_pages(url, **fetch_options)
 
     except Exception as exc:
         payload = {
@@ -223,6 +480,7 @@ def main() -> int:
             "fetched_pages": len(page_trace),
             "total_rows": len(rows),
             "matched_rows": 0,
+            "server_filter": server_filter,
             "rows": [],
             "page_trace": page_trace,
             "elapsed_ms": int((time.time() - started_at) * 1000),
@@ -246,11 +504,17 @@ def main() -> int:
         "fetched_pages": len(page_trace),
         "total_rows": len(rows),
         "matched_rows": len(matched),
+        "server_returned_rows": len(rows),
+        "locally_rejected_rows": len(rows) - len(matched),
+        "server_filter": server_filter,
         "total_count_reported": total_count_reported,
         "page_size": page_size,
         "max_pages": max_pages,
         "max_rows": max_rows,
         "request_delay_ms": int(args.request_delay_ms),
+        "concurrency": concurrency,
+        "rate_limit_rps": round(rate_limit_rps, 3) if limiter else None,
+        "rate_limit_wait_ms": int(limiter.waited_s * 1000) if limiter else 0,
         "rows": matched,
         "page_trace": page_trace,
         "elapsed_ms": int((time.time() - started_at) * 1000),
@@ -262,6 +526,8 @@ def main() -> int:
             {
                 "ok": True,
                 "matched_rows": len(matched),
+                "server_returned_rows": len(rows),
+                "server_filter_applied": server_filter["applied"],
                 "fetched_pages": len(page_trace),
                 "elapsed_ms": payload["elapsed_ms"],
             }
@@ -197,6 +197,10 @@ export const eloShapesAdapter = {
         job.identityLock?.model || '',
         '--variant',
         job.identityLock?.variant || '',
+        '--filter-columns',
+        String(config.eloSupabaseFilterColumns ?? 'brand,model,name'),
+        '--concurrency',
+        String(Math.max(1, Number(config.eloSupabaseFetchConcurrency || 1))),
         '--out',
         outPath
       ]);
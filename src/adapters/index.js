@@ -22,6 +22,7 @@ function emptyPdfStats() {
     docs_fetched: 0,
     docs_parsed: 0,
     docs_failed: 0,
+    docs_skipped_low_value: 0,
     backend_selected_counts: {},
     backend_fallback_count: 0,
     pair_count: 0,
@@ -61,6 +62,7 @@ function mergePdfStats(into = {}, extra = {}) {
   base.docs_fetched += Number(next.docs_fetched || 0);
   base.docs_parsed += Number(next.docs_parsed || 0);
   base.docs_failed += Number(next.docs_failed || 0);
+  base.docs_skipped_low_value += Number(next.docs_skipped_low_value || 0);
   base.backend_fallback_count += Number(next.backend_fallback_count || 0);
   base.pair_count += Number(next.pair_count || 0);
   base.kv_pair_count += Number(next.kv_pair_count || 0);
@@ -65,7 +65,7 @@ function sameDomainFamily(sourceHost, targetUrl) {
   }
 }
 
-function runCommand(command, args, timeoutMs = 120000) {
+function runCommand(command, args, timeoutMs = 120000, { termAfterMs = 0 } = {}) {
   return new Promise((resolve, reject) => {
     const child = spawn(command, args, {
       stdio: ['ignore', 'pipe', 'pipe']
@@ -83,6 +83,14 @@ function runCommand(command, args, timeoutMs = 120000) {
       child.kill('SIGKILL');
       reject(new Error(`Command timeout: ${command}`));
     }, timeoutMs);
+    // A soft deadline asks the child to write what it has and exit before the hard kill.
+    const termTimer = termAfterMs > 0 && termAfterMs < timeoutMs
+      ? setTimeout(() => {
+        if (!finished) {
+          child.kill('SIGTERM');
+        }
+      }, termAfterMs)
+      : null;
 
     child.stdout.on('data', (chunk) => {
       stdout += chunk.toString();
@@ -98,6 +106,7 @@ function runCommand(command, args, timeoutMs = 120000) {
       }
       finished = true;
       clearTimeout(timer);
+      clearTimeout(termTimer);
       reject(error);
     });
 
@@ -107,6 +116,7 @@ function runCommand(command, args, timeoutMs = 120000) {
       }
       finished = true;
       clearTimeout(timer);
+      clearTimeout(termTimer);
       if (code !== 0) {
         reject(new Error(stderr || stdout || `command failed with code ${code}`));
         return;
@@ -127,6 +137,7 @@ function createEmptyPdfStats({
     docs_fetched: 0,
     docs_parsed: 0,
     docs_failed: 0,
+    docs_skipped_low_value: 0,
     backend_selected_counts: {},
     backend_fallback_count: 0,
     pair_count: 0,
@@ -206,7 +217,55 @@ function normalizePairRows(rows = [], { backend = 'legacy' } = {}) {
   return out;
 }
 
-async function parsePdfViaPython(buffer, config = {}) {
+// Samples a few pages through `extract_pdf_kv.py --estimate` and returns its cost prediction
+// (predicted_ms, recommended_backend, ocr_likely) without running the extraction.
+export async function estimatePdfViaPython(buffer, config = {}, { sourceHost = '' } = {}) {
+  const tmpRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-estimate-'));
+  const pdfPath = path.join(tmpRoot, 'input.pdf');
+  const outPath = path.join(tmpRoot, 'estimate.json');
+  const routerEnabled = config?.pdfBackendRouterEnabled !== false;
+  const requestedBackend = normalizePdfBackend(
+    routerEnabled ? (config?.pdfPreferredBackend || 'auto') : 'pdfplumber',
+    routerEnabled ? 'auto' : 'pdfplumber'
+  );
+  const maxPages = Math.max(1, Number.parseInt(String(config?.pdfBackendRouterMaxPages || 60), 10) || 60);
+  const routerStatsPath = routerEnabled && config?.pdfBackendRouterCostModelEnabled !== false
+    ? path.resolve(String(config?.pdfBackendRouterStatsPath || path.join('data', 'learning', 'pdf_backend_yield_map.json')))
+    : '';
+
+  try {
+    await fs.writeFile(pdfPath, buffer);
+    await runCommand('python', [
+      path.resolve('scripts', 'extract_pdf_kv.py'),
+      '--pdf',
+      pdfPath,
+      '--out',
+      outPath,
+      '--estimate',
+      '1',
+      '--backend',
+      requestedBackend,
+      '--max-pages',
+      String(maxPages),
+      '--enable-scanned-ocr',
+      config?.scannedPdfOcrEnabled === true ? '1' : '0',
+      '--page-routing',
+      config?.pdfBackendRouterPageRoutingEnabled !== false ? '1' : '0',
+      '--router-stats',
+      routerStatsPath,
+      '--source-host',
+      String(sourceHost || '')
+    ], 30_000);
+    const parsed = JSON.parse(await fs.readFile(outPath, 'utf8'));
+    return parsed?.ok && parsed?.estimate && typeof parsed.estimate === 'object'
+      ? parsed.estimate
+      : null;
+  } finally {
+    await fs.rm(tmpRoot, { recursive: true, force: true });
+  }
+}
+
+async function parsePdfViaPython(buffer, config = {}, { sourceHost = '' } = {}) {
   const tmpRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-'));
   const pdfPath = path.join(tmpRoot, 'input.pdf');
   const outPath = path.join(tmpRoot, 'output.json');
@@ -222,8 +281,30 @@ async function parsePdfViaPython(buffer, config = {}) {
     Number.parseInt(String(config?.pdfBackendRouterMaxTextPreviewChars || 20000), 10) || 20000
   );
   const timeoutMs = Math.max(10_000, Number.parseInt(String(config?.pdfBackendRouterTimeoutMs || 120000), 10) || 120000);
+  const pageTimeoutMs = Math.max(0, Number.parseInt(String(config?.pdfBackendRouterPageTimeoutMs ?? 20000), 10) || 0);
+  // SIGTERM at the deadline leaves the extractor headroom to write its partial payload before the hard kill.
+  // Windows cannot deliver a catchable SIGTERM, so there the extractor's own --deadline-ms clock is the only signal.
+  const deadlineMs = Math.max(5_000, timeoutMs - 5_000);
+  const termAfterMs = process.platform === 'win32' ? 0 : deadlineMs;
+  const routerStatsPath = routerEnabled && config?.pdfBackendRouterCostModelEnabled !== false
+    ? path.resolve(String(config?.pdfBackendRouterStatsPath || path.join('data', 'learning', 'pdf_backend_yield_map.json')))
+    : '';
+  const pageRoutingEnabled = config?.pdfBackendRouterPageRoutingEnabled !== false;
+  const tablePivotEnabled = config?.pdfTablePivotEnabled !== false;
+  const cacheDir = config?.pdfExtractCacheEnabled !== false
+    ? path.resolve(String(config?.pdfExtractCacheDir || path.join('.specfactory_tmp', 'pdf_cache')))
+    : '';
+  const cacheMaxMb = Math.max(0, Number.parseInt(String(config?.pdfExtractCacheMaxMb ?? 512), 10) || 0);
+  const lexiconPath = String(config?.pdfLexiconPath || '').trim()
+    ? path.resolve(String(config.pdfLexiconPath))
+    : '';
+  const triageEnabled = config?.pdfTriageEnabled === true;
+  const triageMinScore = Math.max(0, Math.min(1, Number.parseFloat(String(config?.pdfTriageMinScore ?? 0.2)) || 0));
   const scannedOcrEnabled = config?.scannedPdfOcrEnabled === true;
+  const roiOcrEnabled = scannedOcrEnabled && config?.scannedPdfRoiOcrEnabled !== false;
+  const roiOcrMaxRegions = Math.max(1, Number.parseInt(String(config?.scannedPdfRoiOcrMaxRegions || 6), 10) || 6);
   const scannedOcrBackend = String(config?.scannedPdfOcrBackend || 'auto').trim() || 'auto';
+  const scannedOcrEngine = String(config?.scannedPdfOcrEngine || 'auto').trim() || 'auto';
   const scannedOcrMaxPages = Math.max(1, Number.parseInt(String(config?.scannedPdfOcrMaxPages || 8), 10) || 8);
   const scannedOcrMaxPairs = Math.max(50, Number.parseInt(String(config?.scannedPdfOcrMaxPairs || 1200), 10) || 1200);
   const scannedOcrMinCharsPerPage = Math.max(
@@ -259,6 +340,8 @@ async function parsePdfViaPython(buffer, config = {}) {
       scannedOcrEnabled ? '1' : '0',
       '--scanned-ocr-backend',
       scannedOcrBackend,
+      '--ocr-engine',
+      scannedOcrEngine,
       '--scanned-ocr-max-pages',
       String(scannedOcrMaxPages),
       '--scanned-ocr-max-pairs',
@@ -268,8 +351,36 @@ async function parsePdfViaPython(buffer, config = {}) {
       '--scanned-ocr-min-lines-per-page',
       String(scannedOcrMinLinesPerPage),
       '--scanned-ocr-min-confidence',
-      String(scannedOcrMinConfidence)
-    ], timeoutMs);
+      String(scannedOcrMinConfidence),
+      '--roi-ocr',
+      roiOcrEnabled ? '1' : '0',
+      '--roi-ocr-max-regions',
+      String(roiOcrMaxRegions),
+      '--page-timeout-ms',
+      String(pageTimeoutMs),
+      '--deadline-ms',
+      String(deadlineMs),
+      '--page-routing',
+      pageRoutingEnabled ? '1' : '0',
+      '--table-pivot',
+      tablePivotEnabled ? '1' : '0',
+      '--cache-dir',
+      cacheDir,
+      '--cache-max-mb',
+      String(cacheMaxMb),
+      '--lexicon',
+      lexiconPath,
+      '--lexicon-drop-unmatched',
+      config?.pdfLexiconDropUnmatched === true ? '1' : '0',
+      '--router-stats',
+      routerStatsPath,
+      '--source-host',
+      String(sourceHost || ''),
+      '--triage',
+      triageEnabled ? '1' : '0',
+      '--triage-min-score',
+      String(triageMinScore)
+    ], timeoutMs, { termAfterMs });
 
     const parsed = JSON.parse(await fs.readFile(outPath, 'utf8'));
     const backendMeta = parsed?.backend && typeof parsed.backend === 'object'
@@ -525,7 +636,13 @@ export const manufacturerAdapter = {
           continue;
         }
 
-        const parsed = await parsePdfViaPython(bytes, config);
+        // The prediction is kept next to the measured parse time so the cost model's accuracy can be audited.
+        const estimate = config?.pdfExtractEstimateEnabled === true
+          ? await estimatePdfViaPython(bytes, config, { sourceHost: source.host }).catch(() => null)
+          : null;
+        const parseStartedAt = Date.now();
+        const parsed = await parsePdfViaPython(bytes, config, { sourceHost: source.host });
+        const parseElapsedMs = Date.now() - parseStartedAt;
         const tableCandidates = mapPairsToFieldCandidates(parsed.tablePairs, 'pdf_table');
         const kvCandidates = mapPairsToFieldCandidates(parsed.kvPairs, 'pdf_kv');
         const textCandidates = mapPdfTextToCandidates(parsed.textPreview, 'pdf_kv');
@@ -550,6 +667,7 @@ export const manufacturerAdapter = {
           tables_found: parsed?.meta?.tables_found
         });
         pdfStats.docs_parsed += parsed.ok ? 1 : 0;
+        pdfStats.docs_skipped_low_value += parsed?.meta?.triage?.verdict === 'low_value' ? 1 : 0;
         pdfStats.docs_failed += parsed.ok ? 0 : 1;
         pdfStats.backend_fallback_count += summary.backend_fallback_used ? 1 : 0;
         pdfStats.pair_count += summary.pair_count;
@@ -621,6 +739,16 @@ export const manufacturerAdapter = {
           scanned_pdf_ocr_confidence_avg: Number.isFinite(scannedOcrConfidenceAvg) ? scannedOcrConfidenceAvg : 0,
           scanned_pdf_ocr_low_confidence_pairs: Math.max(0, scannedOcrLowConfidencePairs),
           scanned_pdf_ocr_error: scannedOcrError || '',
+          estimate: estimate
+            ? {
+              predicted_ms: Number(estimate.predicted_ms || 0),
+              recommended_backend: String(estimate.recommended_backend || ''),
+              backend_reason: String(estimate.backend_reason || ''),
+              ms_per_page_source: String(estimate.ms_per_page_source || ''),
+              ocr_likely: Boolean(estimate.ocr_likely)
+            }
+            : null,
+          parse_elapsed_ms: parseElapsedMs,
           meta: parsed.meta || {}
         });
       } catch {
@@ -400,17 +400,36 @@ export function loadConfig(overrides = {}) {
     pdfBackendRouterEnabled: parseBoolEnv('PDF_BACKEND_ROUTER_ENABLED', false),
     pdfPreferredBackend: process.env.PDF_PREFERRED_BACKEND || 'auto',
     pdfBackendRouterTimeoutMs: parseIntEnv('PDF_BACKEND_ROUTER_TIMEOUT_MS', 120_000),
+    pdfBackendRouterPageTimeoutMs: parseIntEnv('PDF_BACKEND_ROUTER_PAGE_TIMEOUT_MS', 20_000),
+    pdfBackendRouterPageRoutingEnabled: parseBoolEnv('PDF_BACKEND_ROUTER_PAGE_ROUTING_ENABLED', true),
+    pdfBackendRouterCostModelEnabled: parseBoolEnv('PDF_BACKEND_ROUTER_COST_MODEL_ENABLED', true),
+    pdfBackendRouterStatsPath:
+      process.env.PDF_BACKEND_ROUTER_STATS_PATH || path.join('data', 'learning', 'pdf_backend_yield_map.json'),
     pdfBackendRouterMaxPages: parseIntEnv('PDF_BACKEND_ROUTER_MAX_PAGES', 60),
     pdfBackendRouterMaxPairs: parseIntEnv('PDF_BACKEND_ROUTER_MAX_PAIRS', 5000),
     pdfBackendRouterMaxTextPreviewChars: parseIntEnv('PDF_BACKEND_ROUTER_MAX_TEXT_PREVIEW_CHARS', 20_000),
+    pdfTablePivotEnabled: parseBoolEnv('PDF_TABLE_PIVOT_ENABLED', true),
+    pdfExtractCacheEnabled: parseBoolEnv('PDF_EXTRACT_CACHE_ENABLED', true),
+    pdfExtractCacheDir: process.env.PDF_EXTRACT_CACHE_DIR || '.specfactory_tmp/pdf_cache',
+    pdfExtractCacheMaxMb: parseIntEnv('PDF_EXTRACT_CACHE_MAX_MB', 512),
+    pdfExtractEstimateEnabled: parseBoolEnv('PDF_EXTRACT_ESTIMATE_ENABLED', false),
+    excelSeedCacheEnabled: parseBoolEnv('EXCEL_SEED_CACHE_ENABLED', true),
+    excelSeedCacheDir: process.env.EXCEL_SEED_CACHE_DIR || '.specfactory_tmp/excel_seed_cache',
+    pdfLexiconPath: process.env.PDF_LEXICON_PATH || '',
+    pdfLexiconDropUnmatched: parseBoolEnv('PDF_LEXICON_DROP_UNMATCHED', false),
+    pdfTriageEnabled: parseBoolEnv('PDF_TRIAGE_ENABLED', false),
+    pdfTriageMinScore: parseFloatEnv('PDF_TRIAGE_MIN_SCORE', 0.2),
     scannedPdfOcrEnabled: parseBoolEnv('SCANNED_PDF_OCR_ENABLED', true),
     scannedPdfOcrPromoteCandidates: parseBoolEnv('SCANNED_PDF_OCR_PROMOTE_CANDIDATES', true),
     scannedPdfOcrBackend: process.env.SCANNED_PDF_OCR_BACKEND || 'auto',
+    scannedPdfOcrEngine: process.env.SCANNED_PDF_OCR_ENGINE || 'auto',
     scannedPdfOcrMaxPages: parseIntEnv('SCANNED_PDF_OCR_MAX_PAGES', 4),
     scannedPdfOcrMaxPairs: parseIntEnv('SCANNED_PDF_OCR_MAX_PAIRS', 800),
     scannedPdfOcrMinCharsPerPage: parseIntEnv('SCANNED_PDF_OCR_MIN_CHARS_PER_PAGE', 30),
     scannedPdfOcrMinLinesPerPage: parseIntEnv('SCANNED_PDF_OCR_MIN_LINES_PER_PAGE', 2),
     scannedPdfOcrMinConfidence: parseFloatEnv('SCANNED_PDF_OCR_MIN_CONFIDENCE', 0.5),
+    scannedPdfRoiOcrEnabled: parseBoolEnv('SCANNED_PDF_ROI_OCR_ENABLED', true),
+    scannedPdfRoiOcrMaxRegions: parseIntEnv('SCANNED_PDF_ROI_OCR_MAX_REGIONS', 6),
     concurrency: parseIntEnv('CONCURRENCY', 2),
     perHostMinDelayMs: parseIntEnv('PER_HOST_MIN_DELAY_MS', 300),
     fetchSchedulerEnabled: parseBoolEnv('FETCH_SCHEDULER_ENABLED', false),
@@ -449,6 +468,8 @@ export function loadConfig(overrides = {}) {
     duckduckgoTimeoutMs: parseIntEnv('DUCKDUCKGO_TIMEOUT_MS', 8_000),
     eloSupabaseAnonKey: process.env.ELO_SUPABASE_ANON_KEY || '',
     eloSupabaseEndpoint: process.env.ELO_SUPABASE_ENDPOINT || '',
+    eloSupabaseFilterColumns: process.env.ELO_SUPABASE_FILTER_COLUMNS ?? 'brand,model,name',
+    eloSupabaseFetchConcurrency: parseIntEnv('ELO_SUPABASE_FETCH_CONCURRENCY', 4),
     llmEnabled: parseBoolEnv('LLM_ENABLED', false),
     llmWriteSummary: parseBoolEnv('LLM_WRITE_SUMMARY', false),
     llmPlanDiscoveryQueries: parseBoolEnv('LLM_PLAN_DISCOVERY_QUERIES', false),
@@ -849,6 +870,10 @@ export function loadConfig(overrides = {}) {
     10_000,
     Math.min(300_000, Number.parseInt(String(merged.pdfBackendRouterTimeoutMs ?? 120_000), 10) || 120_000)
   );
+  merged.pdfBackendRouterPageTimeoutMs = Math.max(
+    0,
+    Math.min(120_000, Number.parseInt(String(merged.pdfBackendRouterPageTimeoutMs ?? 20_000), 10) || 0)
+  );
   merged.pdfBackendRouterMaxPages = Math.max(
     1,
     Math.min(300, Number.parseInt(String(merged.pdfBackendRouterMaxPages ?? 60), 10) || 60)
@@ -861,6 +886,14 @@ export function loadConfig(overrides = {}) {
     1000,
     Math.min(100_000, Number.parseInt(String(merged.pdfBackendRouterMaxTextPreviewChars ?? 20_000), 10) || 20_000)
   );
+  merged.pdfExtractCacheMaxMb = Math.max(
+    0,
+    Math.min(100_000, Number.parseInt(String(merged.pdfExtractCacheMaxMb ?? 512), 10) || 0)
+  );
+  merged.pdfTriageMinScore = Math.max(
+    0,
+    Math.min(1, Number.parseFloat(String(merged.pdfTriageMinScore ?? 0.2)) || 0)
+  );
   merged.scannedPdfOcrBackend = normalizeScannedPdfOcrBackend(merged.scannedPdfOcrBackend || 'auto', 'auto');
   merged.scannedPdfOcrMaxPages = Math.max(
     1,
@@ -882,6 +915,10 @@ export function loadConfig(overrides = {}) {
     0,
     Math.min(1, Number.parseFloat(String(merged.scannedPdfOcrMinConfidence ?? 0.55)) || 0.55)
   );
+  merged.scannedPdfRoiOcrMaxRegions = Math.max(
+    1,
+    Math.min(50, Number.parseInt(String(merged.scannedPdfRoiOcrMaxRegions ?? 6), 10) || 6)
+  );
   merged.structuredMetadataExtructUrl = normalizeBaseUrl(
     merged.structuredMetadataExtructUrl || 'http://127.0.0.1:8011/extract/structured'
   );
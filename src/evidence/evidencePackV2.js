@@ -1053,6 +1053,7 @@ export function buildEvidencePackV2({
         docs_fetched: Number(pdfStats?.docs_fetched || 0),
         docs_parsed: Number(pdfStats?.docs_parsed || 0),
         docs_failed: Number(pdfStats?.docs_failed || 0),
+        docs_skipped_low_value: Number(pdfStats?.docs_skipped_low_value || 0),
         backend_requested: String(pdfStats?.requested_backend || ''),
         backend_selected: String(pdfStats?.backend_selected || ''),
         backend_fallback_count: Number(pdfStats?.backend_fallback_count || 0),
@@ -0,0 +1,98 @@
+import path from 'node:path';
+import readline from 'node:readline';
+import { spawn } from 'node:child_process';
+
+const DEFAULT_SCRIPT_PATH = path.resolve('scripts', 'extract_pdf_any.py');
+
+// Keeps one `extract_pdf_any.py --serve` process alive so docling loads its layout
+// models once. Jobs go out as NDJSON on stdin; each summary line carries the job id.
+export function startPdfAnyWorker({
+  command = 'python',
+  scriptPath = DEFAULT_SCRIPT_PATH,
+  args = [],
+  env = process.env
+} = {}) {
+  const child = spawn(command, [scriptPath, '--serve', ...args], {
+    stdio: ['pipe', 'pipe', 'pipe'],
+    env
+  });
+  const pending = new Map();
+  let nextId = 1;
+  let stderr = '';
+  let exitError = null;
+
+  const failPending = (error) => {
+    exitError = exitError || error;
+    for (const { reject } of pending.values()) {
+      reject(exitError);
+    }
+    pending.clear();
+  };
+
+  const lines = readline.createInterface({ input: child.stdout, crlfDelay: Infinity });
+  lines.on('line', (line) => {
+    const text = line.trim();
+    if (!text) {
+      return;
+    }
+    let summary;
+    try {
+      summary = JSON.parse(text);
+    } catch {
+      return;
+    }
+    const entry = pending.get(summary?.id);
+    if (!entry) {
+      return;
+    }
+    pending.delete(summary.id);
+    entry.resolve(summary);
+  });
+
+  child.stderr.on('data', (chunk) => {
+    stderr += chunk.toString();
+  });
+  child.on('error', (error) => failPending(error));
+  child.on('close', (code) => {
+    failPending(new Error(stderr || `pdf worker exited with code ${code}`));
+  });
+
+  const closed = new Promise((resolve) => child.once('close', resolve));
+
+  function extract({
+    pdfPath,
+    outPath,
+    backend,
+    maxPages,
+    maxPairs,
+    maxTextPreviewChars,
+    doclingMaxPages,
+    doclingTimeBudgetMs
+  } = {}) {
+    if (exitError) {
+      return Promise.reject(exitError);
+    }
+    const id = nextId++;
+    // Unset options fall back to the defaults the worker was started with.
+    const options = Object.entries({
+      backend,
+      max_pages: maxPages,
+      max_pairs: maxPairs,
+      max_text_preview_chars: maxTextPreviewChars,
+      docling_max_pages: doclingMaxPages,
+      docling_time_budget_ms: doclingTimeBudgetMs
+    }).filter(([, value]) => value !== undefined);
+    const job = { id, pdf: pdfPath, out: outPath, ...Object.fromEntries(options) };
+    return new Promise((resolve, reject) => {
+      pending.set(id, { resolve, reject });
+      child.stdin.write(`${JSON.stringify(job)}\n`);
+    });
+  }
+
+  async function close() {
+    child.stdin.end();
+    await closed;
+  }
+
+  return { extract, close };
+}
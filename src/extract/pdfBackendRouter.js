@@ -245,6 +245,12 @@ export function normalizePdfPair(row = {}, {
   const unitHint = normalizeWhitespace(String(row?.unit_hint || inferUnitHint(normalizedKey, normalizedValue))).trim() || null;
   const ocrConfidence = toFloat(row?.ocr_confidence, NaN);
   const ocrLowConfidence = toBool(row?.ocr_low_confidence, false);
+  const numericMin = toFloat(row?.numeric_min, NaN);
+  const numericMax = toFloat(row?.numeric_max, NaN);
+  const numericValue = toFloat(row?.numeric_value, NaN);
+  const fieldCandidates = Array.isArray(row?.field_candidates)
+    ? row.field_candidates.map((token) => String(token || '').trim()).filter(Boolean)
+    : null;
 
   return {
     key: rawKey,
@@ -264,7 +270,16 @@ export function normalizePdfPair(row = {}, {
     bbox,
     backend: backendToken,
     ...(Number.isFinite(ocrConfidence) ? { ocr_confidence: ocrConfidence } : {}),
-    ...(ocrLowConfidence ? { ocr_low_confidence: true } : {})
+    ...(ocrLowConfidence ? { ocr_low_confidence: true } : {}),
+    ...(Number.isFinite(numericMin) && Number.isFinite(numericMax)
+      ? {
+        numeric_value: Number.isFinite(numericValue) ? numericValue : null,
+        numeric_min: numericMin,
+        numeric_max: numericMax,
+        canonical_unit: normalizeWhitespace(String(row?.canonical_unit || '')).trim() || null
+      }
+      : {}),
+    ...(fieldCandidates ? { field_candidates: fieldCandidates } : {})
   };
 }
 
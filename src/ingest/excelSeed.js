@@ -1,7 +1,8 @@
 import fs from 'node:fs/promises';
 import fsSync from 'node:fs';
 import path from 'node:path';
-import { spawnSync } from 'node:child_process';
+import { spawn } from 'node:child_process';
+import readline from 'node:readline';
 import zlib from 'node:zlib';
 import { XMLParser } from 'fast-xml-parser';
 import { toPosixKey } from '../s3/storage.js';
@@ -404,7 +405,7 @@ function buildExcelPayloadFromCells({
   };
 }
 
-function extractExcelPayloadWithNode({
+export function extractExcelPayloadWithNode({
   workbookPath,
   sheet,
   fieldLabelColumn,
@@ -446,6 +447,71 @@ function extractExcelPayloadWithNode({
   });
 }
 
+// The script streams NDJSON: a header with field_rows, one record per product, then a summary.
+// Records are folded into a payload as they arrive, so no stdout size ceiling applies. With
+// onProduct, each product record goes to the callback instead of payload.products, so a caller
+// can keep only its normalized form; the header has already filled payload.field_rows by then.
+function runExcelSeedScript(command, args, { onProduct = null } = {}) {
+  return new Promise((resolve) => {
+    const child = spawn(command, args, {
+      stdio: ['ignore', 'pipe', 'pipe']
+    });
+    const payload = { ok: false, field_rows: [], products: [] };
+    let stderr = '';
+    let parseError = null;
+    let finished = false;
+
+    const finish = (status, error = null) => {
+      if (finished) {
+        return;
+      }
+      finished = true;
+      resolve({ status, error, stderr, payload, parseError });
+    };
+
+    const lines = readline.createInterface({ input: child.stdout, crlfDelay: Infinity });
+    const linesClosed = new Promise((done) => lines.once('close', done));
+    lines.on('line', (line) => {
+      const text = line.trim();
+      if (!text || parseError) {
+        return;
+      }
+      let record;
+      try {
+        record = JSON.parse(text);
+      } catch (error) {
+        parseError = error;
+        return;
+      }
+      const { type, ...rest } = record;
+      if (type === 'product') {
+        if (onProduct) {
+          onProduct(rest, payload);
+        } else {
+          payload.products.push(rest);
+        }
+      } else if (type === 'header') {
+        payload.workbook_path = rest.workbook_path;
+        payload.sheet = rest.sheet;
+        payload.field_rows = toArray(rest.field_rows);
+      } else if (type === 'summary') {
+        const { products: _count, ...summary } = rest;
+        Object.assign(payload, summary);
+      } else {
+        Object.assign(payload, record);
+      }
+    });
+
+    child.stderr.on('data', (chunk) => {
+      stderr += chunk.toString();
+    });
+    child.on('error', (error) => finish(null, error));
+    child.on('close', (status) => {
+      linesClosed.then(() => finish(status));
+    });
+  });
+}
+
 function buildProductId({ category, brand, model, variant }) {
   return canonicalBuildProductId(category, brand, model, variant);
 }
@@ -637,6 +703,7 @@ export async function extractExcelSeedData({
   let payload = null;
   let parserUsed = 'node';
   let pythonFailure = null;
+  let streamedProducts = null;
 
   if (parserMode !== 'python') {
     try {
@@ -699,11 +766,29 @@ export async function extractExcelSeedData({
     if (excel.dataColumnEnd) {
       args.push('--data-column-end', excel.dataColumnEnd);
     }
+    args.push('--format', 'ndjson');
+    if (config.excelSeedCacheEnabled !== false) {
+      args.push(
+        '--cache-dir',
+        path.resolve(String(config.excelSeedCacheDir || path.join('.specfactory_tmp', 'excel_seed_cache')))
+      );
+    }
 
     const command = String(config.pythonCommand || 'python').trim() || 'python';
-    const result = spawnSync(command, args, {
-      encoding: 'utf8',
-      maxBuffer: 16 * 1024 * 1024
+    // Products are normalized as they stream in, so raw values_by_label rows are never all held at once.
+    let streamedFieldRows = null;
+    streamedProducts = [];
+    const result = await runExcelSeedScript(command, args, {
+      onProduct: (row, header) => {
+        streamedFieldRows = streamedFieldRows || normalizeFieldRows({ rows: header.field_rows || [], fieldRules });
+        streamedProducts.push(...normalizeProductRows({
+          rows: [row],
+          fieldRows: streamedFieldRows,
+          category,
+          fieldOrder,
+          fieldRules
+        }));
+      }
     });
     if (result.error || result.status !== 0) {
       return {
@@ -718,19 +803,18 @@ export async function extractExcelSeedData({
       };
     }
 
-    try {
-      payload = JSON.parse(String(result.stdout || '').trim());
-    } catch (error) {
+    if (result.parseError) {
       return {
         enabled: false,
         workbook_path: excel.workbookPath,
         sheet: excel.sheet,
         field_rows: [],
         products: [],
-        error: `invalid_json_output: ${error.message}`,
+        error: `invalid_json_output: ${result.parseError.message}`,
         fallback_error: pythonFailure
       };
     }
+    payload = result.payload;
     parserUsed = 'python';
   }
 
@@ -750,7 +834,7 @@ export async function extractExcelSeedData({
     rows: payload.field_rows || [],
     fieldRules
   });
-  const products = normalizeProductRows({
+  const products = streamedProducts || normalizeProductRows({
     rows: payload.products || [],
     fieldRows,
     category,
@@ -765,7 +849,8 @@ export async function extractExcelSeedData({
     field_rows: fieldRows,
     products,
     error: null,
-    parser: parserUsed
+    parser: parserUsed,
+    cache: payload.cache || null
   };
 }
 
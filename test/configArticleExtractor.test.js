@@ -15,6 +15,7 @@ test('config: parses article extractor env flags', () => {
   const prevPdfRouterEnabled = process.env.PDF_BACKEND_ROUTER_ENABLED;
   const prevPdfPreferredBackend = process.env.PDF_PREFERRED_BACKEND;
   const prevPdfRouterTimeout = process.env.PDF_BACKEND_ROUTER_TIMEOUT_MS;
+  const prevPdfRouterPageTimeout = process.env.PDF_BACKEND_ROUTER_PAGE_TIMEOUT_MS;
   const prevPdfRouterMaxPages = process.env.PDF_BACKEND_ROUTER_MAX_PAGES;
   const prevPdfRouterMaxPairs = process.env.PDF_BACKEND_ROUTER_MAX_PAIRS;
   const prevPdfRouterPreviewChars = process.env.PDF_BACKEND_ROUTER_MAX_TEXT_PREVIEW_CHARS;
@@ -36,6 +37,7 @@ test('config: parses article extractor env flags', () => {
     process.env.PDF_BACKEND_ROUTER_ENABLED = 'true';
     process.env.PDF_PREFERRED_BACKEND = 'camelot';
     process.env.PDF_BACKEND_ROUTER_TIMEOUT_MS = '160000';
+    process.env.PDF_BACKEND_ROUTER_PAGE_TIMEOUT_MS = '12000';
     process.env.PDF_BACKEND_ROUTER_MAX_PAGES = '80';
     process.env.PDF_BACKEND_ROUTER_MAX_PAIRS = '8000';
     process.env.PDF_BACKEND_ROUTER_MAX_TEXT_PREVIEW_CHARS = '28000';
@@ -54,6 +56,7 @@ test('config: parses article extractor env flags', () => {
     assert.equal(cfg.pdfBackendRouterEnabled, true);
     assert.equal(cfg.pdfPreferredBackend, 'camelot');
     assert.equal(cfg.pdfBackendRouterTimeoutMs, 160000);
+    assert.equal(cfg.pdfBackendRouterPageTimeoutMs, 12000);
     assert.equal(cfg.pdfBackendRouterMaxPages, 80);
     assert.equal(cfg.pdfBackendRouterMaxPairs, 8000);
     assert.equal(cfg.pdfBackendRouterMaxTextPreviewChars, 28000);
@@ -82,6 +85,8 @@ test('config: parses article extractor env flags', () => {
     else process.env.PDF_PREFERRED_BACKEND = prevPdfPreferredBackend;
     if (prevPdfRouterTimeout === undefined) delete process.env.PDF_BACKEND_ROUTER_TIMEOUT_MS;
     else process.env.PDF_BACKEND_ROUTER_TIMEOUT_MS = prevPdfRouterTimeout;
+    if (prevPdfRouterPageTimeout === undefined) delete process.env.PDF_BACKEND_ROUTER_PAGE_TIMEOUT_MS;
+    else process.env.PDF_BACKEND_ROUTER_PAGE_TIMEOUT_MS = prevPdfRouterPageTimeout;
     if (prevPdfRouterMaxPages === undefined) delete process.env.PDF_BACKEND_ROUTER_MAX_PAGES;
     else process.env.PDF_BACKEND_ROUTER_MAX_PAGES = prevPdfRouterMaxPages;
     if (prevPdfRouterMaxPairs === undefined) delete process.env.PDF_BACKEND_ROUTER_MAX_PAIRS;
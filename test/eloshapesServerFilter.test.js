@@ -0,0 +1,128 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import http from 'node:http';
+import os from 'node:os';
+import path from 'node:path';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+
+const execFileAsync = promisify(execFile);
+const scriptPath = path.resolve('scripts', 'fetch_eloshapes_supabase.py');
+
+const ROWS = [
+  { id: 1, brand: 'Razer, Inc.', name: 'Viper V3 (Pro)', weight: 54 },
+  { id: 2, brand: 'Razer, Inc.', name: 'Viper V3 HyperSpeed', weight: 82 },
+  { id: 3, brand: 'Zowie', name: 'EC2-CW', weight: 77 }
+];
+
+// PostgREST stand-in: records every query string, and rejects logic filters with a 400 when asked to.
+async function startFakePostgrest({ rejectLogicFilters = false } = {}) {
+  const requests = [];
+  const server = http.createServer((req, res) => {
+    const url = new URL(req.url, 'http://127.0.0.1');
+    requests.push({ search: url.search, params: Object.fromEntries(url.searchParams) });
+    if (rejectLogicFilters && (url.searchParams.has('or') || url.searchParams.has('and'))) {
+      res.writeHead(400, 'Bad Request', { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ message: 'column eloshapes.model does not exist' }));
+      return;
+    }
+    res.writeHead(200, {
+      'Content-Type': 'application/json',
+      'Content-Range': `0-${ROWS.length - 1}/${ROWS.length}`
+    });
+    res.end(JSON.stringify(ROWS));
+  });
+  await new Promise((resolve) => server.listen(0, '127.0.0.1', resolve));
+  return {
+    endpoint: `http://127.0.0.1:${server.address().port}/rest/v1/eloshapes`,
+    requests,
+    close: () => new Promise((resolve) => server.close(resolve))
+  };
+}
+
+async function runFetch(endpoint, args) {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-eloshapes-'));
+  const outPath = path.join(tempRoot, 'out.json');
+  try {
+    await execFileAsync('python', [
+      scriptPath,
+      '--endpoint', endpoint,
+      '--anon-key', 'test-anon-key',
+      '--out', outPath,
+      '--request-delay-ms', '0',
+      '--retry-base-ms', '10',
+      ...args
+    ]).catch((error) => error);
+    return JSON.parse(await fs.readFile(outPath, 'utf8'));
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+}
+
+test('server filter reduces punctuation in brand and model to ilike wildcards', async () => {
+  const server = await startFakePostgrest();
+  try {
+    const payload = await runFetch(server.endpoint, [
+      '--brand', 'Razer, Inc.',
+      '--model', 'Viper V3 (Pro)',
+      '--filter-columns', 'brand,name'
+    ]);
+    const expected = 'and=(or(brand.ilike.*razer*inc*,name.ilike.*razer*inc*),'
+      + 'or(brand.ilike.*viper*v3*pro*,name.ilike.*viper*v3*pro*))';
+
+    assert.equal(payload.ok, true);
+    assert.equal(payload.server_filter.applied, true);
+    assert.equal(payload.server_filter.predicate, expected);
+    assert.equal(server.requests.length, 1);
+    // Commas and parentheses only appear as PostgREST syntax, never from the user's tokens.
+    assert.equal(`and=${server.requests[0].params.and}`, expected);
+    assert.match(server.requests[0].search, /and=\(or\(brand\.ilike\.\*razer\*inc\*,/);
+    // row_matches() stays the final check on whatever the server returns.
+    assert.deepEqual(payload.rows.map((row) => row.id), [1]);
+  } finally {
+    await server.close();
+  }
+});
+
+test('a 400 on the filtered query falls back to one unfiltered walk without retries', async () => {
+  const server = await startFakePostgrest({ rejectLogicFilters: true });
+  try {
+    const payload = await runFetch(server.endpoint, [
+      '--brand', 'Razer',
+      '--model', 'Viper V3 HyperSpeed',
+      '--filter-columns', 'brand,model',
+      '--max-retries', '3'
+    ]);
+
+    assert.equal(payload.ok, true);
+    assert.equal(payload.server_filter.applied, false);
+    assert.match(payload.server_filter.fallback_reason, /^http_400: /);
+    assert.doesNotMatch(payload.server_filter.fallback_reason, /test-anon-key/);
+    assert.equal(server.requests.length, 2);
+    assert.ok(server.requests[0].params.and);
+    assert.equal(server.requests[1].params.and, undefined);
+    assert.deepEqual(payload.rows.map((row) => row.id), [2]);
+  } finally {
+    await server.close();
+  }
+});
+
+test('an endpoint that already carries a logic filter is left untouched', async () => {
+  const server = await startFakePostgrest();
+  try {
+    const payload = await runFetch(`${server.endpoint}?or=(brand.eq.Zowie)`, [
+      '--brand', 'Zowie',
+      '--model', 'EC2-CW'
+    ]);
+
+    assert.equal(payload.server_filter.applied, false);
+    assert.equal(payload.server_filter.fallback_reason, 'endpoint_has_logic_filter');
+    assert.equal(server.requests.length, 1);
+    assert.equal(server.requests[0].params.or, '(brand.eq.Zowie)');
+    assert.equal(server.requests[0].params.and, undefined);
+    assert.deepEqual(payload.rows.map((row) => row.id), [3]);
+  } finally {
+    await server.close();
+  }
+});
@@ -0,0 +1,125 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+import { writeSeedWorkbook } from './helpers/xlsxFixture.js';
+
+const execFileAsync = promisify(execFile);
+const scriptPath = path.resolve('scripts', 'extract_excel_seed.py');
+const FIELDS = ['Weight', 'Sensor'];
+
+async function runSeed(args) {
+  const { stdout } = await execFileAsync('python', [scriptPath, '--field-row-end', '10', ...args]);
+  return JSON.parse(stdout);
+}
+
+function product(brand, model, weight) {
+  return { brand, model, values: { Weight: weight, Sensor: 'PAW3395' } };
+}
+
+test('excel seed cache hits on an unchanged workbook and revalidates a touched one by content hash', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-cache-'));
+  const workbook = path.join(tempRoot, 'seed.xlsx');
+  const cacheDir = path.join(tempRoot, 'cache');
+  await writeSeedWorkbook(workbook, {
+    fields: FIELDS,
+    products: [product('Razer', 'Viper V3 Pro', '54 g'), product('Zowie', 'EC2-CW', '77 g')]
+  });
+
+  try {
+    const cold = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(cold.ok, true);
+    assert.equal(cold.cache.hit, false);
+    assert.equal(cold.products.length, 2);
+
+    const warm = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(warm.cache.hit, true);
+    assert.equal(warm.cache.validated_by, 'stat');
+    assert.deepEqual(warm.products, cold.products);
+    assert.deepEqual(warm.field_rows, cold.field_rows);
+
+    const later = new Date(Date.now() + 60_000);
+    await fs.utimes(workbook, later, later);
+    const touched = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(touched.cache.hit, true);
+    assert.equal(touched.cache.validated_by, 'content_hash');
+    assert.deepEqual(touched.products, cold.products);
+
+    // The refreshed fingerprint lets the next run skip hashing again.
+    const afterTouch = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(afterTouch.cache.validated_by, 'stat');
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
+
+test('excel seed cache misses once the workbook content changes', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-cache-'));
+  const workbook = path.join(tempRoot, 'seed.xlsx');
+  const cacheDir = path.join(tempRoot, 'cache');
+  await writeSeedWorkbook(workbook, {
+    fields: FIELDS,
+    products: [product('Razer', 'Viper V3 Pro', '54 g')]
+  });
+
+  try {
+    await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    await writeSeedWorkbook(workbook, {
+      fields: FIELDS,
+      products: [product('Razer', 'Viper V3 Pro', '55 g'), product('Pulsar', 'X2', '52 g')]
+    });
+    const later = new Date(Date.now() + 60_000);
+    await fs.utimes(workbook, later, later);
+
+    const rebuilt = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(rebuilt.cache.hit, false);
+    assert.deepEqual(
+      rebuilt.products.map((row) => [row.model, row.values_by_label.Weight]),
+      [['Viper V3 Pro', '55 g'], ['X2', '52 g']]
+    );
+
+    const changedLayout = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir, '--field-row-end', '9']);
+    assert.equal(changedLayout.cache.hit, false);
+    assert.deepEqual(changedLayout.field_rows.map((row) => row.label), ['Weight']);
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
+
+test('excel seed NDJSON output fills the cache and replays it line for line', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-cache-'));
+  const workbook = path.join(tempRoot, 'seed.xlsx');
+  const cacheDir = path.join(tempRoot, 'cache');
+  await writeSeedWorkbook(workbook, {
+    fields: FIELDS,
+    products: [product('Razer', 'Viper V3 Pro', '54 g'), product('Zowie', 'EC2-CW', '77 g')]
+  });
+  const runNdjson = async () => {
+    const { stdout } = await execFileAsync('python', [
+      scriptPath, '--field-row-end', '10', '--workbook', workbook, '--cache-dir', cacheDir, '--format', 'ndjson'
+    ]);
+    return stdout.trim().split('\n').map((line) => JSON.parse(line));
+  };
+
+  try {
+    const cold = await runNdjson();
+    const warm = await runNdjson();
+    assert.equal(cold.at(-1).cache.hit, false);
+    assert.equal(warm.at(-1).cache.hit, true);
+    assert.deepEqual(warm.slice(0, -1), cold.slice(0, -1));
+    assert.deepEqual(cold.map((record) => record.type), ['header', 'product', 'product', 'summary']);
+
+    // The entry teed from the NDJSON run also serves JSON output.
+    const json = await runSeed(['--workbook', workbook, '--cache-dir', cacheDir]);
+    assert.equal(json.cache.hit, true);
+    assert.deepEqual(
+      json.products,
+      cold.filter((record) => record.type === 'product').map(({ type, ...row }) => row)
+    );
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
@@ -0,0 +1,105 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+import { writeSeedWorkbook } from './helpers/xlsxFixture.js';
+
+const execFileAsync = promisify(execFile);
+const scriptPath = path.resolve('scripts', 'extract_excel_seed.py');
+const FIELDS = ['Weight', 'Sensor'];
+
+async function runSeed(args) {
+  const { stdout } = await execFileAsync('python', [scriptPath, '--field-row-end', '10', ...args]);
+  return stdout;
+}
+
+function product(brand, model, weight) {
+  return { brand, model, values: { Weight: weight, Sensor: 'PAW3395' } };
+}
+
+async function writeVersions(tempRoot) {
+  const before = path.join(tempRoot, 'before.xlsx');
+  const after = path.join(tempRoot, 'after.xlsx');
+  await writeSeedWorkbook(before, {
+    fields: FIELDS,
+    products: [
+      product('Razer', 'Viper V3 Pro', '54 g'),
+      product('Zowie', 'EC2-CW', '77 g'),
+      product('Pulsar', 'X2', '52 g')
+    ]
+  });
+  // Column D changes weight, column E moves from Pulsar to a new product, column F is added.
+  await writeSeedWorkbook(after, {
+    fields: FIELDS,
+    products: [
+      product('Razer', 'Viper V3 Pro', '54 g'),
+      product('Zowie', 'EC2-CW', '73 g'),
+      product('Lamzu', 'Atlantis', '55 g'),
+      product('Logitech', 'G Pro X2', '60 g')
+    ]
+  });
+  return { before, after };
+}
+
+function assertDelta(output) {
+  assert.equal(output.ok, true);
+  assert.deepEqual(output.manifest.added, ['F']);
+  assert.deepEqual(output.manifest.changed.sort(), ['D', 'E']);
+  assert.deepEqual(output.manifest.removed, []);
+  assert.equal(output.manifest.unchanged, 1);
+  assert.deepEqual(
+    output.products.map((row) => `${row.column}:${row.model}`).sort(),
+    ['D:EC2-CW', 'E:Atlantis', 'F:G Pro X2']
+  );
+}
+
+test('excel seed --since emits only changed columns against previous JSON output', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-since-'));
+  try {
+    const { before, after } = await writeVersions(tempRoot);
+    const previousPath = path.join(tempRoot, 'previous.json');
+    await fs.writeFile(previousPath, await runSeed(['--workbook', before]), 'utf8');
+
+    assertDelta(JSON.parse(await runSeed(['--workbook', after, '--since', previousPath])));
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
+
+test('excel seed --since reads previous NDJSON output', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-since-'));
+  try {
+    const { before, after } = await writeVersions(tempRoot);
+    const previousPath = path.join(tempRoot, 'previous.ndjson');
+    await fs.writeFile(previousPath, await runSeed(['--workbook', before, '--format', 'ndjson']), 'utf8');
+
+    assertDelta(JSON.parse(await runSeed(['--workbook', after, '--since', previousPath])));
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
+
+test('excel seed --since reports removed columns and chains through its own manifest', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-seed-since-'));
+  try {
+    const { before, after } = await writeVersions(tempRoot);
+    const firstPath = path.join(tempRoot, 'first.json');
+    const deltaPath = path.join(tempRoot, 'delta.json');
+    await fs.writeFile(firstPath, await runSeed(['--workbook', after]), 'utf8');
+    await fs.writeFile(deltaPath, await runSeed(['--workbook', before, '--since', firstPath]), 'utf8');
+
+    const delta = JSON.parse(await fs.readFile(deltaPath, 'utf8'));
+    assert.deepEqual(delta.manifest.removed, ['F']);
+    assert.deepEqual(delta.removed.map((row) => row.column), ['F']);
+
+    // A delta carries the full column manifest, so it is a valid baseline for the next run.
+    const unchanged = JSON.parse(await runSeed(['--workbook', before, '--since', deltaPath]));
+    assert.deepEqual(unchanged.products, []);
+    assert.equal(unchanged.manifest.unchanged, 3);
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
@@ -0,0 +1,30 @@
+import fs from 'node:fs/promises';
+import path from 'node:path';
+
+// A pdfplumber stand-in serving fixed text and tables for every page, so the PDF scripts
+// can run on a placeholder file without the real library.
+export async function writeFakePdfplumber(root, { text = '', tables = [], pageCount = 1 } = {}) {
+  const source = [
+    'import json',
+    `TEXT = json.loads(${JSON.stringify(JSON.stringify(text))})`,
+    `TABLES = json.loads(${JSON.stringify(JSON.stringify(tables))})`,
+    'class _Page:',
+    '    width = 612',
+    '    height = 792',
+    '    def __init__(self, number): self.page_number = number',
+    '    def extract_text(self, *args, **kwargs): return TEXT',
+    '    def extract_tables(self, *args, **kwargs): return [list(map(list, table)) for table in TABLES]',
+    'class _Pdf:',
+    `    pages = [_Page(n) for n in range(1, ${Number(pageCount) + 1})]`,
+    '    def __enter__(self): return self',
+    '    def __exit__(self, *exc): return False',
+    'def open(path, *args, **kwargs): return _Pdf()',
+    ''
+  ].join('\n');
+  const modulePath = path.join(root, 'pdfplumber', '__init__.py');
+  await fs.mkdir(path.dirname(modulePath), { recursive: true });
+  await fs.writeFile(modulePath, source, 'utf8');
+  const pdfPath = path.join(root, 'input.pdf');
+  await fs.writeFile(pdfPath, '%PDF-1.4\n%placeholder\n', 'utf8');
+  return { modulesRoot: root, pdfPath };
+}
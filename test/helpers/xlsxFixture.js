@@ -0,0 +1,109 @@
+import fs from 'node:fs/promises';
+import zlib from 'node:zlib';
+
+function columnName(index) {
+  let name = '';
+  let value = index;
+  while (value > 0) {
+    const remainder = (value - 1) % 26;
+    name = String.fromCharCode(65 + remainder) + name;
+    value = Math.floor((value - 1) / 26);
+  }
+  return name;
+}
+
+function escapeXml(value) {
+  return String(value)
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;');
+}
+
+// Stored (uncompressed) zip archive; enough for the stdlib zipfile reader in the seed script.
+function buildZip(entries) {
+  const localParts = [];
+  const centralParts = [];
+  let offset = 0;
+  for (const [name, text] of entries) {
+    const nameBytes = Buffer.from(name, 'utf8');
+    const data = Buffer.from(text, 'utf8');
+    const crc = zlib.crc32(data);
+    const local = Buffer.alloc(30);
+    local.writeUInt32LE(0x04034b50, 0);
+    local.writeUInt16LE(20, 4);
+    local.writeUInt32LE(crc, 14);
+    local.writeUInt32LE(data.length, 18);
+    local.writeUInt32LE(data.length, 22);
+    local.writeUInt16LE(nameBytes.length, 26);
+    localParts.push(local, nameBytes, data);
+
+    const central = Buffer.alloc(46);
+    central.writeUInt32LE(0x02014b50, 0);
+    central.writeUInt16LE(20, 4);
+    central.writeUInt16LE(20, 6);
+    central.writeUInt32LE(crc, 16);
+    central.writeUInt32LE(data.length, 20);
+    central.writeUInt32LE(data.length, 24);
+    central.writeUInt16LE(nameBytes.length, 28);
+    central.writeUInt32LE(offset, 42);
+    centralParts.push(central, nameBytes);
+    offset += local.length + nameBytes.length + data.length;
+  }
+  const centralSize = centralParts.reduce((sum, part) => sum + part.length, 0);
+  const end = Buffer.alloc(22);
+  end.writeUInt32LE(0x06054b50, 0);
+  end.writeUInt16LE(entries.length, 8);
+  end.writeUInt16LE(entries.length, 10);
+  end.writeUInt32LE(centralSize, 12);
+  end.writeUInt32LE(offset, 16);
+  return Buffer.concat([...localParts, ...centralParts, end]);
+}
+
+// Writes a `dataEntry` sheet in the default seed layout: brand/model/variant on rows 3-5,
+// field labels in column B from row 9, one product per column from C.
+export async function writeSeedWorkbook(filePath, { fields = [], products = [] } = {}) {
+  const rows = new Map();
+  const put = (row, col, value) => {
+    if (value === undefined || value === null || value === '') {
+      return;
+    }
+    if (!rows.has(row)) {
+      rows.set(row, []);
+    }
+    rows.get(row).push([col, value]);
+  };
+  products.forEach((product, index) => {
+    const col = 3 + index;
+    put(3, col, product.brand);
+    put(4, col, product.model);
+    put(5, col, product.variant);
+    fields.forEach((field, fieldIndex) => put(9 + fieldIndex, col, product.values?.[field]));
+  });
+  fields.forEach((field, fieldIndex) => put(9 + fieldIndex, 2, field));
+
+  const sheetRows = [...rows.keys()].sort((a, b) => a - b).map((row) => {
+    const cells = rows.get(row)
+      .sort((a, b) => a[0] - b[0])
+      .map(([col, value]) => (
+        `<c r="${columnName(col)}${row}" t="inlineStr"><is><t>${escapeXml(value)}</t></is></c>`
+      ));
+    return `<row r="${row}">${cells.join('')}</row>`;
+  });
+  const sheet = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    + `<sheetData>${sheetRows.join('')}</sheetData></worksheet>`;
+  const workbook = '<?xml version="1.0" encoding="UTF-8"?>'
+    + '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    + 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    + '<sheets><sheet name="dataEntry" sheetId="1" r:id="rId1"/></sheets></workbook>';
+  const rels = '<?xml version="1.0" encoding="UTF-8"?>'
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    + '<Relationship Id="rId1" '
+    + 'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    + 'Target="worksheets/sheet1.xml"/></Relationships>';
+  await fs.writeFile(filePath, buildZip([
+    ['xl/workbook.xml', workbook],
+    ['xl/_rels/workbook.xml.rels', rels],
+    ['xl/worksheets/sheet1.xml', sheet]
+  ]));
+}
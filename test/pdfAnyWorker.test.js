@@ -0,0 +1,103 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { startPdfAnyWorker } from '../src/extract/pdfAnyWorker.js';
+
+// Minimal stand-ins for docling and pdfplumber so the worker runs without the real models.
+const FAKE_MODULES = {
+  'docling/__init__.py': '',
+  'docling/document_converter.py': [
+    'class _Prov:',
+    '    def __init__(self, page_no): self.page_no = page_no',
+    'class _Item:',
+    '    def __init__(self, page_no): self.text = f"Weight: {page_no}0 g"; self.prov = [_Prov(page_no)]',
+    'class _Document:',
+    '    def __init__(self, last):',
+    '        self.pages = {n: object() for n in range(1, last + 1)}',
+    '        self._items = [_Item(n) for n in range(1, last + 1)]',
+    '    def iterate_items(self):',
+    '        for item in self._items: yield item, 0',
+    'class _Input:',
+    '    page_count = 3',
+    'class _Result:',
+    '    def __init__(self, last): self.document = _Document(last); self.input = _Input(); self.status = "success"',
+    'class DocumentConverter:',
+    '    def convert(self, path, page_range=(1, 9999)): return _Result(min(page_range[1], 3))',
+    ''
+  ].join('\n'),
+  'pdfplumber/__init__.py': [
+    'class _Page:',
+    '    def extract_text(self): return "Color: black"',
+    '    def extract_tables(self): return []',
+    'class _Pdf:',
+    '    pages = [_Page(), _Page(), _Page()]',
+    '    def __enter__(self): return self',
+    '    def __exit__(self, *exc): return False',
+    'def open(path): return _Pdf()',
+    ''
+  ].join('\n')
+};
+
+async function writeFakeModules(root) {
+  for (const [relativePath, source] of Object.entries(FAKE_MODULES)) {
+    const filePath = path.join(root, relativePath);
+    await fs.mkdir(path.dirname(filePath), { recursive: true });
+    await fs.writeFile(filePath, source, 'utf8');
+  }
+}
+
+test('pdf worker keeps one docling converter warm across jobs', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-worker-'));
+  const modulesRoot = path.join(tempRoot, 'modules');
+  await writeFakeModules(modulesRoot);
+  const worker = startPdfAnyWorker({
+    args: ['--backend', 'docling'],
+    env: { ...process.env, PYTHONPATH: modulesRoot }
+  });
+
+  try {
+    const first = await worker.extract({
+      pdfPath: path.join(tempRoot, 'a.pdf'),
+      outPath: path.join(tempRoot, 'a.json')
+    });
+    const second = await worker.extract({
+      pdfPath: path.join(tempRoot, 'b.pdf'),
+      outPath: path.join(tempRoot, 'b.json'),
+      doclingMaxPages: 2
+    });
+    assert.equal(first.ok, true);
+    assert.equal(second.ok, true);
+    assert.equal(second.backend_used, 'docling');
+
+    const firstPayload = JSON.parse(await fs.readFile(path.join(tempRoot, 'a.json'), 'utf8'));
+    const secondPayload = JSON.parse(await fs.readFile(path.join(tempRoot, 'b.json'), 'utf8'));
+    assert.equal(firstPayload.meta.converter_reused, false);
+    assert.equal(secondPayload.meta.converter_reused, true);
+    assert.deepEqual(secondPayload.meta.docling_pages, [1, 2]);
+    assert.deepEqual(secondPayload.meta.fallback_pages, [3]);
+  } finally {
+    await worker.close();
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
+
+test('pdf worker reports failed jobs without stopping', async () => {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-worker-'));
+  const worker = startPdfAnyWorker({
+    env: { ...process.env, PYTHONPATH: path.join(tempRoot, 'missing') }
+  });
+
+  try {
+    const failed = await worker.extract({
+      pdfPath: path.join(tempRoot, 'a.pdf'),
+      outPath: path.join(tempRoot, 'missing-dir', 'a.json')
+    });
+    assert.equal(failed.ok, false);
+    assert.match(failed.error, /job_failed/);
+  } finally {
+    await worker.close();
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+});
@@ -60,6 +60,37 @@ test('pdf pair normalizer emits stable path/surface and split helper separates k
   assert.equal(String(split.tablePairs[0].path).includes('table[p2_t1]'), true);
 });
 
+test('pdf pair normalizer keeps parsed quantities from the python extractor', () => {
+  const range = normalizePdfPair(
+    {
+      key: 'DPI',
+      value: '100-26000 cpi',
+      surface: 'pdf_kv',
+      numeric_value: null,
+      numeric_min: 100,
+      numeric_max: 26000,
+      canonical_unit: 'dpi'
+    },
+    { backend: 'pymupdf', rowIndex: 0 }
+  );
+  const plain = normalizePdfPair({ key: 'Sensor', value: 'PAW3395', surface: 'pdf_kv' }, { backend: 'pymupdf', rowIndex: 1 });
+  assert.equal(range.numeric_value, null);
+  assert.equal(range.numeric_min, 100);
+  assert.equal(range.numeric_max, 26000);
+  assert.equal(range.canonical_unit, 'dpi');
+  assert.equal('numeric_min' in plain, false);
+});
+
+test('pdf pair normalizer keeps lexicon field candidates from the python extractor', () => {
+  const tagged = normalizePdfPair(
+    { key: 'Weight', value: '54 g', surface: 'pdf_kv', field_candidates: ['weight', 'adjustable_weight'] },
+    { backend: 'pymupdf', rowIndex: 0 }
+  );
+  const untagged = normalizePdfPair({ key: 'Weight', value: '54 g', surface: 'pdf_kv' }, { backend: 'pymupdf', rowIndex: 1 });
+  assert.deepEqual(tagged.field_candidates, ['weight', 'adjustable_weight']);
+  assert.equal('field_candidates' in untagged, false);
+});
+
 test('pdf summary reports backend and pair totals', () => {
   const summary = summarizePdfDoc({
     backend_selected: 'pdfplumber',
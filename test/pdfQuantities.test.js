@@ -0,0 +1,62 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+import { writeFakePdfplumber } from './helpers/fakePdfplumber.js';
+
+const execFileAsync = promisify(execFile);
+const scriptPath = path.resolve('scripts', 'extract_pdf_kv.py');
+
+async function extractSpecList(rows) {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-quantity-'));
+  try {
+    const { modulesRoot, pdfPath } = await writeFakePdfplumber(tempRoot, {
+      text: 'Specifications',
+      tables: [rows]
+    });
+    const outPath = path.join(tempRoot, 'out.json');
+    await execFileAsync('python', [
+      scriptPath, '--pdf', pdfPath, '--out', outPath, '--backend', 'pdfplumber', '--cache-dir', ''
+    ], { env: { ...process.env, PYTHONPATH: modulesRoot } });
+    const payload = JSON.parse(await fs.readFile(outPath, 'utf8'));
+    return new Map(payload.table_pairs.map((pair) => [pair.key, pair]));
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+}
+
+function quantity(pair) {
+  return [pair.numeric_value, pair.numeric_min, pair.numeric_max, pair.canonical_unit];
+}
+
+test('known units become canonical quantities', async () => {
+  const pairs = await extractSpecList([
+    ['Weight', '54 g'],
+    ['Polling rate', '1 - 8 kHz'],
+    ['Battery life', '90 min'],
+    ['Max acceleration', '50 G'],
+    ['Resolution', '26,000 DPI']
+  ]);
+  assert.deepEqual(quantity(pairs.get('Weight')), [54, 54, 54, 'g']);
+  assert.deepEqual(quantity(pairs.get('Polling rate')), [null, 1000, 8000, 'hz']);
+  assert.deepEqual(quantity(pairs.get('Battery life')), [1.5, 1.5, 1.5, 'h']);
+  assert.deepEqual(quantity(pairs.get('Max acceleration')), [50, 50, 50, 'g_force']);
+  assert.deepEqual(quantity(pairs.get('Resolution')), [26000, 26000, 26000, 'dpi']);
+});
+
+test('numbers followed by an unknown unit or a count noun carry no quantity', async () => {
+  const pairs = await extractSpecList([
+    ['Programmable', '5 buttons'],
+    ['Cable length', '2 furlongs'],
+    ['Dimensions', '127 x 64 x 40 mm'],
+    ['Switches', '90 million clicks']
+  ]);
+  for (const key of ['Programmable', 'Cable length', 'Dimensions', 'Switches']) {
+    const pair = pairs.get(key);
+    assert.ok(pair, `missing pair ${key}`);
+    assert.deepEqual(quantity(pair), [null, null, null, null], key);
+  }
+});
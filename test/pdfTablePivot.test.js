@@ -0,0 +1,70 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+import { writeFakePdfplumber } from './helpers/fakePdfplumber.js';
+
+const execFileAsync = promisify(execFile);
+const scriptPath = path.resolve('scripts', 'extract_pdf_kv.py');
+
+const COMPARISON_TABLE = [
+  ['', 'Viper V3 Pro', 'Viper V3 HyperSpeed'],
+  ['Weight', '54 g', '82 g'],
+  ['Sensor', 'Focus Pro 35K', 'Focus X 26K'],
+  ['Buttons', '6', '6']
+];
+
+async function extractTables(tables, extraArgs = []) {
+  const tempRoot = await fs.mkdtemp(path.join(os.tmpdir(), 'spec-harvester-pdf-pivot-'));
+  try {
+    const { modulesRoot, pdfPath } = await writeFakePdfplumber(tempRoot, { text: 'Specifications', tables });
+    const outPath = path.join(tempRoot, 'out.json');
+    await execFileAsync('python', [
+      scriptPath, '--pdf', pdfPath, '--out', outPath, '--backend', 'pdfplumber', '--cache-dir', '', ...extraArgs
+    ], { env: { ...process.env, PYTHONPATH: modulesRoot } });
+    return JSON.parse(await fs.readFile(outPath, 'utf8'));
+  } finally {
+    await fs.rm(tempRoot, { recursive: true, force: true });
+  }
+}
+
+function pairRows(payload) {
+  return payload.table_pairs.map((pair) => [pair.key, pair.value, pair.column_header || '']);
+}
+
+test('comparison tables pivot into one pair per row and model column', async () => {
+  const payload = await extractTables([COMPARISON_TABLE]);
+  assert.equal(payload.ok, true);
+  // Equal values under different models ("Buttons 6") are distinct pairs, not duplicates.
+  assert.deepEqual(pairRows(payload), [
+    ['Weight', '54 g', 'Viper V3 Pro'],
+    ['Weight', '82 g', 'Viper V3 HyperSpeed'],
+    ['Sensor', 'Focus Pro 35K', 'Viper V3 Pro'],
+    ['Sensor', 'Focus X 26K', 'Viper V3 HyperSpeed'],
+    ['Buttons', '6', 'Viper V3 Pro'],
+    ['Buttons', '6', 'Viper V3 HyperSpeed']
+  ]);
+});
+
+test('--table-pivot 0 keeps the joined row values', async () => {
+  const payload = await extractTables([COMPARISON_TABLE], ['--table-pivot', '0']);
+  assert.deepEqual(
+    pairRows(payload).filter(([key]) => key === 'Weight'),
+    [['Weight', '54 g | 82 g', '']]
+  );
+});
+
+test('spec lists without a model header row are not pivoted', async () => {
+  const payload = await extractTables([[
+    ['Specification', 'Value'],
+    ['Weight', '54 g'],
+    ['Sensor', 'Focus Pro 35K']
+  ]]);
+  assert.deepEqual(
+    pairRows(payload).filter(([key]) => key !== 'Specification'),
+    [['Weight', '54 g', ''], ['Sensor', 'Focus Pro 35K', '']]
+  );
+});